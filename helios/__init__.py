@@ -14,6 +14,7 @@ from helios.core.types import (
     HeliosResult,
     SectorFeatureSet,
     SectorResult,
+    SectorResultArray,
 )
 
 __all__ = [
@@ -22,5 +23,6 @@ __all__ = [
     "HeliosResult",
     "SectorFeatureSet",
     "SectorResult",
+    "SectorResultArray",
     "__version__",
 ]
@@ -26,6 +26,7 @@ from helios.core.types import (
     HeliosResult,
     SectorFeatureSet,
     SectorResult,
+    SectorResultArray,
 )
 
 __all__ = [
@@ -48,6 +49,7 @@ __all__ = [
     "STATE_THRESHOLDS",
     "SectorFeatureSet",
     "SectorResult",
+    "SectorResultArray",
     "Settings",
     "WEIGHTS",
     "get_settings",
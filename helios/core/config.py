@@ -1,71 +1,117 @@
 """
 Configuration management for HELIOS ETF FLOW.
 
-Provides Pydantic settings for environment variables and
+Provides environment-backed settings and
 YAML configuration loaders for API sources, normalization,
 and state definitions.
 """
 
 import logging
+import os
+from dataclasses import dataclass, field
 from functools import lru_cache
 from pathlib import Path
 from typing import Any
 
 import yaml
-from pydantic import Field
-from pydantic_settings import BaseSettings, SettingsConfigDict
+from dotenv import dotenv_values
 
 from helios.core.exceptions import ConfigurationError
 
 logger = logging.getLogger(__name__)
 
+# Prefer the LibYAML-backed loader; fall back to pure Python if unavailable
+_Loader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+# Parsed YAML configs keyed by resolved path -> (st_mtime_ns, st_size, data)
+_YAML_CACHE: dict[str, tuple[int, int, dict[str, Any]]] = {}
 
-class Settings(BaseSettings):
-    """Application settings loaded from environment variables."""
 
-    model_config = SettingsConfigDict(
-        env_file=".env",
-        env_file_encoding="utf-8",
-        extra="ignore",
-    )
+@dataclass(frozen=True, slots=True)
+class Settings:
+    """Application settings loaded from environment variables."""
 
     # API keys
-    polygon_key: str = Field(..., validation_alias="POLYGON_KEY")
-    fmp_key: str = Field(default="", validation_alias="FMP_KEY")
-    uw_api_key: str = Field(default="", validation_alias="UW_API_KEY")
+    polygon_key: str
+    fmp_key: str = ""
+    uw_api_key: str = ""
 
     # Paths
-    data_dir: Path = Field(default=Path("data"))
-    config_dir: Path = Field(default=Path("config"))
+    data_dir: Path = Path("data")
+    config_dir: Path = Path("config")
 
     # Logging
-    log_level: str = Field(default="INFO")
+    log_level: str = "INFO"
+
+    # Derived data directories, created once at construction
+    _raw_data_dir: Path = field(init=False, repr=False, compare=False)
+    _processed_data_dir: Path = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        raw = self.data_dir / "raw"
+        processed = self.data_dir / "processed"
+        raw.mkdir(parents=True, exist_ok=True)
+        processed.mkdir(parents=True, exist_ok=True)
+        object.__setattr__(self, "_raw_data_dir", raw)
+        object.__setattr__(self, "_processed_data_dir", processed)
+
+    @classmethod
+    def from_env(cls, env_file: Path | str = ".env") -> "Settings":
+        """
+        Build settings from the process environment and an optional .env file.
+
+        Process environment variables take precedence over .env values.
+
+        Args:
+            env_file: Path to the .env file (ignored if it does not exist)
+
+        Returns:
+            Settings instance
+
+        Raises:
+            ConfigurationError: If POLYGON_KEY is not set
+        """
+        env = {k: v for k, v in dotenv_values(env_file).items() if v is not None}
+        env.update(os.environ)
+
+        polygon_key = env.get("POLYGON_KEY")
+        if not polygon_key:
+            raise ConfigurationError("POLYGON_KEY is not set")
+
+        return cls(
+            polygon_key=polygon_key,
+            fmp_key=env.get("FMP_KEY", ""),
+            uw_api_key=env.get("UW_API_KEY", ""),
+            data_dir=Path(env.get("DATA_DIR", "data")),
+            config_dir=Path(env.get("CONFIG_DIR", "config")),
+            log_level=env.get("LOG_LEVEL", "INFO"),
+        )
 
     @property
     def raw_data_dir(self) -> Path:
         """Directory for raw API cache data."""
-        path = self.data_dir / "raw"
-        path.mkdir(parents=True, exist_ok=True)
-        return path
+        return self._raw_data_dir
 
     @property
     def processed_data_dir(self) -> Path:
         """Directory for processed output data."""
-        path = self.data_dir / "processed"
-        path.mkdir(parents=True, exist_ok=True)
-        return path
+        return self._processed_data_dir
 
 
 @lru_cache(maxsize=1)
 def get_settings() -> Settings:
     """Get cached application settings."""
-    return Settings()  # type: ignore[call-arg]
+    return Settings.from_env()
 
 
 def load_yaml_config(config_path: Path) -> dict[str, Any]:
     """
     Load a YAML configuration file.
 
+    Parsed results are cached per resolved path and invalidated when the
+    file's mtime or size changes. The returned dict is shared between
+    callers and must be treated as read-only.
+
     Args:
         config_path: Path to YAML file
 
@@ -75,18 +121,26 @@ def load_yaml_config(config_path: Path) -> dict[str, Any]:
     Raises:
         ConfigurationError: If file not found or invalid YAML
     """
-    if not config_path.exists():
-        raise ConfigurationError(f"Config file not found: {config_path}")
+    try:
+        st = os.stat(config_path)
+    except FileNotFoundError:
+        raise ConfigurationError(f"Config file not found: {config_path}") from None
+
+    key = str(config_path.resolve())
+    cached = _YAML_CACHE.get(key)
+    if cached is not None and cached[0] == st.st_mtime_ns and cached[1] == st.st_size:
+        return cached[2]
 
     try:
         with open(config_path, encoding="utf-8") as f:
-            data = yaml.safe_load(f)
-        if data is None:
-            return {}
-        return dict(data)
+            data = yaml.load(f, Loader=_Loader)
     except yaml.YAMLError as e:
         raise ConfigurationError(f"Invalid YAML in {config_path}: {e}") from e
 
+    result = {} if data is None else dict(data)
+    _YAML_CACHE[key] = (st.st_mtime_ns, st.st_size, result)
+    return result
+
 
 class SourcesConfig:
     """API source configuration loaded from settings.yaml."""
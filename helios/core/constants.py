@@ -7,6 +7,9 @@ They represent conceptual design choices, not fitted parameters.
 HELIOS describes allocation, not direction.
 """
 
+import sys
+from collections.abc import Mapping
+from types import MappingProxyType
 from typing import Final
 
 # =============================================================================
@@ -15,10 +18,10 @@ from typing import Final
 # These weights are conceptual allocations, NOT optimized parameters.
 # Do not tune these values.
 
-WEIGHTS: Final[dict[str, float]] = {
+WEIGHTS: Final[Mapping[str, float]] = MappingProxyType({
     "AP": 0.60,  # Allocation Pressure (z-score of net fund flow)
     "RS": 0.40,  # Relative Strength (z-score of excess return vs SPY)
-}
+})
 
 # Verify weights sum to 1.0
 assert abs(sum(WEIGHTS.values()) - 1.0) < 1e-9, "Weights must sum to 1.0"
@@ -36,20 +39,21 @@ MIN_OBSERVATIONS: Final[int] = 21  # Minimum for valid baseline (~1 month)
 # CAS -> AllocationState mapping (operates in z-score space, NOT percentile)
 # These describe WHERE capital is flowing, NOT whether to trade.
 
-STATE_THRESHOLDS: Final[dict[str, tuple[float, float]]] = {
+STATE_THRESHOLDS: Final[Mapping[str, tuple[float, float]]] = MappingProxyType({
     "OVERWEIGHT": (1.0, float("inf")),  # CAS > +1.0σ
     "ACCUMULATING": (0.3, 1.0),  # +0.3 to +1.0
     "NEUTRAL": (-0.3, 0.3),  # -0.3 to +0.3
     "DECREASING": (-1.0, -0.3),  # -1.0 to -0.3
     "UNDERWEIGHT": (float("-inf"), -1.0),  # CAS < -1.0σ
-}
+})
 
 # =============================================================================
 # UNIVERSE (FROZEN)
 # =============================================================================
 # Fixed set of sector ETFs. No dynamic universe construction.
+# Tickers are interned so lookups keyed by them can match on identity.
 
-SECTOR_UNIVERSE: Final[tuple[str, ...]] = (
+SECTOR_UNIVERSE: Final[tuple[str, ...]] = tuple(sys.intern(t) for t in (
     "XLY",  # Consumer Discretionary
     "XLI",  # Industrials
     "XLF",  # Financials
@@ -61,15 +65,15 @@ SECTOR_UNIVERSE: Final[tuple[str, ...]] = (
     "XLB",  # Materials
     "XLRE",  # Real Estate
     "AGG",  # Aggregate Bond
-)
+))
 
-BENCHMARK_TICKER: Final[str] = "SPY"
+BENCHMARK_TICKER: Final[str] = sys.intern("SPY")
 
 # =============================================================================
 # SECTOR DISPLAY NAMES
 # =============================================================================
 
-SECTOR_NAMES: Final[dict[str, str]] = {
+SECTOR_NAMES: Final[Mapping[str, str]] = MappingProxyType({sys.intern(k): v for k, v in {
     "XLY": "Consumer Discretionary",
     "XLI": "Industrials",
     "XLF": "Financials",
@@ -81,7 +85,7 @@ SECTOR_NAMES: Final[dict[str, str]] = {
     "XLB": "Materials",
     "XLRE": "Real Estate",
     "AGG": "Aggregate Bond",
-}
+}.items()})
 
 # =============================================================================
 # FEATURE NAMES
@@ -4,10 +4,14 @@ Core type definitions for HELIOS ETF FLOW.
 Defines enums, dataclasses, and type aliases for the sector allocation system.
 """
 
+import sys
+from collections.abc import Iterator, Sequence
 from dataclasses import dataclass, field
 from datetime import date
 from enum import StrEnum
-from typing import TypeAlias
+from typing import Any, TypeAlias
+
+import numpy as np
 
 
 class AllocationState(StrEnum):
@@ -54,17 +58,84 @@ class AllocationState(StrEnum):
         else:
             return cls.UNDERWEIGHT
 
+    @classmethod
+    def from_cas_array(cls, cas: np.ndarray) -> np.ndarray:
+        """
+        Classify an array of CAS values in one vectorized pass.
+
+        Matches from_cas boundaries: the lower thresholds are inclusive
+        from above (>= -1.0, >= -0.3), the upper ones exclusive (> 0.3, > 1.0).
+
+        Args:
+            cas: Array of Composite Allocation Scores
+
+        Returns:
+            Object array of AllocationState values, same shape as input
+        """
+        return _STATES_BY_INDEX[cls.codes_from_cas_array(cas)]
+
+    @classmethod
+    def codes_from_cas_array(cls, cas: np.ndarray) -> np.ndarray:
+        """
+        Classify an array of CAS values into integer state codes.
+
+        Codes run 0 (UNDERWEIGHT) to 4 (OVERWEIGHT); see from_code. NaN
+        fails every comparison in from_cas, so it maps to UNDERWEIGHT here too.
+
+        Args:
+            cas: Array of Composite Allocation Scores
+
+        Returns:
+            int8 array of state codes, same shape as input
+        """
+        cas = np.asarray(cas, dtype=np.float64)
+        codes = np.searchsorted(_LOWER_THRESHOLDS, cas, side="right") + np.searchsorted(
+            _UPPER_THRESHOLDS, cas, side="left"
+        )
+        codes = codes.astype(np.int8)
+        codes[np.isnan(cas)] = 0
+        return codes
+
+    @classmethod
+    def from_code(cls, code: int) -> "AllocationState":
+        """State for an integer code (0 = UNDERWEIGHT ... 4 = OVERWEIGHT)."""
+        return _STATES_BY_INDEX[code]
+
+    @property
+    def code(self) -> int:
+        """Integer code of the state (0 = UNDERWEIGHT ... 4 = OVERWEIGHT)."""
+        return _STATE_CODES[self]
+
     @property
     def description(self) -> str:
         """Human-readable description of the state."""
-        descriptions = {
-            AllocationState.OVERWEIGHT: "Strong positive allocation pressure",
-            AllocationState.ACCUMULATING: "Building allocation pressure",
-            AllocationState.NEUTRAL: "Balanced allocation",
-            AllocationState.DECREASING: "Declining allocation pressure",
-            AllocationState.UNDERWEIGHT: "Strong negative allocation pressure",
-        }
-        return descriptions[self]
+        return _DESCRIPTIONS[self]
+
+
+_DESCRIPTIONS: dict[AllocationState, str] = {
+    AllocationState.OVERWEIGHT: "Strong positive allocation pressure",
+    AllocationState.ACCUMULATING: "Building allocation pressure",
+    AllocationState.NEUTRAL: "Balanced allocation",
+    AllocationState.DECREASING: "Declining allocation pressure",
+    AllocationState.UNDERWEIGHT: "Strong negative allocation pressure",
+}
+
+# Sorted CAS thresholds split by boundary inclusivity (see from_cas)
+_LOWER_THRESHOLDS = np.array([-1.0, -0.3])
+_UPPER_THRESHOLDS = np.array([0.3, 1.0])
+_STATES_BY_INDEX = np.array(
+    [
+        AllocationState.UNDERWEIGHT,
+        AllocationState.DECREASING,
+        AllocationState.NEUTRAL,
+        AllocationState.ACCUMULATING,
+        AllocationState.OVERWEIGHT,
+    ],
+    dtype=object,
+)
+_STATE_CODES: dict[AllocationState, int] = {
+    state: code for code, state in enumerate(_STATES_BY_INDEX)
+}
 
 
 class BaselineStatus(StrEnum):
@@ -80,7 +151,7 @@ class BaselineStatus(StrEnum):
     INSUFFICIENT = "INSUFFICIENT"  # Critical features missing, cannot compute
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class SectorResult:
     """
     Result for a single sector ETF on a single day.
@@ -102,22 +173,43 @@ class SectorResult:
     ap_raw: float  # Raw net flow value
     rs_raw: float  # Raw excess return value
     status: BaselineStatus  # Baseline completeness
+    _cached_dict: dict[str, Any] | None = field(
+        default=None, init=False, repr=False, compare=False
+    )
 
-    def to_dict(self) -> dict:
-        """Convert to dictionary matching spec output format."""
-        return {
-            "allocation_score": round(self.allocation_score, 2),
-            "state": self.state.value,
-            "explanation": self.explanation,
-            "ap_zscore": round(self.ap_zscore, 2),
-            "rs_zscore": round(self.rs_zscore, 2),
-            "ap_raw": round(self.ap_raw, 4),
-            "rs_raw": round(self.rs_raw, 6),
-            "status": self.status.value,
-        }
+    def __post_init__(self) -> None:
+        """Intern the ticker so ticker-keyed lookups can match on identity."""
+        object.__setattr__(self, "ticker", sys.intern(self.ticker))
 
+    @property
+    def state_code(self) -> int:
+        """Integer code of the allocation state (see AllocationState.code)."""
+        return _STATE_CODES[self.state]
 
-@dataclass(frozen=True)
+    def to_dict(self) -> dict[str, Any]:
+        """
+        Convert to dictionary matching spec output format.
+
+        The values are built once and cached on the (immutable) instance;
+        each call returns a fresh copy, so callers may mutate it freely.
+        """
+        cached = self._cached_dict
+        if cached is None:
+            cached = {
+                "allocation_score": round(self.allocation_score, 2),
+                "state": self.state.value,
+                "explanation": self.explanation,
+                "ap_zscore": round(self.ap_zscore, 2),
+                "rs_zscore": round(self.rs_zscore, 2),
+                "ap_raw": round(self.ap_raw, 4),
+                "rs_raw": round(self.rs_raw, 6),
+                "status": self.status.value,
+            }
+            object.__setattr__(self, "_cached_dict", cached)
+        return cached.copy()
+
+
+@dataclass(frozen=True, slots=True)
 class HeliosResult:
     """
     Complete HELIOS result for a single day (all sectors).
@@ -128,37 +220,129 @@ class HeliosResult:
     trade_date: date
     sectors: tuple[SectorResult, ...]
     status: BaselineStatus  # Overall baseline status
-
-    def to_dict(self) -> dict:
-        """Convert to dictionary matching spec output format."""
-        result: dict = {"date": self.trade_date.isoformat()}
+    _cached_dict: dict[str, Any] | None = field(
+        default=None, init=False, repr=False, compare=False
+    )
+    _by_state: dict[int, tuple[SectorResult, ...]] = field(
+        init=False, repr=False, compare=False
+    )
+    _by_ticker: dict[str, SectorResult] | None = field(
+        default=None, init=False, repr=False, compare=False
+    )
+
+    def __post_init__(self) -> None:
+        """Group sectors by state code in a single pass."""
+        buckets: dict[int, list[SectorResult]] = {}
         for sector in self.sectors:
-            result[sector.ticker] = {
-                "allocation_score": round(sector.allocation_score, 2),
-                "state": sector.state.value,
-                "explanation": sector.explanation,
-            }
-        return result
+            buckets.setdefault(sector.state_code, []).append(sector)
+        object.__setattr__(
+            self, "_by_state", {state: tuple(group) for state, group in buckets.items()}
+        )
+
+    def to_dict(self) -> dict[str, Any]:
+        """
+        Convert to dictionary matching spec output format.
+
+        Cached like SectorResult.to_dict; the per-sector dicts are copied too.
+        """
+        cached = self._cached_dict
+        if cached is None:
+            cached = {"date": self.trade_date.isoformat()}
+            for sector in self.sectors:
+                cached[sector.ticker] = {
+                    "allocation_score": round(sector.allocation_score, 2),
+                    "state": sector.state.value,
+                    "explanation": sector.explanation,
+                }
+            object.__setattr__(self, "_cached_dict", cached)
+        return {
+            key: value.copy() if isinstance(value, dict) else value
+            for key, value in cached.items()
+        }
 
     def get_sector(self, ticker: str) -> SectorResult | None:
         """Get result for a specific sector."""
-        for sector in self.sectors:
-            if sector.ticker == ticker:
-                return sector
-        return None
+        by_ticker = self._by_ticker
+        if by_ticker is None:
+            # Reversed so the first sector wins on duplicate tickers
+            by_ticker = {s.ticker: s for s in reversed(self.sectors)}
+            object.__setattr__(self, "_by_ticker", by_ticker)
+        return by_ticker.get(ticker)
 
     @property
     def overweight_sectors(self) -> tuple[SectorResult, ...]:
         """Sectors in OVERWEIGHT state."""
-        return tuple(s for s in self.sectors if s.state == AllocationState.OVERWEIGHT)
+        return self._by_state.get(AllocationState.OVERWEIGHT.code, ())
 
     @property
     def underweight_sectors(self) -> tuple[SectorResult, ...]:
         """Sectors in UNDERWEIGHT state."""
-        return tuple(s for s in self.sectors if s.state == AllocationState.UNDERWEIGHT)
+        return self._by_state.get(AllocationState.UNDERWEIGHT.code, ())
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
+class SectorResultArray:
+    """
+    Columnar (struct-of-arrays) form of many SectorResults.
+
+    Holds one array per SectorResult field so bulk consumers can work on
+    whole columns. SectorResult objects are only built on item access.
+    """
+
+    tickers: np.ndarray  # str (object dtype)
+    scores: np.ndarray  # float64 CAS values
+    states: np.ndarray  # int8 state codes (see AllocationState.from_code)
+    explanations: np.ndarray  # str (object dtype)
+    ap_zscores: np.ndarray  # float64
+    rs_zscores: np.ndarray  # float64
+    ap_raw: np.ndarray  # float64
+    rs_raw: np.ndarray  # float64
+    statuses: np.ndarray  # BaselineStatus (object dtype)
+
+    @classmethod
+    def from_results(cls, results: Sequence[SectorResult]) -> "SectorResultArray":
+        """Build the columnar form from SectorResult objects."""
+        return cls(
+            tickers=np.array([r.ticker for r in results], dtype=object),
+            scores=np.array([r.allocation_score for r in results], dtype=np.float64),
+            states=np.array(
+                [_STATE_CODES[r.state] for r in results], dtype=np.int8
+            ),
+            explanations=np.array([r.explanation for r in results], dtype=object),
+            ap_zscores=np.array([r.ap_zscore for r in results], dtype=np.float64),
+            rs_zscores=np.array([r.rs_zscore for r in results], dtype=np.float64),
+            ap_raw=np.array([r.ap_raw for r in results], dtype=np.float64),
+            rs_raw=np.array([r.rs_raw for r in results], dtype=np.float64),
+            statuses=np.array([r.status for r in results], dtype=object),
+        )
+
+    def __len__(self) -> int:
+        return len(self.tickers)
+
+    def __getitem__(self, i: int) -> SectorResult:
+        """Materialize a single SectorResult."""
+        return SectorResult(
+            ticker=str(self.tickers[i]),
+            allocation_score=float(self.scores[i]),
+            state=_STATES_BY_INDEX[self.states[i]],
+            explanation=str(self.explanations[i]),
+            ap_zscore=float(self.ap_zscores[i]),
+            rs_zscore=float(self.rs_zscores[i]),
+            ap_raw=float(self.ap_raw[i]),
+            rs_raw=float(self.rs_raw[i]),
+            status=BaselineStatus(self.statuses[i]),
+        )
+
+    def __iter__(self) -> Iterator[SectorResult]:
+        for i in range(len(self)):
+            yield self[i]
+
+    def indices_in_state(self, state: AllocationState) -> np.ndarray:
+        """Positions of sectors in the given state (integer code compare)."""
+        return np.flatnonzero(self.states == _STATE_CODES[state])
+
+
+@dataclass(slots=True)
 class SectorFeatureSet:
     """
     Raw and computed features for a single sector ETF.
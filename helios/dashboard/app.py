@@ -7,13 +7,19 @@ Usage:
     uv run streamlit run helios/dashboard/app.py --server.port 8504
 """
 
-from collections import Counter
 from pathlib import Path
 
+import numpy as np
 import pandas as pd
+import pyarrow.parquet as pq
 import streamlit as st
 
-from helios.core.types import AllocationState, HeliosResult
+from helios.core.types import (
+    AllocationState,
+    BaselineStatus,
+    HeliosResult,
+    SectorResultArray,
+)
 from helios.dashboard.components.allocation_card import render_allocation_card
 from helios.dashboard.components.historical_chart import render_historical_chart
 from helios.dashboard.components.sector_heatmap import STATE_COLORS, render_sector_heatmap
@@ -56,62 +62,99 @@ with st.sidebar:
     st.caption("RS: Relative Strength (vs SPY)")
 
 
-def load_latest_result() -> tuple[HeliosResult | None, pd.DataFrame]:
-    """Load the latest HELIOS result and history."""
+# History columns used by the dashboard (projection for parquet reads)
+_HISTORY_COLUMNS = (
+    "date",
+    "ticker",
+    "allocation_score",
+    "state",
+    "explanation",
+    "ap_zscore",
+    "rs_zscore",
+    "ap_raw",
+    "rs_raw",
+    "status",
+)
+
+
+def _column(df: pd.DataFrame, name: str, default: object, dtype: type) -> np.ndarray:
+    """Column values as an array, or a constant array if the column is absent."""
+    if name in df.columns:
+        return df[name].to_numpy(dtype=dtype)
+    return np.full(len(df), default, dtype=dtype)
+
+
+def load_latest_result() -> tuple[HeliosResult | None, SectorResultArray | None, pd.DataFrame]:
+    """Load the latest HELIOS result (plus its columnar form) and history."""
     data_dir = Path("data/processed/helios")
     history_file = data_dir / "helios_history.parquet"
 
     history_df = pd.DataFrame()
     latest_result = None
+    sector_array = None
 
     if history_file.exists():
-        history_df = pd.read_parquet(history_file)
-        history_df["date"] = pd.to_datetime(history_df["date"]).dt.date
+        available = set(pq.read_schema(history_file).names)
+        history_df = pd.read_parquet(
+            history_file,
+            columns=[c for c in _HISTORY_COLUMNS if c in available],
+            dtype_backend="pyarrow",
+        )
+        history_df["date"] = pd.to_datetime(history_df["date"])
 
         # Reconstruct latest HeliosResult from most recent date
         if not history_df.empty:
             latest_date = history_df["date"].max()
-            latest_df = history_df[history_df["date"] == latest_date]
-
-            from helios.core.types import BaselineStatus, SectorResult
-
-            sectors = []
-            for _, row in latest_df.iterrows():
-                sectors.append(SectorResult(
-                    ticker=row["ticker"],
-                    allocation_score=row["allocation_score"],
-                    state=AllocationState(row["state"]),
-                    explanation=row.get("explanation", ""),
-                    ap_zscore=row.get("ap_zscore", 0.0),
-                    rs_zscore=row.get("rs_zscore", 0.0),
-                    ap_raw=row.get("ap_raw", 0.0),
-                    rs_raw=row.get("rs_raw", 0.0),
-                    status=BaselineStatus(row.get("status", "COMPLETE")),
-                ))
-
-            overall_status = BaselineStatus.COMPLETE
-            statuses = [s.status for s in sectors]
-            if any(s == BaselineStatus.PARTIAL for s in statuses):
-                overall_status = BaselineStatus.PARTIAL
-            if all(s == BaselineStatus.INSUFFICIENT for s in statuses):
+            latest_df = history_df[history_df["date"].eq(latest_date)]
+
+            scores = latest_df["allocation_score"].to_numpy(dtype=np.float64)
+            # Persisted states win; re-derive from CAS only for files without them
+            if "state" in latest_df.columns:
+                states = np.array(
+                    [AllocationState(v).code for v in latest_df["state"].to_numpy(dtype=object)],
+                    dtype=np.int8,
+                )
+            else:
+                states = AllocationState.codes_from_cas_array(scores)
+            sector_array = SectorResultArray(
+                tickers=latest_df["ticker"].to_numpy(dtype=object),
+                scores=scores,
+                states=states,
+                explanations=_column(latest_df, "explanation", "", object),
+                ap_zscores=_column(latest_df, "ap_zscore", 0.0, np.float64),
+                rs_zscores=_column(latest_df, "rs_zscore", 0.0, np.float64),
+                ap_raw=_column(latest_df, "ap_raw", 0.0, np.float64),
+                rs_raw=_column(latest_df, "rs_raw", 0.0, np.float64),
+                statuses=_column(latest_df, "status", "COMPLETE", object),
+            )
+
+            status_set = {BaselineStatus(v) for v in np.unique(sector_array.statuses)}
+            if status_set == {BaselineStatus.INSUFFICIENT}:
                 overall_status = BaselineStatus.INSUFFICIENT
+            elif (
+                BaselineStatus.PARTIAL in status_set
+                or BaselineStatus.INSUFFICIENT in status_set
+            ):
+                overall_status = BaselineStatus.PARTIAL
+            else:
+                overall_status = BaselineStatus.COMPLETE
 
             latest_result = HeliosResult(
-                trade_date=latest_date,
-                sectors=tuple(sectors),
+                trade_date=latest_date.date(),
+                sectors=tuple(sector_array),
                 status=overall_status,
             )
 
-    return latest_result, history_df
+    return latest_result, sector_array, history_df
 
 
 # Main content
 st.title("HELIOS ETF FLOW")
 st.caption("Sector Capital Allocation Diagnostic")
 
-result, history_df = load_latest_result()
+result, sector_array, history_df = load_latest_result()
 
-if result is None:
+if result is None or sector_array is None:
     st.warning("No HELIOS data available. Run the daily pipeline first:")
     st.code("uv run python scripts/run_daily.py")
 else:
@@ -122,9 +165,9 @@ else:
     with col2:
         st.metric("Status", result.status.value)
     with col3:
-        st.metric("Overweight", len(result.overweight_sectors))
+        st.metric("Overweight", len(sector_array.indices_in_state(AllocationState.OVERWEIGHT)))
     with col4:
-        st.metric("Underweight", len(result.underweight_sectors))
+        st.metric("Underweight", len(sector_array.indices_in_state(AllocationState.UNDERWEIGHT)))
 
     st.divider()
 
@@ -145,15 +188,14 @@ else:
 
     # State distribution
     st.subheader("State Distribution")
-    state_counts = Counter(s.state.value for s in result.sectors)
-    dist_df = pd.DataFrame(
-        [{"State": k, "Count": v} for k, v in sorted(state_counts.items())]
-    )
-    st.bar_chart(dist_df.set_index("State"))
+    codes, counts = np.unique(sector_array.states, return_counts=True)
+    values = [AllocationState.from_code(int(c)).value for c in codes]
+    dist_df = pd.DataFrame({"Count": counts}, index=pd.Index(values, name="State"))
+    st.bar_chart(dist_df)
 
     # Raw data expander
     with st.expander("Raw Data"):
-        latest_df = history_df[history_df["date"] == result.trade_date]
+        latest_df = history_df[history_df["date"].eq(pd.Timestamp(result.trade_date))]
         st.dataframe(latest_df, use_container_width=True)
 
     # JSON output expander
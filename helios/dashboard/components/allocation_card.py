@@ -10,11 +10,19 @@ from helios.core.constants import SECTOR_NAMES
 from helios.core.types import SectorResult
 from helios.dashboard.components.sector_heatmap import STATE_COLORS
 
+# Colored state label HTML, one per state
+_STATE_BADGES: dict[str, str] = {
+    state: (
+        f'<span style="color: {color}; font-weight: bold; font-size: 20px;">'
+        f"{state}</span>"
+    )
+    for state, color in STATE_COLORS.items()
+}
+
 
 def render_allocation_card(sector: SectorResult) -> None:
     """Render detailed allocation card for a single sector."""
     name = SECTOR_NAMES.get(sector.ticker, sector.ticker)
-    color = STATE_COLORS.get(sector.state.value, "#6b7280")
 
     st.markdown(f"### {sector.ticker} - {name}")
 
@@ -27,11 +35,7 @@ def render_allocation_card(sector: SectorResult) -> None:
         )
 
     with col2:
-        st.markdown(
-            f'<span style="color: {color}; font-weight: bold; font-size: 20px;">'
-            f"{sector.state.value}</span>",
-            unsafe_allow_html=True,
-        )
+        st.markdown(_STATE_BADGES[sector.state.value], unsafe_allow_html=True)
 
     with col3:
         st.metric(label="Status", value=sector.status.value)
@@ -35,11 +35,11 @@ def render_historical_chart(history_df: pd.DataFrame) -> None:
                   annotation_text="UNDERWEIGHT", annotation_position="bottom right")
     fig.add_hline(y=0, line_dash="solid", line_color="gray", opacity=0.2)
 
-    # Add line per sector
-    for ticker in history_df["ticker"].unique():
-        sector_df = history_df[history_df["ticker"] == ticker].sort_values("date")
+    # Add line per sector (WebGL-rendered; one sort, one grouping pass)
+    ordered = history_df.sort_values("date", kind="stable")
+    for ticker, sector_df in ordered.groupby("ticker", sort=False):
         name = SECTOR_NAMES.get(ticker, ticker)
-        fig.add_trace(go.Scatter(
+        fig.add_trace(go.Scattergl(
             x=sector_df["date"],
             y=sector_df["allocation_score"],
             mode="lines",
@@ -4,6 +4,8 @@ Sector heatmap component for HELIOS dashboard.
 Displays a color-coded grid of sector allocation states.
 """
 
+from functools import lru_cache
+
 import streamlit as st
 
 from helios.core.constants import SECTOR_NAMES
@@ -18,36 +20,48 @@ STATE_COLORS: dict[str, str] = {
 }
 
 
+# Per-state card HTML with the color and state label baked in.
+# Placeholders: ticker, sector name, CAS. Kept on one line so the cards
+# can be concatenated into a single markdown block without being parsed
+# as indented code.
+_CARD_TEMPLATES: dict[str, str] = {
+    state: (
+        f'<div style="background-color: {color}; color: white; padding: 12px; '
+        'border-radius: 8px; margin: 4px 0; text-align: center;">'
+        '<div style="font-weight: bold; font-size: 14px;">%s</div>'
+        '<div style="font-size: 11px; opacity: 0.9;">%s</div>'
+        '<div style="font-size: 18px; font-weight: bold; margin: 4px 0;">%+.2f</div>'
+        f'<div style="font-size: 11px;">{state}</div>'
+        "</div>"
+    )
+    for state, color in STATE_COLORS.items()
+}
+
+_GRID_OPEN = (
+    '<div style="display: grid; grid-template-columns: repeat(4, 1fr); '
+    'column-gap: 16px;">'
+)
+_GRID_CLOSE = "</div>"
+
+
+@lru_cache(maxsize=256)
+def _heatmap_card_html(ticker: str, state: str, score_rounded: float) -> str:
+    """Card HTML for one sector, memoized across Streamlit reruns."""
+    name = SECTOR_NAMES.get(ticker, ticker)
+    return _CARD_TEMPLATES[state] % (ticker, name, score_rounded)
+
+
 def render_sector_heatmap(result: HeliosResult) -> None:
     """Render the sector allocation heatmap."""
     st.subheader("Sector Allocation Map")
 
-    # Create grid layout (4 columns)
-    cols = st.columns(4)
-
-    for i, sector in enumerate(result.sectors):
-        col = cols[i % 4]
-        color = STATE_COLORS.get(sector.state.value, "#6b7280")
-        name = SECTOR_NAMES.get(sector.ticker, sector.ticker)
-
-        with col:
-            st.markdown(
-                f"""
-                <div style="
-                    background-color: {color};
-                    color: white;
-                    padding: 12px;
-                    border-radius: 8px;
-                    margin: 4px 0;
-                    text-align: center;
-                ">
-                    <div style="font-weight: bold; font-size: 14px;">{sector.ticker}</div>
-                    <div style="font-size: 11px; opacity: 0.9;">{name}</div>
-                    <div style="font-size: 18px; font-weight: bold; margin: 4px 0;">
-                        {sector.allocation_score:+.2f}
-                    </div>
-                    <div style="font-size: 11px;">{sector.state.value}</div>
-                </div>
-                """,
-                unsafe_allow_html=True,
-            )
+    # Emit all cards as one CSS grid (4 columns) in a single markdown call
+    cards = "".join(
+        _heatmap_card_html(
+            sector.ticker,
+            sector.state.value,
+            round(sector.allocation_score, 2),
+        )
+        for sector in result.sectors
+    )
+    st.markdown(_GRID_OPEN + cards + _GRID_CLOSE, unsafe_allow_html=True)
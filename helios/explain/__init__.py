@@ -1,5 +1,5 @@
 """HELIOS ETF FLOW explanation layer."""
 
-from helios.explain.generator import ExplanationGenerator
+from helios.explain.generator import ExplanationGenerator, default_generator
 
-__all__ = ["ExplanationGenerator"]
+__all__ = ["ExplanationGenerator", "default_generator"]
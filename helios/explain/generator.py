@@ -13,6 +13,9 @@ from helios.explain.templates import DRIVER_TEMPLATES, STATE_TEMPLATES, STATUS_T
 
 logger = logging.getLogger(__name__)
 
+# Driver direction by index: (z > 0.5) + (z >= -0.5) -> 0, 1 or 2
+_DIRECTIONS = ("depressed", "neutral", "elevated")
+
 
 class ExplanationGenerator:
     """
@@ -25,6 +28,25 @@ class ExplanationGenerator:
     - Status notes
     """
 
+    __slots__ = ("_ap_fmt", "_ap_fmt_last", "_frames", "_rs_fmt")
+
+    def __init__(self) -> None:
+        # Templates are specialized once per instance: the headline and
+        # status note per (state, status) pair, and a %-format per driver
+        # direction with the closing period already fused in where needed.
+        self._frames: dict[tuple[AllocationState, BaselineStatus], tuple[str, str]] = {
+            (state, status): (
+                STATE_TEMPLATES.get(state) or state.description,
+                STATUS_TEMPLATES.get(status, ""),
+            )
+            for state in AllocationState
+            for status in BaselineStatus
+        }
+        ap, rs = DRIVER_TEMPLATES["AP"], DRIVER_TEMPLATES["RS"]
+        self._ap_fmt = tuple(f"{ap[d]} (%+.2f\u03c3)" for d in _DIRECTIONS)
+        self._ap_fmt_last = tuple(f"{ap[d]} (%+.2f\u03c3)." for d in _DIRECTIONS)
+        self._rs_fmt = tuple(f"{rs[d]} (%+.2f\u03c3)." for d in _DIRECTIONS)
+
     def generate(
         self,
         ticker: str,
@@ -48,29 +70,20 @@ class ExplanationGenerator:
         Returns:
             Human-readable explanation string
         """
-        parts: list[str] = []
+        headline, status_text = self._frames[state, status]
 
         # 1. State headline
-        state_text = STATE_TEMPLATES.get(state, state.description)
-        parts.append(state_text)
+        parts: list[str] = [headline]
 
-        # 2. Driver details
-        driver_parts: list[str] = []
+        # 2. Driver details (the closing period is fused into the last driver)
         if ap_zscore is not None:
-            direction = self._get_direction(ap_zscore)
-            template = DRIVER_TEMPLATES["AP"][direction]
-            driver_parts.append(f"{template} ({ap_zscore:+.2f}\u03c3)")
+            formats = self._ap_fmt if rs_zscore is not None else self._ap_fmt_last
+            parts.append(formats[(ap_zscore > 0.5) + (ap_zscore >= -0.5)] % ap_zscore)
 
         if rs_zscore is not None:
-            direction = self._get_direction(rs_zscore)
-            template = DRIVER_TEMPLATES["RS"][direction]
-            driver_parts.append(f"{template} ({rs_zscore:+.2f}\u03c3)")
-
-        if driver_parts:
-            parts.append(" ".join(driver_parts) + ".")
+            parts.append(self._rs_fmt[(rs_zscore > 0.5) + (rs_zscore >= -0.5)] % rs_zscore)
 
         # 3. Status notes
-        status_text = STATUS_TEMPLATES.get(status.value, "")
         if status_text:
             parts.append(status_text)
 
@@ -80,16 +93,6 @@ class ExplanationGenerator:
 
         return " ".join(parts)
 
-    @staticmethod
-    def _get_direction(zscore: float) -> str:
-        """Classify z-score into directional label."""
-        if zscore > 0.5:
-            return "elevated"
-        elif zscore < -0.5:
-            return "depressed"
-        else:
-            return "neutral"
-
     def format_summary(
         self,
         ticker: str,
@@ -109,3 +112,7 @@ class ExplanationGenerator:
         """
         sector_name = SECTOR_NAMES.get(ticker, ticker)
         return f"{sector_name} ({ticker}): {cas:+.2f} ({state.value})"
+
+
+# Shared instance; the generator holds only read-only template lookups
+default_generator = ExplanationGenerator()
@@ -8,10 +8,23 @@ GUARDRAIL: Explanations describe WHERE capital flows.
 They do NOT recommend actions.
 """
 
+import sys
+from collections.abc import Mapping
+from types import MappingProxyType
+from typing import Final, TypeVar
+
 from helios.core.types import AllocationState
 
+_K = TypeVar("_K")
+
+
+def _frozen(templates: dict[_K, str]) -> Mapping[_K, str]:
+    """Read-only view over templates with interned strings."""
+    return MappingProxyType({key: sys.intern(text) for key, text in templates.items()})
+
+
 # Per-state headline templates
-STATE_TEMPLATES: dict[AllocationState, str] = {
+STATE_TEMPLATES: Final[Mapping[AllocationState, str]] = _frozen({
     AllocationState.OVERWEIGHT: (
         "Strong positive net inflows and sustained outperformance versus SPY."
     ),
@@ -27,25 +40,25 @@ STATE_TEMPLATES: dict[AllocationState, str] = {
     AllocationState.UNDERWEIGHT: (
         "Significant net outflows and sustained underperformance versus SPY."
     ),
-}
+})
 
 # Per-driver directional templates
-DRIVER_TEMPLATES: dict[str, dict[str, str]] = {
-    "AP": {
+DRIVER_TEMPLATES: Final[Mapping[str, Mapping[str, str]]] = MappingProxyType({
+    "AP": _frozen({
         "elevated": "Strong net capital inflows detected",
         "depressed": "Significant net capital outflows detected",
         "neutral": "Capital flows are balanced",
-    },
-    "RS": {
+    }),
+    "RS": _frozen({
         "elevated": "Outperforming SPY on a relative basis",
         "depressed": "Underperforming SPY on a relative basis",
         "neutral": "Performance in line with SPY",
-    },
-}
+    }),
+})
 
 # Baseline status templates
-STATUS_TEMPLATES: dict[str, str] = {
+STATUS_TEMPLATES: Final[Mapping[str, str]] = _frozen({
     "COMPLETE": "",
     "PARTIAL": "Some features excluded due to insufficient baseline history.",
     "INSUFFICIENT": "Insufficient data for reliable calculation.",
-}
+})
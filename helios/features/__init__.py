@@ -1,6 +1,6 @@
 """HELIOS ETF FLOW feature calculators."""
 
-from helios.features.aggregator import FeatureAggregator
+from helios.features.aggregator import FeatureAggregator, default_aggregator
 from helios.features.allocation_pressure import AllocationPressure, APResult
 from helios.features.relative_strength import RelativeStrength, RSResult
 
@@ -10,4 +10,5 @@ __all__ = [
     "FeatureAggregator",
     "RSResult",
     "RelativeStrength",
+    "default_aggregator",
 ]
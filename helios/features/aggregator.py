@@ -5,22 +5,44 @@ Combines AP and RS calculations per sector into unified SectorFeatureSet.
 """
 
 import logging
+import math
+from collections.abc import Mapping
 from datetime import date
 
-from helios.core.constants import SECTOR_UNIVERSE
+import numpy as np
+
+from helios.core.constants import FEATURE_NAMES, SECTOR_UNIVERSE
 from helios.core.types import SectorFeatureSet
-from helios.features.allocation_pressure import AllocationPressure
-from helios.features.relative_strength import RelativeStrength
 
 logger = logging.getLogger(__name__)
 
+_N_SECTORS = len(SECTOR_UNIVERSE)
+
+
+def _sector_array(values: Mapping[str, float | None]) -> np.ndarray:
+    """Values in SECTOR_UNIVERSE order as float64, with missing entries as NaN."""
+    get = values.get
+    nan = np.nan
+    return np.fromiter(
+        (nan if (v := get(ticker)) is None else v for ticker in SECTOR_UNIVERSE),
+        dtype=np.float64,
+        count=_N_SECTORS,
+    )
+
+
+def _optional(value: float) -> float | None:
+    """Map NaN back to None at the SectorFeatureSet boundary."""
+    return None if math.isnan(value) else value
+
 
 class FeatureAggregator:
-    """Aggregates AP and RS features per sector ETF."""
+    """
+    Aggregates AP and RS features per sector ETF.
 
-    def __init__(self) -> None:
-        self.ap_calc = AllocationPressure()
-        self.rs_calc = RelativeStrength()
+    Stateless; share default_aggregator instead of creating instances.
+    """
+
+    __slots__ = ()
 
     def calculate_sector(
         self,
@@ -43,16 +65,19 @@ class FeatureAggregator:
         Returns:
             SectorFeatureSet with raw feature values
         """
-        ap_result = self.ap_calc.calculate(ticker, net_flow)
-        rs_result = self.rs_calc.calculate(ticker, etf_return, spy_return)
+        # AP passes the raw flow through; RS is the excess return vs SPY
+        if etf_return is None or spy_return is None:
+            excess_return = None
+        else:
+            excess_return = etf_return - spy_return
 
         return SectorFeatureSet(
             ticker=ticker,
             trade_date=trade_date,
-            net_flow=ap_result.net_flow,
-            etf_return=rs_result.etf_return,
-            spy_return=rs_result.spy_return,
-            excess_return=rs_result.excess_return,
+            net_flow=net_flow,
+            etf_return=etf_return,
+            spy_return=spy_return,
+            excess_return=excess_return,
         )
 
     def calculate_all(
@@ -74,25 +99,71 @@ class FeatureAggregator:
         Returns:
             {ticker: SectorFeatureSet} for all sectors
         """
-        results: dict[str, SectorFeatureSet] = {}
+        flows_arr = _sector_array(flows)
+        returns_arr = _sector_array(returns)
+        spy = np.nan if spy_return is None else spy_return
 
-        for ticker in SECTOR_UNIVERSE:
-            net_flow = flows.get(ticker)
-            etf_return = returns.get(ticker)
+        # NaN propagates, so excess is missing wherever either return is
+        excess_arr = returns_arr - spy
 
-            features = self.calculate_sector(
+        results: dict[str, SectorFeatureSet] = {}
+
+        for ticker, net_flow, etf_return, excess_return in zip(
+            SECTOR_UNIVERSE,
+            flows_arr.tolist(),
+            returns_arr.tolist(),
+            excess_arr.tolist(),
+            strict=True,
+        ):
+            features = SectorFeatureSet(
                 ticker=ticker,
                 trade_date=trade_date,
-                net_flow=net_flow,
-                etf_return=etf_return,
+                net_flow=_optional(net_flow),
+                etf_return=_optional(etf_return),
                 spy_return=spy_return,
+                excess_return=_optional(excess_return),
             )
             results[ticker] = features
 
             logger.debug(
-                f"{ticker}: flow={net_flow}, return={etf_return}, "
-                f"spy={spy_return}, excess={features.excess_return}"
+                "%s: flow=%s, return=%s, spy=%s, excess=%s",
+                ticker,
+                features.net_flow,
+                features.etf_return,
+                spy_return,
+                features.excess_return,
             )
 
         logger.info(f"Calculated features for {len(results)} sectors")
         return results
+
+    def calculate_matrix(
+        self,
+        flows: np.ndarray,
+        returns: np.ndarray,
+        spy_returns: np.ndarray,
+    ) -> np.ndarray:
+        """
+        Calculate raw features for many days in one array operation.
+
+        Same values as calculate_all, without building a SectorFeatureSet
+        per (day, sector); NaN marks a missing input or feature.
+
+        Args:
+            flows: (days, sectors) net flows in dollars
+            returns: (days, sectors) ETF returns
+            spy_returns: (days,) SPY returns
+
+        Returns:
+            (days, sectors, features) array, features in FEATURE_NAMES order
+        """
+        flows = np.asarray(flows, dtype=np.float64)
+        returns = np.asarray(returns, dtype=np.float64)
+        spy = np.asarray(spy_returns, dtype=np.float64)
+
+        columns = {"AP": flows, "RS": returns - spy[..., None]}
+        return np.stack([columns[name] for name in FEATURE_NAMES], axis=-1)
+
+
+# Shared stateless instance
+default_aggregator = FeatureAggregator()
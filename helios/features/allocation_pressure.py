@@ -10,11 +10,10 @@ GUARDRAIL: AP describes capital flow direction, NOT a buy/sell signal.
 Positive AP means net inflows; negative means net outflows.
 """
 
-from dataclasses import dataclass
+from typing import NamedTuple
 
 
-@dataclass(frozen=True)
-class APResult:
+class APResult(NamedTuple):
     """Result of Allocation Pressure calculation."""
 
     ticker: str
@@ -10,11 +10,10 @@ GUARDRAIL: RS describes relative performance, NOT a momentum signal.
 Positive RS means the sector is outperforming SPY.
 """
 
-from dataclasses import dataclass
+from typing import NamedTuple
 
 
-@dataclass(frozen=True)
-class RSResult:
+class RSResult(NamedTuple):
     """Result of Relative Strength calculation."""
 
     ticker: str
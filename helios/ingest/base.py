@@ -5,12 +5,14 @@ All API clients inherit from this base class.
 """
 
 import asyncio
+import importlib.util
 import logging
 from abc import ABC, abstractmethod
 from datetime import date
 from typing import Any
 
 import httpx
+import orjson
 
 from helios.core.exceptions import DataFetchError, RateLimitError
 from helios.ingest.cache import CacheManager
@@ -18,6 +20,10 @@ from helios.ingest.rate_limiter import TokenBucketLimiter
 
 logger = logging.getLogger(__name__)
 
+# Multiplex concurrent requests over one connection when h2 is installed
+# (pip install "helios-etf[http2]"); otherwise fall back to HTTP/1.1 keep-alive
+_HTTP2_AVAILABLE = importlib.util.find_spec("h2") is not None
+
 
 class BaseAPIClient(ABC):
     """
@@ -31,6 +37,8 @@ class BaseAPIClient(ABC):
     """
 
     SOURCE_NAME: str = "base"  # Override in subclasses
+    # Revalidate expired cache entries with If-None-Match (opt-in per client)
+    USE_ETAG: bool = False
 
     def __init__(
         self,
@@ -40,6 +48,7 @@ class BaseAPIClient(ABC):
         cache: CacheManager,
         timeout: float = 30.0,
         max_retries: int = 3,
+        http_client: httpx.AsyncClient | None = None,
     ) -> None:
         """
         Initialize API client.
@@ -51,6 +60,8 @@ class BaseAPIClient(ABC):
             cache: Cache manager instance
             timeout: Request timeout in seconds
             max_retries: Maximum retry attempts
+            http_client: Shared httpx client (connection pool) to use instead
+                of opening one per context; the caller owns and closes it
         """
         self.api_key = api_key
         self.base_url = base_url.rstrip("/")
@@ -59,6 +70,10 @@ class BaseAPIClient(ABC):
         self.timeout = timeout
         self.max_retries = max_retries
         self._client: httpx.AsyncClient | None = None
+        self._shared_client = http_client
+        # Per-request headers, only needed on a shared client (which carries
+        # neither this API's base URL nor its auth headers)
+        self._request_headers: dict[str, str] | None = None
 
     @abstractmethod
     def _auth_headers(self) -> dict[str, str]:
@@ -72,9 +87,15 @@ class BaseAPIClient(ABC):
 
     async def __aenter__(self) -> "BaseAPIClient":
         """Async context manager entry."""
+        if self._shared_client is not None:
+            self._client = self._shared_client
+            self._request_headers = {"Accept": "application/json", **self._auth_headers()}
+            return self
+
         self._client = httpx.AsyncClient(
             base_url=self.base_url,
             timeout=self.timeout,
+            http2=_HTTP2_AVAILABLE,
             headers={
                 "Accept": "application/json",
                 **self._auth_headers(),
@@ -83,17 +104,17 @@ class BaseAPIClient(ABC):
         return self
 
     async def __aexit__(self, exc_type: Any, exc_val: Any, exc_tb: Any) -> None:
-        """Async context manager exit."""
-        if self._client:
+        """Async context manager exit (a shared client is left open)."""
+        if self._client and self._client is not self._shared_client:
             await self._client.aclose()
-            self._client = None
+        self._client = None
 
     async def _request(
         self,
         method: str,
         endpoint: str,
         params: dict[str, Any] | None = None,
-        cache_key_parts: tuple[str, str | None, date] | None = None,
+        cache_key_parts: tuple[str, str | None, date | None] | None = None,
     ) -> dict[str, Any]:
         """
         Make an API request with rate limiting and retry.
@@ -118,12 +139,27 @@ class BaseAPIClient(ABC):
             )
             if cached is not None:
                 logger.debug(
-                    f"Cache hit: {self.SOURCE_NAME}/{endpoint_name}/{identifier}/{trade_date}"
+                    "Cache hit: %s/%s/%s/%s",
+                    self.SOURCE_NAME,
+                    endpoint_name,
+                    identifier,
+                    trade_date,
                 )
                 return cached
 
+        # Expired or missing: revalidate with the stored ETag if supported
+        headers: dict[str, str] | None = None
+        if cache_key_parts and self.USE_ETAG:
+            etag = self.cache.load_etag(self.SOURCE_NAME, *cache_key_parts)
+            if etag:
+                headers = {"If-None-Match": etag}
+
         # Add auth params
         all_params = {**(params or {}), **self._auth_params()}
+        url = endpoint
+        if self._request_headers is not None:
+            url = f"{self.base_url}{endpoint}"
+            headers = {**self._request_headers, **(headers or {})}
 
         # Rate limit and request with retry
         for attempt in range(self.max_retries):
@@ -132,11 +168,27 @@ class BaseAPIClient(ABC):
             try:
                 response = await self._client.request(
                     method,
-                    endpoint,
+                    url,
                     params=all_params,
+                    headers=headers,
                 )
+                self.rate_limiter.update_from_headers(response.headers)
+
+                # Not modified: the cached payload is still current
+                if response.status_code == 304 and cache_key_parts:
+                    cached = self.cache.load_json(
+                        self.SOURCE_NAME, *cache_key_parts, ignore_ttl=True
+                    )
+                    if cached is not None:
+                        self.cache.touch(self.SOURCE_NAME, *cache_key_parts)
+                        logger.debug("Revalidated: %s %s", self.SOURCE_NAME, endpoint)
+                        return cached
+                    # Cached body is gone; fetch it unconditionally
+                    headers = self._request_headers
+                    continue
+
                 response.raise_for_status()
-                data = response.json()
+                data = orjson.loads(response.content)
 
                 # Cache successful response
                 if cache_key_parts:
@@ -148,6 +200,9 @@ class BaseAPIClient(ABC):
                         identifier,
                         trade_date,
                     )
+                    etag = response.headers.get("ETag")
+                    if self.USE_ETAG and etag:
+                        self.cache.save_etag(etag, self.SOURCE_NAME, *cache_key_parts)
 
                 return data
 
@@ -166,7 +221,9 @@ class BaseAPIClient(ABC):
                             source=self.SOURCE_NAME,
                             retry_after=retry_after,
                         ) from e
-                    await asyncio.sleep(retry_after)
+                    # Pause the shared limiter so concurrent callers back off too;
+                    # the next acquire waits out Retry-After
+                    self.rate_limiter.pause(retry_after)
                     continue
 
                 elif status >= 500:  # Server error
@@ -204,7 +261,7 @@ class BaseAPIClient(ABC):
         self,
         endpoint: str,
         params: dict[str, Any] | None = None,
-        cache_key_parts: tuple[str, str | None, date] | None = None,
+        cache_key_parts: tuple[str, str | None, date | None] | None = None,
     ) -> dict[str, Any]:
         """Convenience method for GET requests."""
         return await self._request("GET", endpoint, params, cache_key_parts)
@@ -5,20 +5,68 @@ Supports JSON and Parquet formats with TTL-based invalidation.
 Uses atomic writes to prevent corruption.
 """
 
-import json
 import logging
+import mmap
 import os
 import tempfile
-from datetime import date, datetime, timedelta
+import time
+from collections.abc import Iterator
+from datetime import date
+from functools import lru_cache
 from pathlib import Path
-from typing import Any
+from typing import Any, BinaryIO
 
+import orjson
 import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
 
 from helios.core.exceptions import CacheError
 
+try:
+    import lz4.frame as lz4_frame
+except ImportError:  # optional: pip install "helios-etf[lz4]"
+    lz4_frame = None
+
 logger = logging.getLogger(__name__)
 
+# JSON cache files at least this large are parsed from a read-only mmap
+_MMAP_THRESHOLD = 1 << 20
+
+# LZ4 frame magic number; plain JSON cache files never start with it
+_LZ4_MAGIC = b"\x04\x22\x4d\x18"
+
+
+@lru_cache(maxsize=4096)
+def _cache_dir(base_dir: Path, source: str, endpoint: str, identifier: str | None) -> Path:
+    """Directory holding one (source, endpoint, identifier) series of cache files."""
+    if identifier:
+        return base_dir / source / endpoint / identifier
+    return base_dir / source / endpoint
+
+
+def _walk_files(root: str | os.PathLike[str]) -> Iterator[os.DirEntry[str]]:
+    """Yield regular files under root depth-first, without following symlinks."""
+    with os.scandir(root) as it:
+        for entry in it:
+            if entry.is_dir(follow_symlinks=False):
+                yield from _walk_files(entry.path)
+            elif entry.is_file(follow_symlinks=False):
+                yield entry
+
+
+def _decode_json(buf: bytes | memoryview) -> Any:
+    """
+    Parse a JSON cache payload, LZ4-compressed or plain.
+
+    Returns None for a compressed payload when lz4 is not installed.
+    """
+    if buf[:4] == _LZ4_MAGIC:
+        if lz4_frame is None:
+            return None
+        buf = lz4_frame.decompress(buf)
+    return orjson.loads(buf)
+
 
 class CacheManager:
     """
@@ -31,6 +79,8 @@ class CacheManager:
         base_dir: Base directory for cache files
         ttl_days: Time-to-live in days (default 7)
         format: Storage format ("json" or "parquet")
+        compress: LZ4-compress JSON payloads (requires the optional lz4
+            package; plain JSON is written when it is not installed)
     """
 
     def __init__(
@@ -38,10 +88,13 @@ class CacheManager:
         base_dir: Path,
         ttl_days: int = 7,
         format: str = "json",
+        compress: bool = False,
     ) -> None:
         self.base_dir = Path(base_dir)
         self.ttl_days = ttl_days
+        self._ttl_seconds = ttl_days * 86400.0
         self.format = format
+        self.compress = compress and lz4_frame is not None
         self.base_dir.mkdir(parents=True, exist_ok=True)
 
     def _get_path(
@@ -49,27 +102,45 @@ class CacheManager:
         source: str,
         endpoint: str,
         identifier: str | None,
-        trade_date: date,
+        trade_date: date | None,
     ) -> Path:
         """
         Construct cache file path.
 
         Format: {base_dir}/{source}/{endpoint}/{identifier}/{date}.{format}
+        A trade_date of None maps to a single undated "latest" entry.
         """
-        parts: list[Path | str] = [self.base_dir, source, endpoint]
-        if identifier:
-            parts.append(identifier)
-        parts.append(f"{trade_date.isoformat()}.{self.format}")
-        return Path(*parts)
+        directory = _cache_dir(self.base_dir, source, endpoint, identifier)
+        stem = "latest" if trade_date is None else trade_date.isoformat()
+        return directory / f"{stem}.{self.format}"
 
-    def _is_valid(self, path: Path) -> bool:
-        """Check if cached file exists and is within TTL."""
-        if not path.exists():
-            return False
+    def _open_if_valid(
+        self, path: Path, ignore_ttl: bool = False
+    ) -> tuple[BinaryIO, int] | None:
+        """
+        Open a cached file for reading if it exists and is within TTL.
+
+        The age check uses fstat on the open descriptor, so a cache probe
+        costs one open plus one fstat instead of separate stat calls.
+        With ignore_ttl, expired files are returned too.
+
+        Returns:
+            (unbuffered binary file, size in bytes), or None if missing/expired
+        """
+        try:
+            f = open(path, "rb", buffering=0)  # noqa: SIM115 -- handed to the caller
+        except FileNotFoundError:
+            return None
 
-        mtime = datetime.fromtimestamp(path.stat().st_mtime)
-        age = datetime.now() - mtime
-        return age < timedelta(days=self.ttl_days)
+        try:
+            st = os.fstat(f.fileno())
+        except OSError:
+            f.close()
+            return None
+        if not ignore_ttl and (time.time() - st.st_mtime) >= self._ttl_seconds:
+            f.close()
+            return None
+        return f, st.st_size
 
     def _atomic_write(self, path: Path, write_func: Any) -> None:
         """
@@ -96,6 +167,25 @@ class CacheManager:
                 os.unlink(temp_path)
             raise
 
+    def _atomic_write_bytes(self, path: Path, payload: bytes) -> None:
+        """Binary counterpart of _atomic_write for pre-serialized payloads."""
+        path.parent.mkdir(parents=True, exist_ok=True)
+
+        fd, temp_path = tempfile.mkstemp(
+            suffix=".tmp",
+            prefix=".cache_",
+            dir=path.parent,
+        )
+
+        try:
+            with os.fdopen(fd, "wb") as f:
+                f.write(payload)
+            os.rename(temp_path, path)
+        except Exception:
+            if os.path.exists(temp_path):
+                os.unlink(temp_path)
+            raise
+
     # JSON cache methods
 
     def load_json(
@@ -103,24 +193,34 @@ class CacheManager:
         source: str,
         endpoint: str,
         identifier: str | None,
-        trade_date: date,
+        trade_date: date | None,
+        ignore_ttl: bool = False,
     ) -> dict[str, Any] | None:
         """
         Load JSON data from cache.
 
-        Returns None if not cached or expired.
+        Returns None if not cached or expired (unless ignore_ttl is set,
+        e.g. to reuse a payload the server confirmed as unchanged).
         """
         path = self._get_path(source, endpoint, identifier, trade_date)
 
-        if not self._is_valid(path):
-            return None
-
         try:
-            with open(path, encoding="utf-8") as f:
-                data = json.load(f)
-            logger.debug(f"Cache hit: {path}")
+            opened = self._open_if_valid(path, ignore_ttl=ignore_ttl)
+            if opened is None:
+                return None
+            f, size = opened
+            with f:
+                if size >= _MMAP_THRESHOLD:
+                    with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                        data = _decode_json(memoryview(mm))
+                else:
+                    data = _decode_json(f.read())
+            if data is None:
+                logger.warning(f"Cannot read compressed cache without lz4: {path}")
+                return None
+            logger.debug("Cache hit: %s", path)
             return data
-        except (json.JSONDecodeError, OSError) as e:
+        except (orjson.JSONDecodeError, OSError, RuntimeError) as e:
             logger.warning(f"Cache read error: {e}")
             return None
 
@@ -130,7 +230,7 @@ class CacheManager:
         source: str,
         endpoint: str,
         identifier: str | None,
-        trade_date: date,
+        trade_date: date | None,
     ) -> Path:
         """
         Save JSON data to cache atomically.
@@ -139,16 +239,65 @@ class CacheManager:
         """
         path = self._get_path(source, endpoint, identifier, trade_date)
 
-        def write_func(f: Any) -> None:
-            json.dump(data, f, indent=2, default=str)
-
         try:
-            self._atomic_write(path, write_func)
-            logger.debug(f"Cache save: {path}")
+            payload = orjson.dumps(
+                data,
+                default=str,
+                option=orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY,
+            )
+            if self.compress:
+                payload = lz4_frame.compress(payload)
+            self._atomic_write_bytes(path, payload)
+            logger.debug("Cache save: %s", path)
             return path
         except Exception as e:
             raise CacheError(f"Failed to save cache: {e}") from e
 
+    def touch(
+        self,
+        source: str,
+        endpoint: str,
+        identifier: str | None,
+        trade_date: date | None,
+    ) -> None:
+        """Restart the TTL of a cached JSON entry (e.g. after a 304)."""
+        path = self._get_path(source, endpoint, identifier, trade_date)
+        try:
+            os.utime(path)
+        except OSError as e:
+            logger.warning(f"Cache touch error: {e}")
+
+    # ETag sidecar methods
+
+    def load_etag(
+        self,
+        source: str,
+        endpoint: str,
+        identifier: str | None,
+        trade_date: date | None,
+    ) -> str | None:
+        """Load the ETag stored next to a cached JSON entry, if any."""
+        path = self._get_path(source, endpoint, identifier, trade_date)
+        try:
+            return path.with_suffix(".etag").read_text(encoding="utf-8").strip() or None
+        except OSError:
+            return None
+
+    def save_etag(
+        self,
+        etag: str,
+        source: str,
+        endpoint: str,
+        identifier: str | None,
+        trade_date: date | None,
+    ) -> None:
+        """Store the ETag for a cached JSON entry in a sibling .etag file."""
+        path = self._get_path(source, endpoint, identifier, trade_date)
+        try:
+            self._atomic_write_bytes(path.with_suffix(".etag"), etag.encode("utf-8"))
+        except OSError as e:
+            logger.warning(f"Cache ETag save error: {e}")
+
     # Parquet cache methods
 
     def load_parquet(
@@ -166,12 +315,14 @@ class CacheManager:
         path = self._get_path(source, endpoint, identifier, trade_date)
         path = path.with_suffix(".parquet")
 
-        if not self._is_valid(path):
-            return None
-
         try:
-            df = pd.read_parquet(path)
-            logger.debug(f"Cache hit: {path}")
+            opened = self._open_if_valid(path)
+            if opened is None:
+                return None
+            f, _ = opened
+            with f:
+                df = pq.read_table(f).to_pandas(types_mapper=pd.ArrowDtype)
+            logger.debug("Cache hit: %s", path)
             return df
         except Exception as e:
             logger.warning(f"Cache read error: {e}")
@@ -203,9 +354,16 @@ class CacheManager:
         os.close(fd)
 
         try:
-            df.to_parquet(temp_path, index=False, compression="snappy")
+            table = pa.Table.from_pandas(df, preserve_index=False)
+            pq.write_table(
+                table,
+                temp_path,
+                compression="zstd",
+                compression_level=1,
+                use_dictionary=True,
+            )
             os.rename(temp_path, path)
-            logger.debug(f"Cache save: {path}")
+            logger.debug("Cache save: %s", path)
             return path
         except Exception as e:
             if os.path.exists(temp_path):
@@ -223,19 +381,13 @@ class CacheManager:
             Number of files removed
         """
         count = 0
-        cutoff = datetime.now() - timedelta(days=older_than_days or 0)
-
-        for path in self.base_dir.rglob("*"):
-            if not path.is_file():
-                continue
-
-            if older_than_days:
-                mtime = datetime.fromtimestamp(path.stat().st_mtime)
-                if mtime > cutoff:
-                    continue
+        cutoff = time.time() - (older_than_days or 0) * 86400.0
 
+        for entry in _walk_files(self.base_dir):
             try:
-                path.unlink()
+                if older_than_days and entry.stat(follow_symlinks=False).st_mtime > cutoff:
+                    continue
+                os.unlink(entry.path)
                 count += 1
             except OSError:
                 pass
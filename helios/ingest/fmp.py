@@ -5,10 +5,13 @@ Fetches daily net fund flow data for sector ETFs.
 Requires FMP Ultimate tier for /stable/etf-fund-flow endpoint.
 """
 
+import asyncio
 import logging
 from datetime import date
 from typing import Any
 
+import httpx
+import numpy as np
 import pandas as pd
 
 from helios.core.config import Settings
@@ -19,6 +22,9 @@ from helios.ingest.rate_limiter import TokenBucketLimiter
 
 logger = logging.getLogger(__name__)
 
+# Candidate names for the net flow field in FMP responses, in priority order
+_FLOW_COLUMNS = ("netFlow", "net_flow", "flowAmount", "flow")
+
 
 class FMPFlowClient(BaseAPIClient):
     """
@@ -31,12 +37,17 @@ class FMPFlowClient(BaseAPIClient):
     SOURCE_NAME = "fmp"
     BASE_URL = "https://financialmodelingprep.com"
 
-    def __init__(self, settings: Settings | None = None) -> None:
+    def __init__(
+        self,
+        settings: Settings | None = None,
+        http_client: httpx.AsyncClient | None = None,
+    ) -> None:
         """
         Initialize FMP client.
 
         Args:
             settings: Application settings (uses default if not provided)
+            http_client: Shared httpx client to reuse (see BaseAPIClient)
         """
         from helios.core.config import get_settings
 
@@ -49,6 +60,7 @@ class FMPFlowClient(BaseAPIClient):
                 base_dir=settings.raw_data_dir / "fmp",
                 ttl_days=7,
             ),
+            http_client=http_client,
         )
 
     def _auth_headers(self) -> dict[str, str]:
@@ -106,28 +118,32 @@ class FMPFlowClient(BaseAPIClient):
         """
         results: dict[str, pd.DataFrame] = {}
 
-        for ticker in SECTOR_UNIVERSE:
+        # Requests overlap; the rate limiter still bounds the request rate
+        fetched = await asyncio.gather(
+            *(self.get_etf_fund_flow(ticker, from_date, to_date) for ticker in SECTOR_UNIVERSE),
+            return_exceptions=True,
+        )
+
+        for ticker, flows in zip(SECTOR_UNIVERSE, fetched, strict=True):
+            if isinstance(flows, BaseException):
+                logger.error(f"Failed to fetch flows for {ticker}: {flows}")
+                continue
             try:
-                flows = await self.get_etf_fund_flow(ticker, from_date, to_date)
                 if flows:
-                    df = pd.DataFrame(flows)
-                    # Normalize column names
-                    if "date" in df.columns:
-                        df["date"] = pd.to_datetime(df["date"]).dt.date
-                    # Look for net flow column (various possible names)
-                    flow_col = None
-                    for col in ["netFlow", "net_flow", "flowAmount", "flow"]:
-                        if col in df.columns:
-                            flow_col = col
-                            break
+                    # Look for net flow column (various possible names) in any record
+                    keys = set().union(*(f.keys() for f in flows))
+                    flow_col = next((col for col in _FLOW_COLUMNS if col in keys), None)
 
                     if flow_col:
-                        df = df.rename(columns={flow_col: "net_flow"})
-                        df = df[["date", "net_flow"]].sort_values("date").reset_index(drop=True)
+                        # Missing or null fields become NaT/NaN; the record is kept
+                        dates = pd.to_datetime([f.get("date") for f in flows]).date
+                        values = np.array([f.get(flow_col) for f in flows], dtype=np.float64)
+                        df = pd.DataFrame({"date": dates, "net_flow": values})
+                        df.sort_values("date", inplace=True, ignore_index=True)
                         results[ticker] = df
-                        logger.debug(f"Fetched {len(df)} flow records for {ticker}")
+                        logger.debug("Fetched %d flow records for %s", len(df), ticker)
                     else:
-                        logger.warning(f"No net flow column found for {ticker}: {df.columns.tolist()}")
+                        logger.warning(f"No net flow column found for {ticker}: {sorted(keys)}")
                 else:
                     logger.warning(f"No flow data for {ticker}")
             except Exception as e:
@@ -4,10 +4,13 @@ Polygon.io API client for ETF daily prices.
 Fetches daily OHLCV data for sector ETFs and SPY benchmark.
 """
 
+import asyncio
 import logging
 from datetime import date
 from typing import Any
 
+import httpx
+import numpy as np
 import pandas as pd
 
 from helios.core.config import Settings
@@ -30,12 +33,17 @@ class PolygonETFClient(BaseAPIClient):
     SOURCE_NAME = "polygon"
     BASE_URL = "https://api.polygon.io"
 
-    def __init__(self, settings: Settings | None = None) -> None:
+    def __init__(
+        self,
+        settings: Settings | None = None,
+        http_client: httpx.AsyncClient | None = None,
+    ) -> None:
         """
         Initialize Polygon client.
 
         Args:
             settings: Application settings (uses default if not provided)
+            http_client: Shared httpx client to reuse (see BaseAPIClient)
         """
         from helios.core.config import get_settings
 
@@ -48,6 +56,7 @@ class PolygonETFClient(BaseAPIClient):
                 base_dir=settings.raw_data_dir / "polygon",
                 ttl_days=7,
             ),
+            http_client=http_client,
         )
 
     def _auth_headers(self) -> dict[str, str]:
@@ -97,18 +106,21 @@ class PolygonETFClient(BaseAPIClient):
         all_tickers = list(SECTOR_UNIVERSE) + [BENCHMARK_TICKER]
         results: dict[str, pd.DataFrame] = {}
 
-        for ticker in all_tickers:
+        # Requests overlap; the rate limiter still bounds the request rate
+        fetched = await asyncio.gather(
+            *(self.get_etf_daily(ticker, from_date, to_date) for ticker in all_tickers),
+            return_exceptions=True,
+        )
+
+        for ticker, bars in zip(all_tickers, fetched, strict=True):
+            if isinstance(bars, BaseException):
+                logger.error(f"Failed to fetch {ticker}: {bars}")
+                continue
             try:
-                bars = await self.get_etf_daily(ticker, from_date, to_date)
                 if bars:
-                    df = pd.DataFrame(bars)
-                    # Polygon uses 't' for timestamp (ms), 'o','h','l','c','v' for OHLCV
-                    df["date"] = pd.to_datetime(df["t"], unit="ms").dt.date
-                    df = df.rename(columns={"o": "open", "h": "high", "l": "low", "c": "close", "v": "volume"})
-                    df = df[["date", "open", "high", "low", "close", "volume"]]
-                    df = df.sort_values("date").reset_index(drop=True)
+                    df = self._bars_to_frame(bars)
                     results[ticker] = df
-                    logger.debug(f"Fetched {len(df)} bars for {ticker}")
+                    logger.debug("Fetched %d bars for %s", len(df), ticker)
                 else:
                     logger.warning(f"No price data for {ticker}")
             except Exception as e:
@@ -117,6 +129,32 @@ class PolygonETFClient(BaseAPIClient):
         logger.info(f"Fetched prices for {len(results)}/{len(all_tickers)} tickers")
         return results
 
+    @staticmethod
+    def _bars_to_frame(bars: list[dict[str, Any]]) -> pd.DataFrame:
+        """
+        Build a price DataFrame column-wise from Polygon aggregate bars.
+
+        Polygon uses 't' for timestamp (ms), 'o','h','l','c','v' for OHLCV.
+        Bars are requested with sort=asc, so sorting is only a fallback.
+        """
+        n = len(bars)
+
+        def column(key: str) -> np.ndarray:
+            return np.fromiter((b[key] for b in bars), dtype=np.float64, count=n)
+
+        timestamps = np.fromiter((b["t"] for b in bars), dtype=np.int64, count=n)
+        df = pd.DataFrame({
+            "date": pd.to_datetime(timestamps, unit="ms").date,
+            "open": column("o"),
+            "high": column("h"),
+            "low": column("l"),
+            "close": column("c"),
+            "volume": column("v"),
+        })
+        if not np.all(timestamps[1:] >= timestamps[:-1]):
+            df = df.sort_values("date").reset_index(drop=True)
+        return df
+
     @staticmethod
     def calculate_returns(prices_df: pd.DataFrame) -> pd.Series:
         """
@@ -126,9 +164,16 @@ class PolygonETFClient(BaseAPIClient):
             prices_df: DataFrame with 'close' column
 
         Returns:
-            Series of daily returns
+            Series of daily returns (first value NaN; missing closes are
+            not forward-filled)
         """
-        return prices_df["close"].pct_change()
+        close = prices_df["close"]
+        c = close.to_numpy(dtype=np.float64)
+        r = np.full_like(c, np.nan)
+        if c.size > 1:
+            np.divide(c[1:], c[:-1], out=r[1:])
+            r[1:] -= 1.0
+        return pd.Series(r, index=prices_df.index, name=close.name)
 
     async def health_check(self) -> bool:
         """Check Polygon API connectivity."""
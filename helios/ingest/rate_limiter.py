@@ -5,7 +5,9 @@ Implements a leaky bucket algorithm to control request rates.
 """
 
 import asyncio
+import contextlib
 import time
+from collections.abc import Mapping
 from dataclasses import dataclass, field
 
 
@@ -49,14 +51,17 @@ class TokenBucketLimiter:
         rate_per_second = requests_per_minute / 60.0
         return cls(rate_per_second=rate_per_second, burst_size=burst_size)
 
-    def _refill(self) -> None:
-        """Refill tokens based on elapsed time."""
-        now = time.monotonic()
-        elapsed = now - self._last_update
-        self._tokens = min(
-            self.burst_size,
-            self._tokens + elapsed * self.rate_per_second,
-        )
+    def _refill(self, now: float | None = None) -> None:
+        """
+        Refill tokens based on elapsed time.
+
+        Args:
+            now: Current time.monotonic() reading, taken here if omitted
+        """
+        if now is None:
+            now = time.monotonic()
+        tokens = self._tokens + (now - self._last_update) * self.rate_per_second
+        self._tokens = tokens if tokens < self.burst_size else float(self.burst_size)
         self._last_update = now
 
     async def acquire(self, tokens: int = 1) -> None:
@@ -66,9 +71,9 @@ class TokenBucketLimiter:
         Args:
             tokens: Number of tokens to acquire (default 1)
         """
-        async with self._lock:
-            while True:
-                self._refill()
+        while True:
+            async with self._lock:
+                self._refill(time.monotonic())
 
                 if self._tokens >= tokens:
                     self._tokens -= tokens
@@ -77,7 +82,9 @@ class TokenBucketLimiter:
                 # Calculate wait time for sufficient tokens
                 deficit = tokens - self._tokens
                 wait_time = deficit / self.rate_per_second
-                await asyncio.sleep(wait_time)
+
+            # Sleep without holding the lock so other callers are not blocked
+            await asyncio.sleep(wait_time)
 
     async def try_acquire(self, tokens: int = 1) -> bool:
         """
@@ -98,6 +105,42 @@ class TokenBucketLimiter:
 
             return False
 
+    def pause(self, seconds: float) -> None:
+        """
+        Hold off all callers for at least `seconds`.
+
+        Drains the bucket into a deficit so the next acquire waits out the
+        pause; repeated calls for the same pause do not stack.
+
+        Args:
+            seconds: Time before the next token may be taken
+        """
+        self._refill()
+        self._tokens = min(self._tokens, 1.0 - seconds * self.rate_per_second)
+
+    def update_from_headers(self, headers: Mapping[str, str]) -> None:
+        """
+        Align the bucket with the server's view of the rate limit.
+
+        X-RateLimit-Remaining caps the local token count, and Retry-After
+        (in seconds) pauses further requests, so callers throttle before
+        the server starts answering 429.
+
+        Args:
+            headers: Response headers
+        """
+        remaining = headers.get("X-RateLimit-Remaining")
+        if remaining is not None:
+            with contextlib.suppress(ValueError):
+                self._refill()
+                self._tokens = min(self._tokens, float(remaining))
+
+        retry_after = headers.get("Retry-After")
+        if retry_after is not None:
+            # HTTP-date form is not used by our providers
+            with contextlib.suppress(ValueError):
+                self.pause(float(retry_after))
+
     @property
     def available_tokens(self) -> float:
         """Current available tokens (approximate)."""
@@ -5,12 +5,15 @@ Fetches daily ETF inflow/outflow data for sector ETFs.
 Uses the /api/etfs/{ticker}/in-outflow endpoint.
 """
 
+import asyncio
 import logging
 from datetime import date
 from typing import Any
 
+import httpx
 import numpy as np
 import pandas as pd
+from numpy.lib.stride_tricks import sliding_window_view
 
 from helios.core.config import Settings
 from helios.core.constants import SECTOR_UNIVERSE
@@ -18,9 +21,48 @@ from helios.ingest.base import BaseAPIClient
 from helios.ingest.cache import CacheManager
 from helios.ingest.rate_limiter import TokenBucketLimiter
 
+try:
+    from numba import njit
+except ImportError:  # optional: pip install "helios-etf[numba]"
+    njit = None
+
 logger = logging.getLogger(__name__)
 
 
+def _rolling_hampel_kernel(x: np.ndarray, half_window: int, k: float) -> np.ndarray:
+    """
+    Rolling Hampel outlier mask (loop form, compiled with numba when available).
+
+    Each point is compared with the median/MAD of the centred window
+    x[i - half_window : i + half_window + 1], truncated at the ends.
+    """
+    n = x.shape[0]
+    mask = np.zeros(n, dtype=np.bool_)
+    for i in range(n):
+        lo = max(0, i - half_window)
+        hi = min(n, i + half_window + 1)
+        window = x[lo:hi]
+        median = np.median(window)
+        mad = np.median(np.abs(window - median))
+        if mad > 0 and abs(x[i] - median) > k * 1.4826 * mad:
+            mask[i] = True
+    return mask
+
+
+def _rolling_hampel_numpy(x: np.ndarray, half_window: int, k: float) -> np.ndarray:
+    """Vectorized equivalent of _rolling_hampel_kernel, used without numba."""
+    padded = np.pad(x, half_window, constant_values=np.nan)
+    windows = sliding_window_view(padded, 2 * half_window + 1)
+    median = np.nanmedian(windows, axis=1)
+    mad = np.nanmedian(np.abs(windows - median[:, None]), axis=1)
+    return (mad > 0) & (np.abs(x - median) > k * 1.4826 * mad)
+
+
+_rolling_hampel_mask = (
+    njit(cache=True)(_rolling_hampel_kernel) if njit is not None else _rolling_hampel_numpy
+)
+
+
 class UnusualWhalesClient(BaseAPIClient):
     """
     Unusual Whales API client for ETF fund flow data.
@@ -31,11 +73,22 @@ class UnusualWhalesClient(BaseAPIClient):
 
     SOURCE_NAME = "unusual_whales"
     BASE_URL = "https://api.unusualwhales.com"
-    # Drop flow values where abs(value) > OUTLIER_MULTIPLE × median(abs(values))
+    # Hampel rule: drop flow values where |x - median| > HAMPEL_K × 1.4826 × MAD
     # Catches anomalous AP creation/redemption spikes (e.g. 2025-12-05: 800x median)
-    OUTLIER_MULTIPLE = 50
+    HAMPEL_K = 6.0
+    # Series longer than this (multi-year rescans) use a rolling Hampel window
+    # of ±HAMPEL_HALF_WINDOW days, so regime shifts do not skew a global median
+    HAMPEL_ROLLING_MIN = 200
+    HAMPEL_HALF_WINDOW = 11
+    USE_ETAG = True
+    # Concurrent in-flight requests; keeps fan-out within the burst size
+    MAX_CONCURRENT = 3
 
-    def __init__(self, settings: Settings | None = None) -> None:
+    def __init__(
+        self,
+        settings: Settings | None = None,
+        http_client: httpx.AsyncClient | None = None,
+    ) -> None:
         from helios.core.config import get_settings
 
         settings = settings or get_settings()
@@ -46,7 +99,9 @@ class UnusualWhalesClient(BaseAPIClient):
             cache=CacheManager(
                 base_dir=settings.raw_data_dir / "unusual_whales",
                 ttl_days=1,
+                compress=True,
             ),
+            http_client=http_client,
         )
 
     def _auth_headers(self) -> dict[str, str]:
@@ -68,11 +123,11 @@ class UnusualWhalesClient(BaseAPIClient):
         Returns:
             List of flow records with date, change, change_prem fields
         """
-        cache_date = date.today()
-
+        # Undated cache entry: after the 1-day TTL it is revalidated via
+        # ETag rather than refetched because the calendar day changed
         data = await self._get(
             f"/api/etfs/{ticker}/in-outflow",
-            cache_key_parts=("etf_in_outflow", ticker, cache_date),
+            cache_key_parts=("etf_in_outflow", ticker, None),
         )
 
         return data.get("data", [])
@@ -89,70 +144,123 @@ class UnusualWhalesClient(BaseAPIClient):
             {ticker: DataFrame[date, net_flow]}
         """
         results: dict[str, pd.DataFrame] = {}
+        # Local bindings for the closure and loops below
+        tickers = SECTOR_UNIVERSE
+        fetch_one = self._fetch_one
+
+        # Requests overlap up to MAX_CONCURRENT; the rate limiter still
+        # bounds the request rate
+        semaphore = asyncio.Semaphore(self.MAX_CONCURRENT)
 
-        for ticker in SECTOR_UNIVERSE:
-            try:
-                flows = await self.get_etf_inflow_outflow(ticker)
-                if flows:
-                    df = pd.DataFrame(flows)
-                    if "date" in df.columns:
-                        df["date"] = pd.to_datetime(df["date"]).dt.date
-                    if "change_prem" in df.columns:
-                        df["net_flow"] = pd.to_numeric(
-                            df["change_prem"], errors="coerce"
-                        )
-                        df = df[["date", "net_flow"]].dropna(subset=["net_flow"])
-                        df = df[
-                            (df["date"] >= from_date) & (df["date"] <= to_date)
-                        ]
-                        df = df.sort_values("date").reset_index(drop=True)
-                        # Filter outliers: AP rebalancing spikes
-                        df = self._filter_flow_outliers(df, ticker)
-                        results[ticker] = df
-                        logger.debug(
-                            f"Fetched {len(df)} UW flow records for {ticker}"
-                        )
-                    else:
-                        logger.warning(
-                            f"No change_prem column for {ticker}: "
-                            f"{df.columns.tolist()}"
-                        )
-                else:
-                    logger.warning(f"No UW flow data for {ticker}")
-            except Exception as e:
-                logger.error(f"Failed to fetch UW flows for {ticker}: {e}")
-
-        logger.info(
-            f"Fetched UW flows for {len(results)}/{len(SECTOR_UNIVERSE)} sectors"
+        async def fetch(ticker: str) -> tuple[str, pd.DataFrame | None]:
+            async with semaphore:
+                return await fetch_one(ticker, from_date, to_date)
+
+        pairs = await asyncio.gather(
+            *(fetch(ticker) for ticker in tickers),
+            return_exceptions=True,
         )
+
+        for ticker, pair in zip(tickers, pairs, strict=True):
+            if isinstance(pair, BaseException):
+                logger.error(f"Failed to fetch UW flows for {ticker}: {pair}")
+                continue
+            _, df = pair
+            if df is not None:
+                results[ticker] = df
+
+        logger.info(f"Fetched UW flows for {len(results)}/{len(tickers)} sectors")
         return results
 
+    async def _fetch_one(
+        self,
+        ticker: str,
+        from_date: date,
+        to_date: date,
+    ) -> tuple[str, pd.DataFrame | None]:
+        """
+        Fetch and clean fund flows for one sector ETF.
+
+        Returns:
+            (ticker, DataFrame[date, net_flow]) or (ticker, None) if no usable data
+        """
+        flows = await self.get_etf_inflow_outflow(ticker)
+        if not flows:
+            logger.warning(f"No UW flow data for {ticker}")
+            return ticker, None
+
+        if not any("change_prem" in record for record in flows):
+            logger.warning(
+                f"No change_prem column for {ticker}: "
+                f"{sorted(set().union(*flows))}"
+            )
+            return ticker, None
+
+        # One pass over the records into arrays; a single DataFrame at the end
+        dates = pd.to_datetime([r["date"] for r in flows]).to_numpy().astype("datetime64[D]")
+        values = pd.to_numeric(
+            pd.Series([r.get("change_prem") for r in flows], dtype=object),
+            errors="coerce",
+        ).to_numpy(dtype=np.float64)
+
+        keep = (
+            np.isfinite(values)
+            & (dates >= np.datetime64(from_date))
+            & (dates <= np.datetime64(to_date))
+        )
+        dates, values = dates[keep], values[keep]
+        order = np.argsort(dates, kind="stable")
+        dates, values = dates[order], values[order]
+
+        # Filter outliers: AP rebalancing spikes
+        dates, values = self._filter_flow_outliers(dates, values, ticker)
+
+        df = pd.DataFrame({"date": dates.astype(object), "net_flow": values})
+        logger.debug("Fetched %d UW flow records for %s", len(df), ticker)
+        return ticker, df
+
     def _filter_flow_outliers(
-        self, df: pd.DataFrame, ticker: str
-    ) -> pd.DataFrame:
+        self, dates: np.ndarray, values: np.ndarray, ticker: str
+    ) -> tuple[np.ndarray, np.ndarray]:
         """
-        Drop rows with anomalous net_flow values.
+        Drop observations with anomalous net_flow values.
 
         UW occasionally reports extreme AP creation/redemption spikes
-        (e.g. 800x median on rebalancing days). These are dropped so the
-        pipeline falls back to Polygon dollar volume proxy for those days.
+        (e.g. 800x median on rebalancing days). These are detected with the
+        Hampel rule (median/MAD) and dropped so the pipeline falls back to
+        Polygon dollar volume proxy for those days.
+
+        Args:
+            dates: datetime64[D] array, aligned with values
+            values: Net flow values
+            ticker: ETF ticker (for logging)
+
+        Returns:
+            (dates, values) with outliers removed
         """
-        if len(df) < 5:
-            return df
-        median_abs = np.median(np.abs(df["net_flow"].values))
-        if median_abs == 0:
-            return df
-        threshold = self.OUTLIER_MULTIPLE * median_abs
-        outliers = df["net_flow"].abs() > threshold
-        n_dropped = outliers.sum()
+        k = self.HAMPEL_K
+        if len(values) < 5:
+            return dates, values
+        if len(values) > self.HAMPEL_ROLLING_MIN:
+            outliers = _rolling_hampel_mask(values, self.HAMPEL_HALF_WINDOW, k)
+        else:
+            median = np.median(values)
+            deviation = np.abs(values - median)
+            mad = np.median(deviation)
+            if mad == 0:
+                return dates, values
+            # 1.4826 scales MAD to the standard deviation under normality
+            outliers = deviation > k * 1.4826 * mad
+        n_dropped = int(np.count_nonzero(outliers))
         if n_dropped > 0:
-            dropped_dates = df.loc[outliers, "date"].tolist()
+            dropped_dates = dates[outliers].astype(object).tolist()
             logger.warning(
                 f"Dropped {n_dropped} UW outlier(s) for {ticker} "
-                f"(>{self.OUTLIER_MULTIPLE}x median): {dropped_dates}"
+                f"(Hampel k={k:g}): {dropped_dates}"
             )
-            df = df[~outliers].reset_index(drop=True)
-        return df
+            keep = ~outliers
+            return dates[keep], values[keep]
+        return dates, values
 
     async def health_check(self) -> bool:
         """Check Unusual Whales API connectivity."""
@@ -4,17 +4,22 @@ from helios.normalization.methods import (
     calculate_rolling_mean,
     calculate_rolling_std,
     percentile_rank,
+    percentile_rank_batch,
+    rolling_zscore,
     zscore_normalize,
 )
-from helios.normalization.pipeline import NormalizationPipeline
+from helios.normalization.pipeline import NormalizationPipeline, NormalizedSector
 from helios.normalization.rolling import RollingStats, SectorRollingCalculator
 
 __all__ = [
     "NormalizationPipeline",
+    "NormalizedSector",
     "RollingStats",
     "SectorRollingCalculator",
     "calculate_rolling_mean",
     "calculate_rolling_std",
     "percentile_rank",
+    "percentile_rank_batch",
+    "rolling_zscore",
     "zscore_normalize",
 ]
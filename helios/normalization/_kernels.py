@@ -0,0 +1,133 @@
+"""
+Compiled update kernels for the rolling baseline arrays.
+
+The functions operate on the column-wise state of SectorRollingCalculator
+((tickers, features, window) ring buffer plus (tickers, features) moment
+and counter arrays). They are compiled with numba when it is installed
+(pip install "helios-etf[numba]") and run as plain Python otherwise, with
+identical results for the incremental update.
+
+Updates within one (ticker, feature) series are sequential (each depends on
+the previous window), but distinct series are independent, so bulk loads
+run one series per thread under numba's parallel mode.
+"""
+
+from collections.abc import Callable
+from typing import Any, cast
+
+import numpy as np
+
+try:
+    from numba import njit, prange
+except ImportError:  # optional dependency
+    njit = None
+
+    def prange(*args: int) -> range:
+        """Serial stand-in for numba.prange."""
+        return range(*args)
+
+
+def _jit(func: Callable[..., Any]) -> Callable[..., Any]:
+    """Compile with numba when available; otherwise return func unchanged."""
+    if njit is None:
+        return func
+    return cast(Callable[..., Any], njit(cache=True, nogil=True)(func))
+
+
+def _jit_parallel(func: Callable[..., Any]) -> Callable[..., Any]:
+    """Like _jit, with prange loops distributed across threads."""
+    if njit is None:
+        return func
+    return cast(Callable[..., Any], njit(cache=True, nogil=True, parallel=True)(func))
+
+
+@_jit
+def ring_update(
+    buf: np.ndarray,
+    mean: np.ndarray,
+    m2: np.ndarray,
+    count: np.ndarray,
+    head: np.ndarray,
+    replacements: np.ndarray,
+    i: int,
+    j: int,
+    value: float,
+) -> None:
+    """
+    Add one value to the (i, j) window in place.
+
+    Sliding-window Welford update of mean/m2; the moments are recomputed
+    exactly from the window once every `window` replacements.
+    """
+    window = buf.shape[2]
+    n = count[i, j]
+    h = head[i, j]
+    mu = mean[i, j]
+
+    if n < window:
+        n += 1
+        count[i, j] = n
+        delta = value - mu
+        mu = mu + delta / n
+        m2[i, j] = m2[i, j] + delta * (value - mu)
+    else:
+        old = buf[i, j, h]
+        delta = value - old
+        new_mu = mu + delta / n
+        m2[i, j] = m2[i, j] + delta * (value - new_mu + old - mu)
+        mu = new_mu
+        replacements[i, j] += 1
+
+    mean[i, j] = mu
+    buf[i, j, h] = value
+    head[i, j] = (h + 1) % window
+
+    if replacements[i, j] >= window:
+        arr = buf[i, j, :n]
+        mu = arr.mean()
+        mean[i, j] = mu
+        m2[i, j] = ((arr - mu) ** 2).sum()
+        replacements[i, j] = 0
+
+
+@_jit
+def ring_update_many(
+    buf: np.ndarray,
+    mean: np.ndarray,
+    m2: np.ndarray,
+    count: np.ndarray,
+    head: np.ndarray,
+    replacements: np.ndarray,
+    i: int,
+    j: int,
+    values: np.ndarray,
+) -> None:
+    """Add values (oldest to newest) to the (i, j) window in place."""
+    for k in range(values.shape[0]):
+        ring_update(buf, mean, m2, count, head, replacements, i, j, values[k])
+
+
+@_jit_parallel
+def ring_update_pairs(
+    buf: np.ndarray,
+    mean: np.ndarray,
+    m2: np.ndarray,
+    count: np.ndarray,
+    head: np.ndarray,
+    replacements: np.ndarray,
+    rows: np.ndarray,
+    cols: np.ndarray,
+    starts: np.ndarray,
+    values: np.ndarray,
+) -> None:
+    """
+    Add one series per (rows[p], cols[p]) pair in place.
+
+    Pair p's values (oldest to newest) are values[starts[p]:starts[p + 1]].
+    Pairs must be distinct; each is updated by exactly one thread.
+    """
+    for p in prange(rows.shape[0]):
+        i = rows[p]
+        j = cols[p]
+        for k in range(starts[p], starts[p + 1]):
+            ring_update(buf, mean, m2, count, head, replacements, i, j, values[k])
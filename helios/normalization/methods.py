@@ -13,10 +13,13 @@ Rationale:
 """
 
 import logging
+import math
 from collections.abc import Sequence
 
 import numpy as np
 
+from helios.core.constants import MIN_OBSERVATIONS, ROLLING_WINDOW
+
 logger = logging.getLogger(__name__)
 
 
@@ -39,8 +42,10 @@ def zscore_normalize(
     Returns:
         Z-score (unbounded - NOT clipped)
     """
-    if std == 0 or std is None or np.isnan(std):
-        logger.debug(f"Zero std for value={value}, mean={mean}, returning 0.0")
+    # Scalar math.isnan avoids the ufunc dispatch of np.isnan on this hot path
+    if std is None or std == 0 or math.isnan(std):
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Zero std for value=%s, mean=%s, returning 0.0", value, mean)
         return 0.0
 
     z = (value - mean) / std
@@ -53,7 +58,7 @@ def zscore_normalize(
 
 def percentile_rank(
     value: float,
-    history: Sequence[float],
+    history: Sequence[float] | np.ndarray,
 ) -> float:
     """
     Calculate percentile rank of a value within historical distribution.
@@ -69,16 +74,43 @@ def percentile_rank(
     Returns:
         Percentile rank in [0, 100]
     """
-    if not history:
+    if len(history) == 0:
         return 50.0
 
-    n = len(history)
-    count_less = sum(1 for h in history if h < value)
-    percentile = (count_less / n) * 100
+    # A single query needs one O(n) comparison pass, not an O(n log n) sort;
+    # percentile_rank_batch sorts once when ranking many values
+    arr = np.asarray(history, dtype=np.float64)
+    count_less = int(np.count_nonzero(arr < value))
+    percentile = (count_less / arr.size) * 100
 
     return float(percentile)
 
 
+def percentile_rank_batch(
+    values: Sequence[float] | np.ndarray,
+    history: Sequence[float] | np.ndarray,
+) -> np.ndarray:
+    """
+    Calculate percentile ranks of many values against one history.
+
+    Sorts the history once and ranks all values with a single
+    searchsorted call. Same semantics as percentile_rank.
+
+    Args:
+        values: Values to rank
+        history: Historical values to compare against
+
+    Returns:
+        float64 array of percentile ranks in [0, 100], same shape as values
+    """
+    values = np.asarray(values, dtype=np.float64)
+    if len(history) == 0:
+        return np.full(values.shape, 50.0)
+
+    arr = np.sort(np.asarray(history, dtype=np.float64))
+    return np.searchsorted(arr, values, side="left") / arr.size * 100
+
+
 def calculate_rolling_mean(
     values: Sequence[float],
     window: int,
@@ -121,3 +153,53 @@ def calculate_rolling_std(
 
     recent = values[-window:]
     return float(np.std(recent, ddof=ddof))
+
+
+def rolling_zscore(
+    values: Sequence[float] | np.ndarray,
+    window: int = ROLLING_WINDOW,
+    min_observations: int = MIN_OBSERVATIONS,
+) -> np.ndarray:
+    """
+    Calculate rolling z-scores for a whole series in O(N).
+
+    Each value is scored against the window of up to `window` values
+    preceding it (sample std), matching the incremental normalization
+    pipeline. Window sums come from cumulative sums of the mean-centered
+    series, so no per-window reduction is needed.
+
+    IMPORTANT: z-scores are NOT clipped.
+
+    Args:
+        values: Finite values (oldest to newest)
+        window: Rolling window size
+        min_observations: Minimum prior observations for a valid z-score
+
+    Returns:
+        Array of z-scores; NaN where history is insufficient or std is zero
+    """
+    x = np.asarray(values, dtype=np.float64)
+    n = x.size
+    if n == 0:
+        return np.empty(0, dtype=np.float64)
+
+    # Centering keeps the sum-of-squares difference well conditioned
+    centered = x - x.mean()
+    cs = np.concatenate(([0.0], np.cumsum(centered)))
+    cs2 = np.concatenate(([0.0], np.cumsum(centered * centered)))
+
+    idx = np.arange(n)
+    start = np.maximum(idx - window, 0)
+    count = idx - start
+    window_sum = cs[idx] - cs[start]
+    window_sumsq = cs2[idx] - cs2[start]
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        mean = window_sum / count
+        var = np.maximum(window_sumsq - window_sum * mean, 0.0) / (count - 1)
+        std = np.sqrt(var)
+        z = (centered - mean) / std
+
+    # NO CLIPPING - preserve tail information
+    valid = (count >= min_observations) & (std > 0)
+    return np.where(valid, z, np.nan)
@@ -12,10 +12,15 @@ CRITICAL DESIGN DECISIONS:
 """
 
 import logging
-from datetime import date
+from collections.abc import Sequence
+from datetime import date, datetime
 from pathlib import Path
+from typing import Any, NamedTuple
 
+import numpy as np
 import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
 
 from helios.core.constants import (
     FEATURE_NAMES,
@@ -29,6 +34,58 @@ from helios.normalization.rolling import SectorRollingCalculator
 logger = logging.getLogger(__name__)
 
 
+class NormalizedSector(NamedTuple):
+    """Result of normalizing one sector's features."""
+
+    z_scores: dict[str, float]  # feature -> z-score, only for usable features
+    excluded: list[str]  # features without a value or a ready baseline
+    status: BaselineStatus
+
+
+# History columns needed to seed the rolling baselines
+_HISTORY_COLUMNS = ["date", "ticker", "ap_raw", "rs_raw"]
+
+
+def _date_bound(history_file: Path, bound: date) -> date | datetime | str:
+    """
+    Express a date bound in the stored type of the history date column.
+
+    Current history files store DATE32; older ones store ISO strings,
+    which compare correctly as strings.
+    """
+    date_type = pq.read_schema(history_file).field("date").type
+    if pa.types.is_date(date_type):
+        return bound
+    if pa.types.is_timestamp(date_type):
+        return datetime.combine(bound, datetime.min.time())
+    return bound.isoformat()
+
+
+def feature_matrix(feature_sets: Sequence[SectorFeatureSet]) -> np.ndarray:
+    """
+    Stack raw sector features into a (sectors, features) matrix.
+
+    Columns follow FEATURE_NAMES: AP from net_flow, RS from excess_return.
+    Missing values are NaN.
+
+    Args:
+        feature_sets: One SectorFeatureSet per row
+
+    Returns:
+        float64 array shaped (len(feature_sets), len(FEATURE_NAMES))
+    """
+    return np.array(
+        [
+            [
+                np.nan if features.net_flow is None else features.net_flow,
+                np.nan if features.excess_return is None else features.excess_return,
+            ]
+            for features in feature_sets
+        ],
+        dtype=np.float64,
+    ).reshape(len(feature_sets), len(FEATURE_NAMES))
+
+
 class NormalizationPipeline:
     """
     Sector-aware normalization pipeline.
@@ -58,6 +115,8 @@ class NormalizationPipeline:
             min_observations=min_observations,
         )
         self._history_dir = history_dir
+        # Calculator row indices per ticker ordering, derived once per ordering
+        self._row_index: dict[tuple[str, ...], np.ndarray] = {}
 
     def load_history(self, up_to_date: date | None = None) -> int:
         """
@@ -79,28 +138,28 @@ class NormalizationPipeline:
             return 0
 
         try:
-            df = pd.read_parquet(history_file)
-            df["date"] = pd.to_datetime(df["date"]).dt.date
-
+            # Read only the baseline columns; the date bound is pushed down
+            # to Arrow so earlier row groups are pruned without loading
+            filters = None
             if up_to_date:
-                df = df[df["date"] < up_to_date]
-
-            # Convert DataFrame to {ticker: [records]} format
-            history: dict[str, list[dict]] = {}
-            for ticker in SECTOR_UNIVERSE:
-                ticker_df = df[df["ticker"] == ticker]
-                if not ticker_df.empty:
-                    records = []
-                    for _, row in ticker_df.iterrows():
-                        record: dict = {"date": row["date"]}
-                        if pd.notna(row.get("ap_raw")):
-                            record["AP"] = float(row["ap_raw"])
-                        if pd.notna(row.get("rs_raw")):
-                            record["RS"] = float(row["rs_raw"])
-                        records.append(record)
-                    history[ticker] = records
-
-            count = self._calculator.load_from_history(history)
+                filters = [("date", "<", _date_bound(history_file, up_to_date))]
+            df = pd.read_parquet(
+                history_file,
+                engine="pyarrow",
+                columns=_HISTORY_COLUMNS,
+                filters=filters,
+            )
+
+            # All sectors load from the column arrays in one call
+            count = self._calculator.load_from_columns(
+                df["ticker"].to_numpy(),
+                pd.to_datetime(df["date"]).to_numpy(dtype="datetime64[D]"),
+                {
+                    "AP": df["ap_raw"].to_numpy(dtype=np.float64),
+                    "RS": df["rs_raw"].to_numpy(dtype=np.float64),
+                },
+            )
+
             logger.info(f"Loaded {count} historical observations for baselines")
             return count
 
@@ -112,7 +171,7 @@ class NormalizationPipeline:
         self,
         ticker: str,
         features: SectorFeatureSet,
-    ) -> tuple[dict[str, float], list[str], BaselineStatus]:
+    ) -> NormalizedSector:
         """
         Normalize features for a single sector.
 
@@ -121,7 +180,7 @@ class NormalizationPipeline:
             features: Raw feature values
 
         Returns:
-            Tuple of (z_scores, excluded_features, status)
+            NormalizedSector (z_scores, excluded, status)
         """
         z_scores: dict[str, float] = {}
         excluded: list[str] = []
@@ -151,12 +210,12 @@ class NormalizationPipeline:
         else:
             status = BaselineStatus.INSUFFICIENT
 
-        return z_scores, excluded, status
+        return NormalizedSector(z_scores, excluded, status)
 
     def normalize_all(
         self,
         all_features: dict[str, SectorFeatureSet],
-    ) -> dict[str, tuple[dict[str, float], list[str], BaselineStatus]]:
+    ) -> dict[str, NormalizedSector]:
         """
         Normalize features for all sectors.
 
@@ -164,15 +223,81 @@ class NormalizationPipeline:
             all_features: {ticker: SectorFeatureSet}
 
         Returns:
-            {ticker: (z_scores, excluded, status)}
+            {ticker: NormalizedSector}
         """
-        results: dict[str, tuple[dict[str, float], list[str], BaselineStatus]] = {}
+        results: dict[str, NormalizedSector] = {}
+        if not all_features:
+            return results
+
+        tickers = list(all_features)
+        raw = feature_matrix(list(all_features.values()))
+
+        # Columnar pass: one (sectors x features) z-score computation
+        z = self.zscore_matrix(tickers, raw)
+        valid = ~np.isnan(z)
+        n_valid = valid.sum(axis=1)
+
+        n_features = len(FEATURE_NAMES)
+        for ticker, z_row, valid_row, count in zip(
+            tickers, z.tolist(), valid.tolist(), n_valid.tolist(), strict=True
+        ):
+            z_scores: dict[str, float] = {}
+            excluded: list[str] = []
+            for name, value, ok in zip(FEATURE_NAMES, z_row, valid_row, strict=True):
+                if ok:
+                    z_scores[name] = value
+                else:
+                    excluded.append(name)
+
+            if count == n_features:
+                status = BaselineStatus.COMPLETE
+            elif count > 0:
+                status = BaselineStatus.PARTIAL
+            else:
+                status = BaselineStatus.INSUFFICIENT
 
-        for ticker, features in all_features.items():
-            results[ticker] = self.normalize_sector(ticker, features)
+            results[ticker] = NormalizedSector(z_scores, excluded, status)
 
         return results
 
+    def zscore_matrix(self, tickers: Sequence[str], raw: np.ndarray) -> np.ndarray:
+        """
+        Z-score a (sectors, features) matrix of raw values in one operation.
+
+        IMPORTANT: Z-scores are NOT clipped.
+
+        Args:
+            tickers: Sector ETF ticker for each row
+            raw: Raw values, columns in FEATURE_NAMES order (NaN = missing)
+
+        Returns:
+            Z-score matrix of the same shape; NaN where the value is missing
+            or the baseline is not ready / has zero std (excluded features)
+        """
+        means, stds = self._calculator.means_and_stds(tickers, FEATURE_NAMES)
+        # NO CLIPPING - preserve tail information
+        return (raw - means) / stds
+
+    def add_observations(
+        self,
+        trade_date: date,
+        tickers: Sequence[str],
+        raw: np.ndarray,
+    ) -> None:
+        """
+        Add a day's (sectors, features) matrix to the rolling baselines.
+
+        Args:
+            trade_date: Date of the observations
+            tickers: Sector ETF ticker for each row
+            raw: Raw values, columns in FEATURE_NAMES order (NaN = missing)
+        """
+        key = tuple(tickers)
+        rows = self._row_index.get(key)
+        if rows is None:
+            rows = self._row_index[key] = self._calculator.row_indices(key)
+        self._calculator.add_matrix(trade_date, rows, raw)
+
     def add_observation(self, ticker: str, features: SectorFeatureSet) -> None:
         """
         Add observation to rolling baselines.
@@ -192,6 +317,6 @@ class NormalizationPipeline:
                 ticker, features.trade_date, feature_values
             )
 
-    def summary(self) -> dict:
+    def summary(self) -> dict[str, dict[str, dict[str, Any]]]:
         """Get summary of all rolling statistics."""
         return self._calculator.summary()
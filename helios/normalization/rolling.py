@@ -6,37 +6,104 @@ Sector-aware: each (sector, feature) pair gets independent statistics.
 """
 
 import logging
-from collections import deque
-from collections.abc import Sequence
+import math
+from collections.abc import Mapping, Sequence
 from dataclasses import dataclass, field
 from datetime import date
+from typing import Any
 
 import numpy as np
+import numpy.typing as npt
 
 from helios.core.constants import FEATURE_NAMES, MIN_OBSERVATIONS, ROLLING_WINDOW, SECTOR_UNIVERSE
+from helios.normalization._kernels import ring_update, ring_update_many, ring_update_pairs
 
 logger = logging.getLogger(__name__)
 
+# Observation dates are stored as int64 days since 1970-01-01
+_EPOCH_ORDINAL = date(1970, 1, 1).toordinal()
 
-@dataclass
+
+def _epoch_days(dates: Sequence[date | str] | np.ndarray) -> np.ndarray:
+    """Convert dates (date objects, ISO strings, datetime64 or epoch days) to epoch days."""
+    arr = np.asarray(dates)
+    if not arr.size:
+        return np.empty(0, dtype=np.int64)
+    if arr.dtype.kind in "iu":
+        return arr.astype(np.int64, copy=False)
+    return arr.astype("datetime64[D]").astype(np.int64)
+
+
+def _chronological(buf: np.ndarray, head: int, count: int) -> np.ndarray:
+    """Window of a ring buffer in insertion order (oldest to newest)."""
+    if count < buf.shape[0]:
+        return buf[:count]
+    return np.concatenate((buf[head:], buf[:head]))
+
+
+def _welford_update(
+    mean: float,
+    m2: float,
+    n: int,
+    value: float,
+    old: float | None,
+) -> tuple[float, float]:
+    """
+    One sliding-window Welford step.
+
+    Args:
+        mean: Current mean
+        m2: Current sum of squared deviations
+        n: Window size after the update
+        value: Value being added
+        old: Value being evicted, or None while the window is growing
+
+    Returns:
+        Updated (mean, m2)
+    """
+    if old is None:
+        delta = value - mean
+        mean += delta / n
+        return mean, m2 + delta * (value - mean)
+    delta = value - old
+    new_mean = mean + delta / n
+    return new_mean, m2 + delta * (value - new_mean + old - mean)
+
+
+@dataclass(slots=True)
 class RollingStats:
     """
     Rolling statistics for a single feature.
 
     Maintains a fixed-size window of historical values
     and computes mean/std for z-score normalization.
+
+    Values are kept in a preallocated float64 ring buffer of length
+    `window`; each add overwrites the oldest slot in place. Dates share
+    the ring layout as int64 epoch days and are only converted back to
+    date objects when read through `dates`.
+
+    Mean and sum of squared deviations are updated incrementally
+    (Welford, with a sliding-window replace step), so each add and each
+    mean/std read is O(1). The moments are recomputed exactly from the
+    window once every `window` replacements to bound rounding drift.
     """
 
     feature_name: str
     window: int = ROLLING_WINDOW
     min_observations: int = MIN_OBSERVATIONS
-    _values: deque = field(default_factory=lambda: deque(maxlen=63))
-    _dates: deque = field(default_factory=lambda: deque(maxlen=63))
+    _buf: np.ndarray = field(init=False, repr=False)
+    _head: int = field(default=0, init=False, repr=False)
+    _count: int = field(default=0, init=False, repr=False)
+    _dates: np.ndarray = field(init=False, repr=False)
+    _mean: float = field(default=0.0, init=False, repr=False)
+    _m2: float = field(default=0.0, init=False, repr=False)
+    _replacements: int = field(default=0, init=False, repr=False)
 
     def __post_init__(self) -> None:
-        """Initialize deques with correct maxlen."""
-        self._values = deque(maxlen=self.window)
-        self._dates = deque(maxlen=self.window)
+        """Allocate the value and date ring buffers for the window."""
+        self._buf = np.empty(self.window, dtype=np.float64)
+        self._dates = np.empty(self.window, dtype=np.int64)
 
     def add(self, value: float, trade_date: date) -> None:
         """
@@ -46,8 +113,39 @@ class RollingStats:
             value: Feature value to add
             trade_date: Date of observation
         """
-        self._values.append(value)
-        self._dates.append(trade_date)
+        buf = self._buf
+        head = self._head
+        n = self._count
+
+        if n < self.window:
+            # Growing window: standard Welford step
+            n += 1
+            old = None
+            self._count = n
+        else:
+            # Full window: replace the oldest value (at head) in place
+            old = float(buf[head])
+            self._replacements += 1
+
+        self._mean, self._m2 = _welford_update(self._mean, self._m2, n, value, old)
+
+        buf[head] = value
+        self._dates[head] = trade_date.toordinal() - _EPOCH_ORDINAL
+        self._head = (head + 1) % self.window
+
+        if self._replacements >= self.window:
+            self._recompute()
+
+    def _window_view(self) -> np.ndarray:
+        """Filled part of the buffer (storage order, not chronological)."""
+        return self._buf[: self._count]
+
+    def _recompute(self) -> None:
+        """Recompute the moments exactly from the current window."""
+        arr = self._window_view()
+        self._mean = float(arr.mean()) if arr.size else 0.0
+        self._m2 = float(((arr - self._mean) ** 2).sum()) if arr.size else 0.0
+        self._replacements = 0
 
     def add_bulk(self, values: Sequence[float], dates: Sequence[date]) -> None:
         """
@@ -57,54 +155,101 @@ class RollingStats:
             values: Sequence of values (oldest to newest)
             dates: Corresponding dates
         """
-        for v, d in zip(values, dates, strict=True):
-            self.add(v, d)
+        if len(values) != len(dates):
+            raise ValueError(f"{len(values)} values but {len(dates)} dates")
+        self.add_bulk_np(np.asarray(values, dtype=np.float64), _epoch_days(dates))
+
+    def add_bulk_np(self, values: np.ndarray, dates: np.ndarray) -> None:
+        """
+        Add observations by writing the final window state directly.
+
+        Only the last `window` values (existing window included) survive, so
+        they are laid out oldest-first from slot 0 and the moments are
+        computed exactly from them; no per-observation update runs.
+
+        Args:
+            values: float64 values (oldest to newest)
+            dates: Dates aligned with values (epoch-day int64, datetime64,
+                date objects or ISO strings)
+        """
+        values = np.asarray(values, dtype=np.float64)
+        days = _epoch_days(dates)
+        if values.shape != days.shape:
+            raise ValueError(f"{len(values)} values but {len(days)} dates")
+        if not values.size:
+            return
+
+        if self._count:
+            # Carry the existing window in front of the new values
+            values = np.concatenate(
+                (_chronological(self._buf, self._head, self._count), values)
+            )
+            days = np.concatenate((_chronological(self._dates, self._head, self._count), days))
+
+        keep = values[-self.window :]
+        n = len(keep)
+        self._buf[:n] = keep
+        self._dates[:n] = days[-self.window :]
+        self._count = n
+        self._head = n % self.window
+        self._recompute()
 
     @property
     def count(self) -> int:
         """Number of observations in window."""
-        return len(self._values)
+        return self._count
 
     @property
     def is_ready(self) -> bool:
         """Whether we have enough observations for valid statistics."""
-        return self.count >= self.min_observations
+        return self._count >= self.min_observations
 
     @property
     def mean(self) -> float | None:
         """Rolling mean, or None if insufficient data."""
         if not self.is_ready:
             return None
-        return float(np.mean(list(self._values)))
+        return self._mean
 
     @property
     def std(self) -> float | None:
         """Rolling std (sample), or None if insufficient data."""
         if not self.is_ready:
             return None
-        return float(np.std(list(self._values), ddof=1))
+        n = self._count
+        if n < 2:
+            return math.nan
+        return math.sqrt(max(self._m2, 0.0) / (n - 1))
 
     @property
     def values(self) -> list[float]:
-        """List of values in window."""
-        return list(self._values)
+        """List of values in window (oldest to newest)."""
+        return _chronological(self._buf, self._head, self._count).tolist()
 
     @property
     def dates(self) -> list[date]:
-        """List of dates in window."""
-        return list(self._dates)
+        """List of dates in window (oldest to newest)."""
+        days = _chronological(self._dates, self._head, self._count).tolist()
+        return [date.fromordinal(d + _EPOCH_ORDINAL) for d in days]
 
     def clear(self) -> None:
         """Clear all observations."""
-        self._values.clear()
-        self._dates.clear()
+        self._head = 0
+        self._count = 0
+        self._mean = 0.0
+        self._m2 = 0.0
+        self._replacements = 0
 
 
 class SectorRollingCalculator:
     """
     Manages rolling statistics for all features across all sectors.
 
-    Structure: {ticker: {feature_name: RollingStats}}
+    State is stored column-wise, indexed by (ticker, feature): one
+    (tickers, features, window) ring buffer (with a matching int64 buffer
+    of epoch-day dates) plus per-pair head, count and running mean / sum
+    of squared deviations. Universe-wide reads
+    (means_and_stds, get_zscore_row) are single array expressions.
 
     Each (sector, feature) pair gets its own independent rolling window.
     With 11 sectors and 2 features, this maintains 22 windows.
@@ -128,17 +273,79 @@ class SectorRollingCalculator:
         """
         self.window = window
         self.min_observations = min_observations
-        self._stats: dict[str, dict[str, RollingStats]] = {
-            ticker: {
-                feature: RollingStats(
-                    feature_name=feature,
-                    window=window,
-                    min_observations=min_observations,
-                )
-                for feature in feature_names
-            }
-            for ticker in tickers
-        }
+        self.tickers = tuple(tickers)
+        self.feature_names = tuple(feature_names)
+        self._tidx = {ticker: i for i, ticker in enumerate(self.tickers)}
+        self._fidx = {name: j for j, name in enumerate(self.feature_names)}
+
+        shape = (len(self.tickers), len(self.feature_names))
+        self._buf = np.empty((*shape, window), dtype=np.float64)
+        self._head = np.zeros(shape, dtype=np.intp)
+        self._count = np.zeros(shape, dtype=np.intp)
+        self._replacements = np.zeros(shape, dtype=np.intp)
+        self._mean = np.zeros(shape, dtype=np.float64)
+        self._m2 = np.zeros(shape, dtype=np.float64)
+        self._dates = np.empty((*shape, window), dtype=np.int64)
+
+    def _add(self, i: int, j: int, value: float, trade_date: date) -> None:
+        """Add one observation to pair (i, j); same update as RollingStats.add."""
+        self._dates[i, j, self._head[i, j]] = trade_date.toordinal() - _EPOCH_ORDINAL
+        ring_update(
+            self._buf,
+            self._mean,
+            self._m2,
+            self._count,
+            self._head,
+            self._replacements,
+            i,
+            j,
+            float(value),
+        )
+
+    def _store_dates(self, i: int, j: int, days: np.ndarray) -> None:
+        """Write epoch days for values about to be appended to pair (i, j)."""
+        n = len(days)
+        k = np.arange(max(0, n - self.window), n)
+        self._dates[i, j, (self._head[i, j] + k) % self.window] = days[k]
+
+    def row_indices(self, tickers: Sequence[str] | npt.NDArray[np.object_]) -> np.ndarray:
+        """
+        Map tickers to calculator rows.
+
+        Args:
+            tickers: Sector ETF tickers (a sequence or an object array)
+
+        Returns:
+            intp array aligned with tickers, -1 for untracked tickers
+        """
+        return np.fromiter(
+            (self._tidx.get(ticker, -1) for ticker in tickers), dtype=np.intp, count=len(tickers)
+        )
+
+    def add_matrix(self, trade_date: date, rows: np.ndarray, raw: np.ndarray) -> None:
+        """
+        Add a (sectors, features) matrix of observations.
+
+        Rows are calculator row indices (see row_indices) and columns are in
+        feature_names order. Untracked rows (-1) and NaN cells are skipped.
+
+        Args:
+            trade_date: Date of observation
+            rows: Calculator row index for each raw row
+            raw: Observation values
+        """
+        valid = ~np.isnan(raw) & (rows >= 0)[:, None]
+        r, j = np.nonzero(valid)
+        for i, jj, value in zip(rows[r].tolist(), j.tolist(), raw[r, j].tolist(), strict=True):
+            self._add(i, jj, value, trade_date)
+
+    def _stds(self) -> np.ndarray:
+        """Sample std for every pair (NaN below two observations)."""
+        n = self._count
+        with np.errstate(divide="ignore", invalid="ignore"):
+            stds = np.sqrt(np.maximum(self._m2, 0.0) / (n - 1))
+        stds[n < 2] = np.nan
+        return stds
 
     def add_observation(
         self,
@@ -154,25 +361,47 @@ class SectorRollingCalculator:
             trade_date: Date of observation
             features: Dict of feature name -> value
         """
-        if ticker not in self._stats:
+        i = self._tidx.get(ticker)
+        if i is None:
             return
 
         for name, value in features.items():
-            if name in self._stats[ticker] and value is not None:
-                self._stats[ticker][name].add(value, trade_date)
+            j = self._fidx.get(name)
+            if j is not None and value is not None:
+                self._add(i, j, value, trade_date)
 
     def get_stats(self, ticker: str, feature_name: str) -> RollingStats | None:
         """
         Get rolling stats for a (sector, feature) pair.
 
+        The result is a snapshot: later observations added to the
+        calculator are not reflected in it.
+
         Args:
             ticker: Sector ETF ticker
             feature_name: Name of feature
 
         Returns:
-            RollingStats or None if not tracked
+            RollingStats copy of the pair's window, or None if not tracked
         """
-        return self._stats.get(ticker, {}).get(feature_name)
+        i = self._tidx.get(ticker)
+        j = self._fidx.get(feature_name)
+        if i is None or j is None:
+            return None
+
+        stats = RollingStats(
+            feature_name=feature_name,
+            window=self.window,
+            min_observations=self.min_observations,
+        )
+        stats._buf[:] = self._buf[i, j]
+        stats._head = int(self._head[i, j])
+        stats._count = int(self._count[i, j])
+        stats._dates[:] = self._dates[i, j]
+        stats._mean = float(self._mean[i, j])
+        stats._m2 = float(self._m2[i, j])
+        stats._replacements = int(self._replacements[i, j])
+        return stats
 
     def get_zscore(self, ticker: str, feature_name: str, value: float) -> float | None:
         """
@@ -188,54 +417,240 @@ class SectorRollingCalculator:
         Returns:
             Z-score or None if insufficient history
         """
-        stats = self.get_stats(ticker, feature_name)
-        if stats is None or not stats.is_ready:
+        i = self._tidx.get(ticker)
+        j = self._fidx.get(feature_name)
+        if i is None or j is None:
             return None
 
-        mean = stats.mean
-        std = stats.std
+        n = int(self._count[i, j])
+        if n < self.min_observations:
+            return None
 
-        if mean is None or std is None or std == 0:
+        std = math.sqrt(max(float(self._m2[i, j]), 0.0) / (n - 1)) if n >= 2 else math.nan
+        if std == 0:
             return None
 
         # NO CLIPPING - preserve tail information
-        return (value - mean) / std
+        return (value - float(self._mean[i, j])) / std
+
+    def get_zscore_row(self, ticker: str, values: Mapping[str, float | None]) -> np.ndarray:
+        """
+        Calculate z-scores for all of a sector's features at once.
+
+        IMPORTANT: Z-scores are NOT clipped.
+
+        Args:
+            ticker: Sector ETF ticker
+            values: {feature_name: value}; missing or None values give NaN
+
+        Returns:
+            float64 array in feature_names order, NaN where the value is
+            missing or the baseline is not ready / has zero std
+        """
+        means, stds = self.means_and_stds((ticker,), self.feature_names)
+        row = np.array(
+            [np.nan if values.get(name) is None else values[name] for name in self.feature_names],
+            dtype=np.float64,
+        )
+        return (row - means[0]) / stds[0]
+
+    def means_and_stds(
+        self,
+        tickers: Sequence[str],
+        feature_names: Sequence[str],
+    ) -> tuple[np.ndarray, np.ndarray]:
+        """
+        Collect baseline moments as 2-D arrays.
+
+        Cells for untracked pairs, pairs without sufficient history and
+        pairs with zero std are NaN, so any z-score computed from them is
+        NaN as well.
+
+        Args:
+            tickers: Row order
+            feature_names: Column order
+
+        Returns:
+            Tuple of (means, stds), each shaped (len(tickers), len(feature_names))
+        """
+        stds_all = self._stds()
+        usable = (self._count >= self.min_observations) & (stds_all != 0)
+        means_all = np.where(usable, self._mean, np.nan)
+        stds_all = np.where(usable, stds_all, np.nan)
+
+        shape = (len(tickers), len(feature_names))
+        means = np.full(shape, np.nan)
+        stds = np.full(shape, np.nan)
+
+        rows = self.row_indices(tickers).tolist()
+        cols = [self._fidx.get(name, -1) for name in feature_names]
+        out_rows = [r for r, i in enumerate(rows) if i >= 0]
+        out_cols = [c for c, j in enumerate(cols) if j >= 0]
+        if out_rows and out_cols:
+            src = np.ix_([rows[r] for r in out_rows], [cols[c] for c in out_cols])
+            dst = np.ix_(out_rows, out_cols)
+            means[dst] = means_all[src]
+            stds[dst] = stds_all[src]
+
+        return means, stds
 
     def get_ready_features(self, ticker: str) -> list[str]:
         """Get list of features with sufficient history for a sector."""
-        if ticker not in self._stats:
+        i = self._tidx.get(ticker)
+        if i is None:
             return []
-        return [name for name, stats in self._stats[ticker].items() if stats.is_ready]
+        ready = self._count[i] >= self.min_observations
+        return [name for name, ok in zip(self.feature_names, ready.tolist(), strict=True) if ok]
 
     def get_not_ready_features(self, ticker: str) -> list[str]:
         """Get list of features without sufficient history for a sector."""
-        if ticker not in self._stats:
+        i = self._tidx.get(ticker)
+        if i is None:
             return []
-        return [name for name, stats in self._stats[ticker].items() if not stats.is_ready]
+        ready = self._count[i] >= self.min_observations
+        return [
+            name for name, ok in zip(self.feature_names, ready.tolist(), strict=True) if not ok
+        ]
 
-    def summary(self) -> dict[str, dict[str, dict]]:
+    def summary(self) -> dict[str, dict[str, dict[str, Any]]]:
         """
         Get summary of all rolling statistics.
 
         Returns:
             {ticker: {feature: {count, is_ready, mean, std}}}
         """
-        return {
-            ticker: {
-                name: {
-                    "count": stats.count,
-                    "is_ready": stats.is_ready,
-                    "mean": stats.mean,
-                    "std": stats.std,
+        counts = self._count.tolist()
+        means = self._mean.tolist()
+        stds = self._stds().tolist()
+        summary: dict[str, dict[str, dict[str, Any]]] = {}
+        for i, ticker in enumerate(self.tickers):
+            features: dict[str, dict[str, Any]] = {}
+            for j, name in enumerate(self.feature_names):
+                is_ready = counts[i][j] >= self.min_observations
+                features[name] = {
+                    "count": counts[i][j],
+                    "is_ready": is_ready,
+                    "mean": means[i][j] if is_ready else None,
+                    "std": stds[i][j] if is_ready else None,
                 }
-                for name, stats in features.items()
-            }
-            for ticker, features in self._stats.items()
-        }
+            summary[ticker] = features
+        return summary
+
+    def load_from_arrays(
+        self,
+        ticker: str,
+        dates: Sequence[date | str] | np.ndarray,
+        features: Mapping[str, np.ndarray],
+    ) -> int:
+        """
+        Load one sector's history from column arrays.
+
+        NaN entries are skipped per feature, so a feature missing on a
+        given day does not affect the others.
+
+        Args:
+            ticker: Sector ETF ticker
+            dates: Observation dates (oldest to newest)
+            features: {feature_name: float array aligned with dates}
+
+        Returns:
+            Number of observations (rows) loaded, 0 if ticker is not tracked
+        """
+        i = self._tidx.get(ticker)
+        if i is None:
+            return 0
+
+        days = _epoch_days(dates)
+        for name, values in features.items():
+            j = self._fidx.get(name)
+            if j is None:
+                continue
+            values = np.asarray(values, dtype=np.float64)
+            valid = ~np.isnan(values)
+            self._store_dates(i, j, days[valid])
+            ring_update_many(
+                self._buf,
+                self._mean,
+                self._m2,
+                self._count,
+                self._head,
+                self._replacements,
+                i,
+                j,
+                np.ascontiguousarray(values[valid]),
+            )
+
+        return len(days)
+
+    def load_from_columns(
+        self,
+        tickers: Sequence[str] | np.ndarray,
+        dates: Sequence[date | str] | np.ndarray,
+        features: Mapping[str, np.ndarray],
+    ) -> int:
+        """
+        Load every sector's history from long-format column arrays.
+
+        Rows keep their order within each sector, and NaN entries are
+        skipped per feature as in load_from_arrays. All (sector, feature)
+        series are then loaded in one kernel call, in parallel when numba
+        is installed.
+
+        Args:
+            tickers: Sector ETF ticker for each row
+            dates: Observation date for each row (oldest to newest per sector)
+            features: {feature_name: float array aligned with rows}
+
+        Returns:
+            Number of rows loaded for tracked tickers
+        """
+        rows = self.row_indices(tickers)
+        order = np.argsort(rows, kind="stable")
+        order = order[rows[order] >= 0]
+        rows = rows[order]
+        days = _epoch_days(dates)[order]
+
+        pair_rows: list[int] = []
+        pair_cols: list[int] = []
+        chunks: list[np.ndarray] = []
+        starts = [0]
+        for name, values in features.items():
+            j = self._fidx.get(name)
+            if j is None:
+                continue
+            values = np.asarray(values, dtype=np.float64)[order]
+            valid = ~np.isnan(values)
+            r, v, d = rows[valid], values[valid], days[valid]
+            bounds = [0, *(np.flatnonzero(np.diff(r)) + 1).tolist(), len(r)]
+            for a, b in zip(bounds[:-1], bounds[1:], strict=True):
+                if b == a:
+                    continue
+                i = int(r[a])
+                pair_rows.append(i)
+                pair_cols.append(j)
+                chunks.append(v[a:b])
+                starts.append(starts[-1] + b - a)
+                self._store_dates(i, j, d[a:b])
+
+        if chunks:
+            ring_update_pairs(
+                self._buf,
+                self._mean,
+                self._m2,
+                self._count,
+                self._head,
+                self._replacements,
+                np.array(pair_rows, dtype=np.intp),
+                np.array(pair_cols, dtype=np.intp),
+                np.array(starts, dtype=np.intp),
+                np.concatenate(chunks),
+            )
+
+        return len(order)
 
     def load_from_history(
         self,
-        history: dict[str, list[dict]],
+        history: dict[str, list[dict[str, Any]]],
         date_key: str = "date",
     ) -> int:
         """
@@ -250,21 +665,20 @@ class SectorRollingCalculator:
         """
         count = 0
         for ticker, records in history.items():
-            if ticker not in self._stats:
+            if ticker not in self._tidx:
                 continue
 
-            for record in records:
-                trade_date = record.get(date_key)
-                if trade_date is None:
-                    continue
-
-                # Convert string date if needed
-                if isinstance(trade_date, str):
-                    trade_date = date.fromisoformat(trade_date)
-
-                features = {k: v for k, v in record.items() if k != date_key and v is not None}
-                self.add_observation(ticker, trade_date, features)
-                count += 1
+            # Dates (date objects or ISO strings) are parsed as one array;
+            # missing feature values become NaN and are skipped by the loader
+            records = [record for record in records if record.get(date_key) is not None]
+            count += self.load_from_arrays(
+                ticker,
+                [record[date_key] for record in records],
+                {
+                    name: np.array([record.get(name) for record in records], dtype=np.float64)
+                    for name in self.feature_names
+                },
+            )
 
         logger.info(f"Loaded {count} historical observations across sectors")
         return count
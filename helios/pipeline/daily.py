@@ -12,16 +12,21 @@ Orchestrates the full daily calculation:
 
 import asyncio
 import logging
+from collections.abc import Mapping, Sequence
+from concurrent.futures import ThreadPoolExecutor
 from datetime import date, timedelta
 from pathlib import Path
+from typing import Any
 
+import numpy as np
 import pandas as pd
+import pyarrow as pa
 
 from helios.core.config import Settings, get_settings
 from helios.core.constants import BENCHMARK_TICKER, SECTOR_UNIVERSE
 from helios.core.types import HeliosResult, SectorFeatureSet
-from helios.explain.generator import ExplanationGenerator
-from helios.features.aggregator import FeatureAggregator
+from helios.explain.generator import default_generator
+from helios.features.aggregator import default_aggregator
 from helios.ingest.polygon import PolygonETFClient
 from helios.ingest.unusual_whales import UnusualWhalesClient
 from helios.normalization.pipeline import NormalizationPipeline
@@ -29,6 +34,74 @@ from helios.scoring.engine import HeliosEngine
 
 logger = logging.getLogger(__name__)
 
+# Columns of helios_history.parquet, in file order
+_HISTORY_FIELDS = (
+    "date",
+    "ticker",
+    "allocation_score",
+    "state",
+    "ap_zscore",
+    "rs_zscore",
+    "ap_raw",
+    "rs_raw",
+    "explanation",
+    "status",
+)
+
+
+def _as_days(values: Sequence[date] | pd.Series) -> np.ndarray:
+    """Convert dates to datetime64[D] through Arrow (no per-element Python)."""
+    return pa.array(values).to_numpy(zero_copy_only=False).astype("datetime64[D]")
+
+
+def _align_to_dates(
+    frames: Mapping[str, pd.DataFrame],
+    tickers: Sequence[str],
+    trading_dates: Sequence[date],
+    columns: Sequence[str],
+) -> tuple[dict[str, np.ndarray], np.ndarray]:
+    """
+    Align per-ticker frames on a common trading-date axis.
+
+    Rows on dates outside trading_dates are ignored; for repeated dates
+    the first row is used.
+
+    Args:
+        frames: {ticker: DataFrame with a date column and the given columns}
+        tickers: Column order of the output matrices
+        trading_dates: Row order of the output matrices (sorted ascending)
+        columns: Frame columns to extract
+
+    Returns:
+        ({column: float64 matrix [dates, tickers]}, present mask [dates, tickers]);
+        cells without a row are NaN and False in the mask
+    """
+    shape = (len(trading_dates), len(tickers))
+    matrices = {column: np.full(shape, np.nan) for column in columns}
+    present = np.zeros(shape, dtype=bool)
+    if not trading_dates:
+        return matrices, present
+    axis = _as_days(trading_dates)
+    last = len(axis) - 1
+
+    for s, ticker in enumerate(tickers):
+        df = frames.get(ticker)
+        if df is None or df.empty:
+            continue
+        # Match dates with one binary search per frame instead of a dict
+        # lookup per row
+        days = _as_days(df["date"])
+        pos = np.minimum(np.searchsorted(axis, days), last)
+        idx = np.flatnonzero(axis[pos] == days)
+        # First row wins on repeated dates
+        rows, first = np.unique(pos[idx], return_index=True)
+        src = idx[first]
+        present[rows, s] = True
+        for column in columns:
+            matrices[column][rows, s] = df[column].to_numpy(dtype=np.float64)[src]
+
+    return matrices, present
+
 
 class DailyPipeline:
     """
@@ -59,11 +132,11 @@ class DailyPipeline:
         self.output_dir.mkdir(parents=True, exist_ok=True)
 
         # Initialize components
-        self.feature_aggregator = FeatureAggregator()
+        self.feature_aggregator = default_aggregator
         self.normalization = NormalizationPipeline(
             history_dir=self.output_dir,
         )
-        self.explanation_gen = ExplanationGenerator()
+        self.explanation_gen = default_generator
         self.engine = HeliosEngine(normalization_pipeline=self.normalization)
 
     async def run(
@@ -95,10 +168,10 @@ class DailyPipeline:
         uw_flows = await self._fetch_uw_flows(trade_date)
 
         # Step 2: Process ALL historical days to build rolling baselines
-        result = self._process_all_days(prices, trade_date, uw_flows)
+        result, history = self._process_all_days(prices, trade_date, uw_flows)
 
         # Step 3: Persist
-        self._save_result(result)
+        self._save_outputs(result, history)
 
         logger.info(
             f"HELIOS for {trade_date}: "
@@ -170,10 +243,10 @@ class DailyPipeline:
         prices: dict[str, pd.DataFrame],
         trade_date: date,
         uw_flows: dict[str, pd.DataFrame] | None = None,
-    ) -> HeliosResult:
+    ) -> tuple[HeliosResult, dict[str, list[Any]]]:
         """
         Process all available historical days to build rolling baselines,
-        saving every day's result to history.
+        collecting every day's result as history.
 
         Uses Unusual Whales fund flow data for AP when available,
         falls back to Polygon dollar volume proxy otherwise.
@@ -184,20 +257,31 @@ class DailyPipeline:
             uw_flows: {ticker: DataFrame[date, net_flow]} from UW (optional)
 
         Returns:
-            HeliosResult for the target date
+            Tuple of (HeliosResult for the target date, history columns
+            keyed by _HISTORY_FIELDS; empty lists when no day was scored)
         """
+        # History is collected column-wise (one list per field), not as a
+        # dict per row
+        history: dict[str, list[Any]] = {name: [] for name in _HISTORY_FIELDS}
+
         if uw_flows is None:
             uw_flows = {}
         # Collect all unique trading dates across all tickers
         spy_df = prices.get(BENCHMARK_TICKER)
         if spy_df is None or len(spy_df) < 2:
             logger.error("No SPY data available")
-            return self.engine.calculate_all(
+            result = self.engine.calculate_all(
                 all_features={},
                 explanation_generator=self.explanation_gen,
             )
-
-        trading_dates = sorted(spy_df["date"].tolist())
+            return result, history
+
+        # SPY defines the trading calendar (one entry per date, so every
+        # (date, ticker) history row is produced once); returns are positional
+        spy_sorted = spy_df.drop_duplicates(subset="date").sort_values("date", kind="stable")
+        trading_dates = spy_sorted["date"].tolist()
+        spy_close = spy_sorted["close"].to_numpy(dtype=np.float64)
+        spy_returns = spy_close[1:] / spy_close[:-1] - 1
         ap_source = "UW fund flow" if uw_flows else "Polygon proxy"
         logger.info(
             f"Processing {len(trading_dates)} trading days for baseline "
@@ -205,94 +289,67 @@ class DailyPipeline:
         )
 
         result = None
-        all_rows: list[dict] = []
+
+        # Align every sector series on the SPY trading dates once; each day below
+        # then reads one matrix row instead of filtering every DataFrame
+        tickers = SECTOR_UNIVERSE
+        px, has_px = _align_to_dates(prices, tickers, trading_dates, ("open", "close", "volume"))
+        uw, has_uw = _align_to_dates(uw_flows, tickers, trading_dates, ("net_flow",))
+
+        # DollarFlow = Volume * (Close - Open); UW fund flow preferred where present.
+        # Sectors without a Polygon price series are skipped entirely.
+        flows = np.where(has_uw, uw["net_flow"], px["volume"] * (px["close"] - px["open"]))
+        has_prices = np.array([prices.get(ticker) is not None for ticker in tickers])
+        has_flow = (has_uw | has_px) & has_prices
+        returns = px["close"][1:] / px["close"][:-1] - 1
+        has_return = has_px[1:] & has_px[:-1]
+
+        # Raw (AP, RS) features for every scored day (day 0 has no prior
+        # close for returns); row i - 1 belongs to trading_dates[i]
+        features = self.feature_aggregator.calculate_matrix(
+            flows=np.where(has_flow, flows, np.nan)[1:],
+            returns=np.where(has_return, returns, np.nan),
+            spy_returns=spy_returns,
+        )
+
+        # Only the last day (the returned result) gets explanations and
+        # per-sector logging; earlier days just feed the rolling baselines
+        last = len(trading_dates) - 1
 
         # Process each day sequentially (day 0 has no prior close for returns)
         for i, day in enumerate(trading_dates):
             if i == 0:
                 continue  # Need prior day for returns
-
-            prior_day = trading_dates[i - 1]
-
-            # SPY return for this day
-            spy_today = spy_df[spy_df["date"] == day]
-            spy_prior = spy_df[spy_df["date"] == prior_day]
-            if spy_today.empty or spy_prior.empty:
-                continue
-            spy_return = float(spy_today.iloc[0]["close"]) / float(spy_prior.iloc[0]["close"]) - 1
-
-            # Per-sector features
-            sector_flows: dict[str, float | None] = {}
-            sector_returns: dict[str, float | None] = {}
-
-            for ticker in SECTOR_UNIVERSE:
-                df = prices.get(ticker)
-                if df is None:
-                    continue
-
-                row_today = df[df["date"] == day]
-                row_prior = df[df["date"] == prior_day]
-
-                # AP: prefer UW fund flow, fall back to Polygon proxy
-                uw_df = uw_flows.get(ticker)
-                if uw_df is not None and not uw_df.empty:
-                    uw_row = uw_df[uw_df["date"] == day]
-                    if not uw_row.empty:
-                        sector_flows[ticker] = float(uw_row.iloc[0]["net_flow"])
-                    elif not row_today.empty:
-                        r = row_today.iloc[0]
-                        sector_flows[ticker] = float(r["volume"]) * (
-                            float(r["close"]) - float(r["open"])
-                        )
-                elif not row_today.empty:
-                    r = row_today.iloc[0]
-                    # DollarFlow = Volume * (Close - Open)
-                    sector_flows[ticker] = float(r["volume"]) * (
-                        float(r["close"]) - float(r["open"])
-                    )
-
-                # RS: daily return from Polygon prices
-                if not row_today.empty and not row_prior.empty:
-                    sector_returns[ticker] = (
-                        float(row_today.iloc[0]["close"])
-                        / float(row_prior.iloc[0]["close"])
-                        - 1
-                    )
-
-            all_features = self.feature_aggregator.calculate_all(
-                trade_date=day,
-                flows=sector_flows,
-                returns=sector_returns,
-                spy_return=spy_return,
-            )
+            explain = i == last
 
             # Score (this feeds the rolling normalization window)
-            result = self.engine.calculate_all(
-                all_features=all_features,
+            result = self.engine.calculate_all_vectorized(
+                features_matrix=features[i - 1],
+                tickers=tickers,
+                trade_date=day,
                 explanation_generator=self.explanation_gen,
+                explain=explain,
             )
 
-            # Collect rows for history
-            for sector in result.sectors:
-                all_rows.append({
-                    "date": result.trade_date.isoformat(),
-                    "ticker": sector.ticker,
-                    "allocation_score": sector.allocation_score,
-                    "state": sector.state.value,
-                    "ap_zscore": sector.ap_zscore,
-                    "rs_zscore": sector.rs_zscore,
-                    "ap_raw": sector.ap_raw,
-                    "rs_raw": sector.rs_raw,
-                    "explanation": sector.explanation,
-                    "status": sector.status.value,
-                })
+            # Collect history columns (explanations only for the last day)
+            sectors = result.sectors
+            history["date"].extend([result.trade_date] * len(sectors))
+            history["ticker"].extend([r.ticker for r in sectors])
+            history["allocation_score"].extend([r.allocation_score for r in sectors])
+            history["state"].extend([r.state.value for r in sectors])
+            history["ap_zscore"].extend([r.ap_zscore for r in sectors])
+            history["rs_zscore"].extend([r.rs_zscore for r in sectors])
+            history["ap_raw"].extend([r.ap_raw for r in sectors])
+            history["rs_raw"].extend([r.rs_raw for r in sectors])
+            history["explanation"].extend(
+                [r.explanation for r in sectors] if explain else [None] * len(sectors)
+            )
+            history["status"].extend([r.status.value for r in sectors])
 
             if day == trade_date:
-                logger.info(f"Target date {trade_date} reached — SPY return: {spy_return:.4f}")
-
-        # Save full history
-        if all_rows:
-            self._save_history(all_rows)
+                logger.info(
+                    f"Target date {trade_date} reached — SPY return: {spy_returns[i - 1]:.4f}"
+                )
 
         if result is None:
             result = self.engine.calculate_all(
@@ -300,24 +357,46 @@ class DailyPipeline:
                 explanation_generator=self.explanation_gen,
             )
 
-        return result
+        return result, history
 
-    def _save_history(self, rows: list[dict]) -> None:
-        """Save all collected daily rows to history parquet."""
-        df = pd.DataFrame(rows)
+    def _save_outputs(self, result: HeliosResult, history: dict[str, list[Any]]) -> None:
+        """
+        Save the history parquet and the daily snapshot parquet.
+
+        The result is the last day processed, so its rows are the tail of
+        history; the snapshot is sliced from the same DataFrame rather than
+        rebuilt.
+
+        Args:
+            result: HeliosResult to persist
+            history: {field: values} columns of equal length (_HISTORY_FIELDS)
+        """
+        daily_file = self.output_dir / f"{result.trade_date.isoformat()}.parquet"
+        if not history["date"]:
+            self._save_result(result, daily_file)
+            return
+
+        # Rows are unique per (date, ticker) by construction, so no dedupe;
+        # date objects are stored as DATE32 so readers can push filters down
+        df = pd.DataFrame(history)
         history_file = self.output_dir / "helios_history.parquet"
-        df = df.drop_duplicates(subset=["date", "ticker"], keep="last")
         df.to_parquet(history_file, index=False)
         logger.info(
             f"Saved {len(df)} rows ({df['date'].nunique()} days) to {history_file}"
         )
 
-    def _save_result(self, result: HeliosResult) -> None:
+        # Snapshot keeps its original schema: ISO date strings, no explanation
+        daily = df.iloc[len(df) - len(result.sectors):].drop(columns="explanation")
+        daily["date"] = result.trade_date.isoformat()
+        daily.to_parquet(daily_file, index=False)
+
+    def _save_result(self, result: HeliosResult, daily_file: Path) -> None:
         """
-        Save daily snapshot parquet (history is saved by _save_history).
+        Save daily snapshot parquet built from the result alone.
 
         Args:
             result: HeliosResult to persist
+            daily_file: Snapshot path
         """
         rows = []
         for sector in result.sectors:
@@ -333,7 +412,6 @@ class DailyPipeline:
                 "status": sector.status.value,
             })
 
-        daily_file = self.output_dir / f"{result.trade_date.isoformat()}.parquet"
         pd.DataFrame(rows).to_parquet(daily_file, index=False)
 
     def get_history(
@@ -378,6 +456,11 @@ def run_daily_sync(
     """
     Synchronous wrapper for daily pipeline.
 
+    Without a running event loop this is asyncio.run. Called from a thread
+    that is already running one (a notebook or async server), where
+    asyncio.run and run_until_complete both raise, the pipeline runs on a
+    fresh loop in a worker thread and this call blocks until it finishes.
+
     Args:
         trade_date: Date to calculate for
         force_refresh: Force data refresh
@@ -386,4 +469,10 @@ def run_daily_sync(
         HeliosResult
     """
     pipeline = DailyPipeline()
-    return asyncio.run(pipeline.run(trade_date, force_refresh))
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        return asyncio.run(pipeline.run(trade_date, force_refresh))
+
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        return executor.submit(asyncio.run, pipeline.run(trade_date, force_refresh)).result()
@@ -1,11 +1,19 @@
 """HELIOS ETF FLOW scoring layer."""
 
-from helios.scoring.classifier import classify_state
-from helios.scoring.composite import calculate_cas
+from helios.scoring.classifier import (
+    classify_state,
+    classify_state_batch,
+    classify_state_vector,
+)
+from helios.scoring.composite import calculate_cas, calculate_cas_batch, calculate_cas_fast
 from helios.scoring.engine import HeliosEngine
 
 __all__ = [
     "HeliosEngine",
     "calculate_cas",
+    "calculate_cas_batch",
+    "calculate_cas_fast",
     "classify_state",
+    "classify_state_batch",
+    "classify_state_vector",
 ]
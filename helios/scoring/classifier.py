@@ -7,6 +7,8 @@ Thresholds operate directly in z-score space (NOT percentile).
 GUARDRAIL: States describe allocation direction, NOT trading signals.
 """
 
+import numpy as np
+
 from helios.core.types import AllocationState
 
 
@@ -30,3 +32,37 @@ def classify_state(cas: float) -> AllocationState:
     GUARDRAIL: This describes allocation direction, NOT a trading signal.
     """
     return AllocationState.from_cas(cas)
+
+
+def classify_state_vector(cas: np.ndarray) -> np.ndarray:
+    """
+    Classify an array of CAS values into integer state codes.
+
+    Same FROZEN thresholds and boundary handling as classify_state, done
+    with two np.searchsorted calls over the sorted thresholds instead of
+    a comparison chain per value.
+
+    Args:
+        cas: Array of Composite Allocation Scores
+
+    Returns:
+        int8 array of state codes (0 = UNDERWEIGHT ... 4 = OVERWEIGHT,
+        see AllocationState.from_code), same shape as input
+    """
+    return AllocationState.codes_from_cas_array(cas)
+
+
+def classify_state_batch(cas: np.ndarray) -> np.ndarray:
+    """
+    Classify an array of CAS values into AllocationState values.
+
+    Array counterpart of classify_state: codes from classify_state_vector
+    index a fixed state lookup table, so there is no per-value branching.
+
+    Args:
+        cas: Array of Composite Allocation Scores
+
+    Returns:
+        Object array of AllocationState values, same shape as input
+    """
+    return AllocationState.from_cas_array(cas)
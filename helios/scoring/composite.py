@@ -8,10 +8,16 @@ Weights are FROZEN conceptual allocations, NOT optimized parameters.
 
 import logging
 
+import numpy as np
+import numpy.typing as npt
+
 from helios.core.constants import WEIGHTS
 
 logger = logging.getLogger(__name__)
 
+_AP_WEIGHT = WEIGHTS["AP"]
+_RS_WEIGHT = WEIGHTS["RS"]
+
 
 def calculate_cas(z_scores: dict[str, float]) -> float:
     """
@@ -39,3 +45,50 @@ def calculate_cas(z_scores: dict[str, float]) -> float:
         weighted_sum += weight * z
 
     return weighted_sum
+
+
+def calculate_cas_fast(ap_zscore: float, rs_zscore: float) -> float:
+    """
+    Calculate CAS from positional z-scores.
+
+    Same result as calculate_cas({"AP": ap_zscore, "RS": rs_zscore}),
+    without building a dict; a NaN z-score marks the feature as missing.
+
+    Args:
+        ap_zscore: AP z-score, or NaN if excluded
+        rs_zscore: RS z-score, or NaN if excluded
+
+    Returns:
+        CAS value (unbounded -- lives in z-score space)
+    """
+    weighted_sum = 0.0
+    if ap_zscore == ap_zscore:  # not NaN
+        weighted_sum += _AP_WEIGHT * ap_zscore
+    if rs_zscore == rs_zscore:
+        weighted_sum += _RS_WEIGHT * rs_zscore
+    return weighted_sum
+
+
+def calculate_cas_batch(
+    ap_zscores: npt.ArrayLike, rs_zscores: npt.ArrayLike
+) -> npt.NDArray[np.float64]:
+    """
+    Calculate CAS for many sectors at once.
+
+    Elementwise equivalent of calculate_cas_fast: a NaN z-score marks the
+    feature as missing and contributes nothing (no rescaling).
+
+    Args:
+        ap_zscores: AP z-scores, NaN where excluded
+        rs_zscores: RS z-scores, NaN where excluded
+
+    Returns:
+        Array of CAS values (unbounded -- lives in z-score space)
+    """
+    ap = np.asarray(ap_zscores, dtype=np.float64)
+    rs = np.asarray(rs_zscores, dtype=np.float64)
+
+    weighted_sum = np.zeros(np.broadcast_shapes(ap.shape, rs.shape))
+    weighted_sum += np.where(np.isnan(ap), 0.0, _AP_WEIGHT * ap)
+    weighted_sum += np.where(np.isnan(rs), 0.0, _RS_WEIGHT * rs)
+    return weighted_sum
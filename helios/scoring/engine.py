@@ -13,8 +13,12 @@ It does NOT generate signals, alerts, or trading recommendations.
 """
 
 import logging
+from collections.abc import Sequence
 from datetime import date
 
+import numpy as np
+
+from helios.core.constants import FEATURE_NAMES
 from helios.core.types import (
     AllocationState,
     BaselineStatus,
@@ -23,12 +27,15 @@ from helios.core.types import (
     SectorResult,
 )
 from helios.explain.generator import ExplanationGenerator
-from helios.normalization.pipeline import NormalizationPipeline
-from helios.scoring.classifier import classify_state
-from helios.scoring.composite import calculate_cas
+from helios.normalization.pipeline import NormalizationPipeline, feature_matrix
+from helios.scoring.classifier import classify_state, classify_state_vector
+from helios.scoring.composite import calculate_cas, calculate_cas_batch
 
 logger = logging.getLogger(__name__)
 
+# Column of each feature in the (sectors, features) matrices
+_FEATURE_INDEX = {name: j for j, name in enumerate(FEATURE_NAMES)}
+
 
 class HeliosEngine:
     """
@@ -113,6 +120,7 @@ class HeliosEngine:
         self,
         all_features: dict[str, SectorFeatureSet],
         explanation_generator: ExplanationGenerator | None = None,
+        explain: bool = True,
     ) -> HeliosResult:
         """
         Calculate allocation states for all sectors.
@@ -120,25 +128,128 @@ class HeliosEngine:
         Args:
             all_features: {ticker: SectorFeatureSet}
             explanation_generator: Optional generator for text output
+            explain: Generate explanations and log per-sector results; pass
+                False for days that only feed the rolling baselines
 
         Returns:
             HeliosResult with all sector results
         """
+        trade_date = next(iter(all_features.values())).trade_date if all_features else None
+        return self.calculate_all_vectorized(
+            features_matrix=feature_matrix(list(all_features.values())),
+            tickers=list(all_features),
+            trade_date=trade_date,
+            explanation_generator=explanation_generator,
+            explain=explain,
+        )
+
+    def calculate_all_vectorized(
+        self,
+        features_matrix: np.ndarray,
+        tickers: Sequence[str],
+        trade_date: date | None,
+        explanation_generator: ExplanationGenerator | None = None,
+        explain: bool = True,
+    ) -> HeliosResult:
+        """
+        Calculate allocation states for all sectors from a feature matrix.
+
+        Normalization, CAS and classification run as array operations over
+        all sectors; SectorResult objects are only built at the end.
+
+        Args:
+            features_matrix: (sectors, features) raw values, columns in
+                FEATURE_NAMES order (AP, RS); NaN = missing
+            tickers: Sector ETF ticker for each row
+            trade_date: Date of the features (default: today)
+            explanation_generator: Optional generator for text output
+            explain: Generate explanations and log per-sector results; when
+                False the explanation is the state description
+
+        Returns:
+            HeliosResult with all sector results
+        """
+        raw = np.asarray(features_matrix, dtype=np.float64)
+
+        # Step 1: Normalize features (z-scores, NO clipping); NaN = excluded
+        z = self.pipeline.zscore_matrix(tickers, raw)
+        valid = ~np.isnan(z)
+        n_valid = valid.sum(axis=1)
+
+        # Step 2: CAS (NaN z-scores contribute nothing)
+        cas = calculate_cas_batch(z[:, _FEATURE_INDEX["AP"]], z[:, _FEATURE_INDEX["RS"]])
+
+        # Step 3: Classify state (NEUTRAL when no feature has a baseline)
+        insufficient = n_valid == 0
+        codes = classify_state_vector(cas)
+        codes[insufficient] = AllocationState.NEUTRAL.code
+
+        # Step 5: Update rolling history
+        if trade_date is not None:
+            self.pipeline.add_observations(trade_date, tickers, raw)
+
+        # Materialize results (Step 4, explanations, is per sector)
+        n_features = len(FEATURE_NAMES)
+        z_filled = np.where(valid, z, 0.0)
+        raw_filled = np.nan_to_num(raw, nan=0.0)
+        ap, rs = _FEATURE_INDEX["AP"], _FEATURE_INDEX["RS"]
         sector_results: list[SectorResult] = []
-        trade_date: date | None = None
+        generator = explanation_generator if explain else None
+        log_sectors = explain and logger.isEnabledFor(logging.INFO)
 
-        for ticker, features in all_features.items():
-            if trade_date is None:
-                trade_date = features.trade_date
+        for ticker, score, code, count, z_row, valid_row, raw_row in zip(
+            tickers,
+            cas.tolist(),
+            codes.tolist(),
+            n_valid.tolist(),
+            z_filled.tolist(),
+            valid.tolist(),
+            raw_filled.tolist(),
+            strict=True,
+        ):
+            state = AllocationState.from_code(code)
+            if count == n_features:
+                status = BaselineStatus.COMPLETE
+            elif count > 0:
+                status = BaselineStatus.PARTIAL
+            else:
+                status = BaselineStatus.INSUFFICIENT
+            excluded = [name for name, ok in zip(FEATURE_NAMES, valid_row, strict=True) if not ok]
 
-            result = self.calculate_sector(features, explanation_generator)
-            sector_results.append(result)
+            if generator:
+                explanation = generator.generate(
+                    ticker=ticker,
+                    state=state,
+                    ap_zscore=z_row[ap] if valid_row[ap] else None,
+                    rs_zscore=z_row[rs] if valid_row[rs] else None,
+                    excluded=excluded,
+                    status=status,
+                )
+            else:
+                explanation = state.description
 
-            logger.info(
-                f"{ticker}: CAS={result.allocation_score:+.2f} "
-                f"({result.state.value}) "
-                f"AP={result.ap_zscore:+.2f} RS={result.rs_zscore:+.2f}"
+            result = SectorResult(
+                ticker=ticker,
+                allocation_score=score,
+                state=state,
+                explanation=explanation,
+                ap_zscore=z_row[ap],
+                rs_zscore=z_row[rs],
+                ap_raw=raw_row[ap],
+                rs_raw=raw_row[rs],
+                status=status,
             )
+            sector_results.append(result)
+
+            if log_sectors:
+                logger.info(
+                    "%s: CAS=%+.2f (%s) AP=%+.2f RS=%+.2f",
+                    ticker,
+                    result.allocation_score,
+                    result.state.value,
+                    result.ap_zscore,
+                    result.rs_zscore,
+                )
 
         # Determine overall baseline status
         statuses = [r.status for r in sector_results]
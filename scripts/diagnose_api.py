@@ -11,48 +11,82 @@ import asyncio
 import logging
 import sys
 
-from helios.core.config import get_settings
+import httpx
+
+from helios.core.config import Settings, get_settings
 from helios.ingest.polygon import PolygonETFClient
 from helios.ingest.unusual_whales import UnusualWhalesClient
 
+# Upper bound per probe, so one hung provider cannot stall the run
+HEALTH_CHECK_TIMEOUT = 5.0
+
+# (provider, ok, error detail)
+CheckResult = tuple[str, bool, str | None]
+
+
+async def _probe(
+    label: str,
+    client_cls: type[PolygonETFClient] | type[UnusualWhalesClient],
+    settings: Settings,
+    http: httpx.AsyncClient,
+) -> CheckResult:
+    """Run one provider's health check on the shared connection pool."""
+    async with client_cls(settings=settings, http_client=http) as client:
+        try:
+            async with asyncio.timeout(HEALTH_CHECK_TIMEOUT):
+                ok = await client.health_check()
+        except TimeoutError:
+            return label, False, f"timeout after {HEALTH_CHECK_TIMEOUT:g}s"
+    return label, ok, None
+
+
+def _mask(key: str) -> str:
+    """Show only the ends of an API key."""
+    return f"{key[:8]}...{key[-4:]}"
 
-async def diagnose() -> bool:
-    """Run API diagnostics."""
-    settings = get_settings()
-    all_ok = True
 
+def _print_check(result: CheckResult | BaseException) -> bool:
+    """Print one health check line; returns whether it passed."""
+    if isinstance(result, BaseException):
+        print(f"  Health Check: ERROR - {result}")
+        return False
+    _, ok, detail = result
+    if detail:
+        print(f"  Health Check: ERROR - {detail}")
+        return False
+    print(f"  Health Check: {'OK' if ok else 'FAIL'}")
+    return ok
+
+
+async def diagnose(settings: Settings) -> bool:
+    """
+    Run API diagnostics (all providers probed concurrently).
+
+    Args:
+        settings: Application settings, resolved once by the caller
+    """
+
+    # One connection pool for every provider, closed once at the end
+    limits = httpx.Limits(max_connections=16, keepalive_expiry=60.0)
+    async with httpx.AsyncClient(timeout=30.0, limits=limits) as http:
+        checks = [_probe("Polygon.io", PolygonETFClient, settings, http)]
+        if settings.uw_api_key:
+            checks.append(_probe("Unusual Whales", UnusualWhalesClient, settings, http))
+        results = await asyncio.gather(*checks, return_exceptions=True)
+
+    # Report in fixed provider order once every probe has finished
     print("=" * 50)
     print("HELIOS ETF FLOW - API Diagnostics")
     print("=" * 50)
 
-    # Check Polygon
     print("\n[Polygon.io]")
-    print(f"  API Key: {settings.polygon_key[:8]}...{settings.polygon_key[-4:]}")
-    try:
-        async with PolygonETFClient(settings=settings) as client:
-            ok = await client.health_check()
-            status = "OK" if ok else "FAIL"
-            print(f"  Health Check: {status}")
-            if not ok:
-                all_ok = False
-    except Exception as e:
-        print(f"  Health Check: ERROR - {e}")
-        all_ok = False
-
-    # Check Unusual Whales
+    print(f"  API Key: {_mask(settings.polygon_key)}")
+    all_ok = _print_check(results[0])
+
     print("\n[Unusual Whales]")
     if settings.uw_api_key:
-        print(f"  API Key: {settings.uw_api_key[:8]}...{settings.uw_api_key[-4:]}")
-        try:
-            async with UnusualWhalesClient(settings=settings) as client:
-                ok = await client.health_check()
-                status = "OK" if ok else "FAIL"
-                print(f"  Health Check: {status}")
-                if not ok:
-                    all_ok = False
-        except Exception as e:
-            print(f"  Health Check: ERROR - {e}")
-            all_ok = False
+        print(f"  API Key: {_mask(settings.uw_api_key)}")
+        all_ok = _print_check(results[1]) and all_ok
     else:
         print("  API Key: NOT CONFIGURED (using Polygon flow proxy)")
 
@@ -67,7 +101,7 @@ async def diagnose() -> bool:
 def main() -> None:
     """Entry point."""
     logging.basicConfig(level=logging.WARNING)
-    ok = asyncio.run(diagnose())
+    ok = asyncio.run(diagnose(get_settings()))
     sys.exit(0 if ok else 1)
 
 
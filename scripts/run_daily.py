@@ -11,10 +11,20 @@ import argparse
 import asyncio
 import logging
 import sys
+from collections import Counter
+from collections.abc import Mapping
 from datetime import date
+from functools import cache
 
-from helios.core.constants import SECTOR_NAMES
-from helios.pipeline.daily import DailyPipeline
+import orjson
+
+
+@cache
+def _display_names() -> Mapping[str, str]:
+    """Ticker -> display name for the sector universe, built once per process."""
+    from helios.core.constants import SECTOR_NAMES, SECTOR_UNIVERSE
+
+    return {ticker: SECTOR_NAMES.get(ticker, ticker) for ticker in SECTOR_UNIVERSE}
 
 
 def main() -> None:
@@ -49,44 +59,44 @@ def main() -> None:
     # Parse date
     trade_date = date.fromisoformat(args.date) if args.date else None
 
-    # Run pipeline
-    pipeline = DailyPipeline()
+    # Deferred so --help and date validation skip the pandas/httpx import cost
+    from helios.core.config import get_settings
+    from helios.pipeline.daily import DailyPipeline
+
+    # Run pipeline (settings are resolved once and handed down)
+    pipeline = DailyPipeline(settings=get_settings())
     result = asyncio.run(pipeline.run(trade_date, args.force))
 
-    # Print results
-    print()
-    print("=" * 72)
-    print("HELIOS ETF FLOW RESULT")
-    print("=" * 72)
-    print(f"Date:       {result.trade_date}")
-    print(f"Status:     {result.status.value}")
-    print("-" * 72)
-    print(f"{'Sector':<6} {'Name':<25} {'CAS':>7} {'State':<14} {'AP(z)':>7} {'RS(z)':>7}")
-    print("-" * 72)
-
-    for sector in result.sectors:
-        name = SECTOR_NAMES.get(sector.ticker, sector.ticker)
-        print(
-            f"{sector.ticker:<6} {name:<25} "
-            f"{sector.allocation_score:+7.2f} {sector.state.value:<14} "
-            f"{sector.ap_zscore:+7.2f} {sector.rs_zscore:+7.2f}"
-        )
-
-    print("=" * 72)
-
-    # Print state distribution
-    from collections import Counter
+    # Print results (built up and written in one call)
+    lines = [
+        "",
+        "=" * 72,
+        "HELIOS ETF FLOW RESULT",
+        "=" * 72,
+        f"Date:       {result.trade_date}",
+        f"Status:     {result.status.value}",
+        "-" * 72,
+        f"{'Sector':<6} {'Name':<25} {'CAS':>7} {'State':<14} {'AP(z)':>7} {'RS(z)':>7}",
+        "-" * 72,
+    ]
+    names = _display_names()
+    lines.extend(
+        f"{sector.ticker:<6} {names.get(sector.ticker, sector.ticker):<25} "
+        f"{sector.allocation_score:+7.2f} {sector.state.value:<14} "
+        f"{sector.ap_zscore:+7.2f} {sector.rs_zscore:+7.2f}"
+        for sector in result.sectors
+    )
+    lines.append("=" * 72)
 
+    # State distribution
     state_counts = Counter(s.state.value for s in result.sectors)
-    print("\nState Distribution:")
-    for state, count in sorted(state_counts.items()):
-        print(f"  {state:<14} {count}")
-
-    # Print JSON output
-    print("\nJSON Output:")
-    import json
+    lines.append("\nState Distribution:")
+    lines.extend(f"  {state:<14} {count}" for state, count in sorted(state_counts.items()))
 
-    print(json.dumps(result.to_dict(), indent=2))
+    # JSON output
+    lines.append("\nJSON Output:")
+    lines.append(orjson.dumps(result.to_dict(), option=orjson.OPT_INDENT_2).decode())
+    sys.stdout.write("\n".join(lines) + "\n")
 
 
 if __name__ == "__main__":
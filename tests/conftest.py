@@ -5,18 +5,19 @@ Pytest fixtures for HELIOS ETF FLOW tests.
 from datetime import date
 
 import numpy as np
+import numpy.typing as npt
 import pytest
 
 from helios.core.types import SectorFeatureSet
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def trade_date() -> date:
     """Standard test date."""
     return date(2024, 6, 15)
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sector_tickers() -> tuple[str, ...]:
     """Subset of sector tickers for testing."""
     return ("XLK", "XLF", "XLE", "XLP", "XLV")
@@ -87,30 +88,44 @@ def missing_all_features(trade_date: date) -> SectorFeatureSet:
     )
 
 
-@pytest.fixture
-def sufficient_flow_history() -> list[float]:
-    """63 days of flow history for rolling stats."""
-    rng = np.random.default_rng(42)
-    return list(rng.normal(0, 100_000_000, 63))
+@pytest.fixture(scope="session")
+def standard_normal_63() -> npt.NDArray[np.float64]:
+    """63 seeded N(0, 1) draws, generated once and scaled by the history fixtures."""
+    draws = np.random.default_rng(42).standard_normal(63)
+    draws.setflags(write=False)
+    return draws
 
 
-@pytest.fixture
-def sufficient_return_history() -> list[float]:
-    """63 days of excess return history."""
-    rng = np.random.default_rng(42)
-    return list(rng.normal(0, 0.01, 63))
+@pytest.fixture(scope="session")
+def sufficient_flow_history(
+    standard_normal_63: npt.NDArray[np.float64],
+) -> npt.NDArray[np.float64]:
+    """63 days of flow history for rolling stats (read-only, shared)."""
+    history = standard_normal_63 * 100_000_000
+    history.setflags(write=False)
+    return history
 
 
-@pytest.fixture
-def trade_dates_63() -> list[date]:
-    """63 sequential trade dates for history."""
-    from datetime import timedelta
-
-    start = date(2024, 3, 1)
-    dates = []
-    current = start
-    while len(dates) < 63:
-        if current.weekday() < 5:  # Skip weekends
-            dates.append(current)
-        current += timedelta(days=1)
-    return dates
+@pytest.fixture(scope="session")
+def sufficient_return_history(
+    standard_normal_63: npt.NDArray[np.float64],
+) -> npt.NDArray[np.float64]:
+    """63 days of excess return history (read-only, shared)."""
+    history = standard_normal_63 * 0.01
+    history.setflags(write=False)
+    return history
+
+
+@pytest.fixture(scope="session")
+def sufficient_flow_moments(
+    sufficient_flow_history: npt.NDArray[np.float64],
+) -> tuple[float, float]:
+    """(mean, sample std) of the flow history, computed once."""
+    return float(sufficient_flow_history.mean()), float(sufficient_flow_history.std(ddof=1))
+
+
+@pytest.fixture(scope="session")
+def trade_dates_63() -> tuple[date, ...]:
+    """63 sequential trade dates for history (weekdays from 2024-03-01)."""
+    days = np.busday_offset(np.datetime64("2024-03-01"), np.arange(63), roll="forward")
+    return tuple(days.astype(object).tolist())
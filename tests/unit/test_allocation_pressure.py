@@ -4,44 +4,33 @@ import pytest
 
 from helios.features.allocation_pressure import AllocationPressure, APResult
 
+# (ticker, net flow, expected validity, label): one row per former single-value test
+FLOW_CASES = [
+    ("XLK", 500_000_000, True, "positive flow is valid"),
+    ("XLE", -200_000_000, True, "negative flow is valid"),
+    ("XLP", 0.0, True, "zero flow is valid"),
+    ("XLB", None, False, "missing flow is invalid"),
+    ("XLK", 5_000_000_000, True, "$5B flow is preserved (no clipping at feature level)"),
+]
+
 
 class TestAllocationPressure:
     """Test AP raw value extraction."""
 
-    def setup_method(self) -> None:
-        self.calc = AllocationPressure()
-
-    def test_positive_flow(self) -> None:
-        """Positive net flow produces valid result."""
-        result = self.calc.calculate("XLK", 500_000_000)
-        assert result.is_valid
-        assert result.net_flow == 500_000_000
-        assert result.ticker == "XLK"
-
-    def test_negative_flow(self) -> None:
-        """Negative net flow produces valid result."""
-        result = self.calc.calculate("XLE", -200_000_000)
-        assert result.is_valid
-        assert result.net_flow == -200_000_000
-
-    def test_zero_flow(self) -> None:
-        """Zero net flow produces valid result."""
-        result = self.calc.calculate("XLP", 0.0)
-        assert result.is_valid
-        assert result.net_flow == 0.0
-
-    def test_none_flow(self) -> None:
-        """None net flow produces invalid result."""
-        result = self.calc.calculate("XLB", None)
-        assert not result.is_valid
-        assert result.net_flow is None
-
-    def test_large_flow(self) -> None:
-        """Very large flow is preserved (no clipping at feature level)."""
-        large_flow = 5_000_000_000  # $5B
-        result = self.calc.calculate("XLK", large_flow)
-        assert result.is_valid
-        assert result.net_flow == large_flow
+    # Stateless calculator, shared by every case
+    calc = AllocationPressure()
+
+    @pytest.mark.parametrize(
+        ("ticker", "net_flow", "valid"),
+        [case[:3] for case in FLOW_CASES],
+        ids=[case[3] for case in FLOW_CASES],
+    )
+    def test_flow_passthrough(self, ticker: str, net_flow: float | None, valid: bool) -> None:
+        """Raw flow passes through unchanged; only None is invalid."""
+        result = self.calc.calculate(ticker, net_flow)
+        assert result.is_valid is valid
+        assert result.net_flow == net_flow
+        assert result.ticker == ticker
 
     def test_result_is_frozen(self) -> None:
         """APResult is immutable."""
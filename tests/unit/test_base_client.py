@@ -0,0 +1,129 @@
+"""Tests for conditional (ETag) requests in the base API client."""
+
+import functools
+import os
+from collections.abc import AsyncIterator
+from pathlib import Path
+
+import httpx
+import orjson
+import pytest
+
+from helios.ingest.base import BaseAPIClient
+from helios.ingest.cache import CacheManager
+from helios.ingest.rate_limiter import TokenBucketLimiter
+
+_KEY = ("data", "XLK", None)
+
+
+class _StubClient(BaseAPIClient):
+    """Minimal ETag-enabled client."""
+
+    SOURCE_NAME = "stub"
+    USE_ETAG = True
+
+    def _auth_headers(self) -> dict[str, str]:
+        return {"X-Key": "secret"}
+
+    def _auth_params(self) -> dict[str, str]:
+        return {}
+
+
+class _Server:
+    """MockTransport handler that honours If-None-Match and records requests."""
+
+    def __init__(self) -> None:
+        self.etag = '"v1"'
+        self.body = {"value": 1}
+        self.requests: list[httpx.Request] = []
+
+    def __call__(self, request: httpx.Request) -> httpx.Response:
+        self.requests.append(request)
+        if request.headers.get("If-None-Match") == self.etag:
+            return httpx.Response(304)
+        return httpx.Response(
+            200, content=orjson.dumps(self.body), headers={"ETag": self.etag}
+        )
+
+
+@pytest.fixture(params=["owned", "shared"])
+async def make_client(
+    request: pytest.FixtureRequest, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> AsyncIterator[tuple[_Server, _StubClient]]:
+    """Client wired to a mock server, owning its httpx client or sharing one."""
+    server = _Server()
+    transport = httpx.MockTransport(server)
+    # ttl_days=0: every cache probe is expired, so each call revalidates
+    cache = CacheManager(base_dir=tmp_path, ttl_days=0)
+    limiter = TokenBucketLimiter(rate_per_second=1000.0, burst_size=100)
+
+    shared = None
+    if request.param == "shared":
+        shared = httpx.AsyncClient(transport=transport)
+    else:
+        monkeypatch.setattr(
+            httpx, "AsyncClient", functools.partial(httpx.AsyncClient, transport=transport)
+        )
+    client = _StubClient(
+        api_key="secret",
+        base_url="https://api.test",
+        rate_limiter=limiter,
+        cache=cache,
+        http_client=shared,
+    )
+    yield server, client
+    if shared is not None:
+        await shared.aclose()
+
+
+class TestConditionalRequests:
+    """Test the If-None-Match / 304 revalidation path."""
+
+    async def test_not_modified_reuses_cached_body(
+        self, make_client: tuple[_Server, _StubClient]
+    ) -> None:
+        """A 304 returns the cached payload and restarts its TTL."""
+        server, client = make_client
+        async with client:
+            first = await client._get("/data", cache_key_parts=_KEY)
+            path = client.cache._get_path("stub", *_KEY)
+            os.utime(path, (0, 0))
+            second = await client._get("/data", cache_key_parts=_KEY)
+
+        assert first == second == {"value": 1}
+        assert [r.headers.get("If-None-Match") for r in server.requests] == [None, '"v1"']
+        assert all(r.headers["X-Key"] == "secret" for r in server.requests)
+        assert str(server.requests[0].url) == "https://api.test/data"
+        assert os.stat(path).st_mtime > 0
+
+    async def test_changed_resource_is_refetched(
+        self, make_client: tuple[_Server, _StubClient]
+    ) -> None:
+        """A new ETag on the server yields a 200 and replaces the cache entry."""
+        server, client = make_client
+        async with client:
+            await client._get("/data", cache_key_parts=_KEY)
+            server.etag, server.body = '"v2"', {"value": 2}
+            data = await client._get("/data", cache_key_parts=_KEY)
+
+        assert data == {"value": 2}
+        assert client.cache.load_etag("stub", *_KEY) == '"v2"'
+        assert client.cache.load_json("stub", *_KEY, ignore_ttl=True) == {"value": 2}
+
+    async def test_missing_body_refetches_unconditionally(
+        self, make_client: tuple[_Server, _StubClient]
+    ) -> None:
+        """If the cached body is gone after a 304, the request is repeated without ETag."""
+        server, client = make_client
+        async with client:
+            await client._get("/data", cache_key_parts=_KEY)
+            client.cache._get_path("stub", *_KEY).unlink()
+            data = await client._get("/data", cache_key_parts=_KEY)
+
+        assert data == {"value": 1}
+        assert [r.headers.get("If-None-Match") for r in server.requests] == [
+            None,
+            '"v1"',
+            None,
+        ]
+        assert server.requests[-1].headers["X-Key"] == "secret"
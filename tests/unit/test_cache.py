@@ -0,0 +1,75 @@
+"""Tests for the file-based cache manager."""
+
+import os
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+from helios.ingest import cache as cache_module
+from helios.ingest.cache import _LZ4_MAGIC, _MMAP_THRESHOLD, CacheManager
+
+_KEY = ("src", "daily", "XLK", None)
+
+
+class TestJSONCache:
+    """Test JSON save/load."""
+
+    def test_round_trip_numpy_and_non_str_keys(self, tmp_path: Path) -> None:
+        """numpy scalars/arrays serialize natively; non-str keys become strings."""
+        cache = CacheManager(base_dir=tmp_path)
+        cache.save_json(
+            {"score": np.float64(1.5), "values": np.arange(3), 7: "seven"}, *_KEY
+        )
+
+        assert cache.load_json(*_KEY) == {"score": 1.5, "values": [0, 1, 2], "7": "seven"}
+
+    def test_expired_entry_is_a_miss(self, tmp_path: Path) -> None:
+        """Entries older than the TTL are skipped unless ignore_ttl is set."""
+        cache = CacheManager(base_dir=tmp_path, ttl_days=1)
+        path = cache.save_json({"a": 1}, *_KEY)
+        old = os.stat(path).st_mtime - 2 * 86400
+        os.utime(path, (old, old))
+
+        assert cache.load_json(*_KEY) is None
+        assert cache.load_json(*_KEY, ignore_ttl=True) == {"a": 1}
+
+    def test_large_file_read_via_mmap(self, tmp_path: Path) -> None:
+        """Files above the mmap threshold load the same as small ones."""
+        cache = CacheManager(base_dir=tmp_path)
+        data = {"rows": list(range(300_000))}
+        path = cache.save_json(data, *_KEY)
+
+        assert os.stat(path).st_size >= _MMAP_THRESHOLD
+        assert cache.load_json(*_KEY) == data
+
+
+class TestCompressedCache:
+    """Test reading entries across compress settings."""
+
+    def test_plain_entry_read_with_compress(self, tmp_path: Path) -> None:
+        """A compress=True cache still reads plain JSON entries."""
+        CacheManager(base_dir=tmp_path).save_json({"a": 1}, *_KEY)
+
+        assert CacheManager(base_dir=tmp_path, compress=True).load_json(*_KEY) == {"a": 1}
+
+    def test_compressed_entry_read_without_compress(self, tmp_path: Path) -> None:
+        """LZ4 entries are detected by magic number, whatever the reader's setting."""
+        lz4_frame = pytest.importorskip("lz4.frame")
+        path = CacheManager(base_dir=tmp_path, compress=True).save_json({"a": 1}, *_KEY)
+
+        assert path.read_bytes()[:4] == _LZ4_MAGIC
+        assert lz4_frame.decompress(path.read_bytes()) == b'{"a":1}'
+        assert CacheManager(base_dir=tmp_path).load_json(*_KEY) == {"a": 1}
+
+    def test_compressed_entry_without_lz4_is_a_miss(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Without lz4 installed, a compressed entry reads as a miss, not an error."""
+        cache = CacheManager(base_dir=tmp_path)
+        path = cache._get_path(*_KEY)
+        path.parent.mkdir(parents=True)
+        path.write_bytes(_LZ4_MAGIC + b"payload")
+        monkeypatch.setattr(cache_module, "lz4_frame", None)
+
+        assert cache.load_json(*_KEY) is None
@@ -1,83 +1,134 @@
 """Tests for CAS state classifier."""
 
+import numpy as np
 import pytest
 
 from helios.core.types import AllocationState
-from helios.scoring.classifier import classify_state
+from helios.scoring.classifier import (
+    classify_state,
+    classify_state_batch,
+    classify_state_vector,
+)
+
+# (cas, expected state): one row per value formerly checked by its own test
+STATE_CASES = [
+    # CAS > +1.0 -> OVERWEIGHT (no upper bound)
+    (1.5, AllocationState.OVERWEIGHT),
+    (2.0, AllocationState.OVERWEIGHT),
+    (5.0, AllocationState.OVERWEIGHT),
+    (100.0, AllocationState.OVERWEIGHT),
+    # CAS +0.3 to +1.0 -> ACCUMULATING
+    (0.5, AllocationState.ACCUMULATING),
+    (0.8, AllocationState.ACCUMULATING),
+    # CAS -0.3 to +0.3 -> NEUTRAL
+    (0.0, AllocationState.NEUTRAL),
+    (0.1, AllocationState.NEUTRAL),
+    (-0.1, AllocationState.NEUTRAL),
+    # CAS -1.0 to -0.3 -> DECREASING
+    (-0.5, AllocationState.DECREASING),
+    (-0.8, AllocationState.DECREASING),
+    # CAS < -1.0 -> UNDERWEIGHT (no lower bound)
+    (-1.5, AllocationState.UNDERWEIGHT),
+    (-2.0, AllocationState.UNDERWEIGHT),
+    (-5.0, AllocationState.UNDERWEIGHT),
+    (-100.0, AllocationState.UNDERWEIGHT),
+]
+
+# (cas, expected state, label): thresholds and their nearest neighbours
+BOUNDARY_CASES = [
+    (1.0, AllocationState.ACCUMULATING, "1.0 is ACCUMULATING (> 1.0 for OVERWEIGHT)"),
+    (1.001, AllocationState.OVERWEIGHT, "just above 1.0 is OVERWEIGHT"),
+    (0.3, AllocationState.NEUTRAL, "0.3 is NEUTRAL (> 0.3 for ACCUMULATING)"),
+    (0.301, AllocationState.ACCUMULATING, "just above 0.3 is ACCUMULATING"),
+    (-0.3, AllocationState.NEUTRAL, "-0.3 is NEUTRAL (>= -0.3)"),
+    (-0.301, AllocationState.DECREASING, "just below -0.3 is DECREASING"),
+    (-1.0, AllocationState.DECREASING, "-1.0 is DECREASING (>= -1.0)"),
+    (-1.001, AllocationState.UNDERWEIGHT, "just below -1.0 is UNDERWEIGHT"),
+]
 
 
 class TestClassifyState:
     """Test CAS -> AllocationState classification."""
 
-    def test_overweight(self) -> None:
-        """CAS > +1.0 -> OVERWEIGHT."""
-        assert classify_state(1.5) == AllocationState.OVERWEIGHT
-        assert classify_state(2.0) == AllocationState.OVERWEIGHT
-        assert classify_state(5.0) == AllocationState.OVERWEIGHT
-
-    def test_accumulating(self) -> None:
-        """CAS +0.3 to +1.0 -> ACCUMULATING."""
-        assert classify_state(0.5) == AllocationState.ACCUMULATING
-        assert classify_state(0.8) == AllocationState.ACCUMULATING
-        assert classify_state(1.0) == AllocationState.ACCUMULATING
-
-    def test_neutral(self) -> None:
-        """CAS -0.3 to +0.3 -> NEUTRAL."""
-        assert classify_state(0.0) == AllocationState.NEUTRAL
-        assert classify_state(0.1) == AllocationState.NEUTRAL
-        assert classify_state(-0.1) == AllocationState.NEUTRAL
-        assert classify_state(0.3) == AllocationState.NEUTRAL  # boundary: 0.3 is NEUTRAL (> 0.3 for ACCUMULATING)
-
-    def test_decreasing(self) -> None:
-        """CAS -1.0 to -0.3 -> DECREASING."""
-        assert classify_state(-0.5) == AllocationState.DECREASING
-        assert classify_state(-0.8) == AllocationState.DECREASING
-        assert classify_state(-1.0) == AllocationState.DECREASING
-
-    def test_underweight(self) -> None:
-        """CAS < -1.0 -> UNDERWEIGHT."""
-        assert classify_state(-1.5) == AllocationState.UNDERWEIGHT
-        assert classify_state(-2.0) == AllocationState.UNDERWEIGHT
-        assert classify_state(-5.0) == AllocationState.UNDERWEIGHT
-
-    # Boundary values
-
-    def test_boundary_overweight(self) -> None:
-        """CAS exactly 1.0 is ACCUMULATING (boundary: > 1.0 for OVERWEIGHT)."""
-        assert classify_state(1.0) == AllocationState.ACCUMULATING
-
-    def test_boundary_just_above_overweight(self) -> None:
-        """CAS just above 1.0 is OVERWEIGHT."""
-        assert classify_state(1.001) == AllocationState.OVERWEIGHT
-
-    def test_boundary_accumulating_lower(self) -> None:
-        """CAS exactly 0.3 is NEUTRAL (boundary: > 0.3 for ACCUMULATING)."""
-        assert classify_state(0.3) == AllocationState.NEUTRAL
-
-    def test_boundary_just_above_accumulating(self) -> None:
-        """CAS just above 0.3 is ACCUMULATING."""
-        assert classify_state(0.301) == AllocationState.ACCUMULATING
-
-    def test_boundary_neutral_lower(self) -> None:
-        """CAS exactly -0.3 is NEUTRAL (boundary: >= -0.3)."""
-        assert classify_state(-0.3) == AllocationState.NEUTRAL
-
-    def test_boundary_decreasing_start(self) -> None:
-        """CAS just below -0.3 is DECREASING."""
-        assert classify_state(-0.301) == AllocationState.DECREASING
-
-    def test_boundary_underweight(self) -> None:
-        """CAS exactly -1.0 is DECREASING (boundary: >= -1.0)."""
-        assert classify_state(-1.0) == AllocationState.DECREASING
-
-    def test_boundary_just_below_underweight(self) -> None:
-        """CAS just below -1.0 is UNDERWEIGHT."""
-        assert classify_state(-1.001) == AllocationState.UNDERWEIGHT
-
-    def test_extreme_positive(self) -> None:
-        """Very high CAS is still OVERWEIGHT (no upper bound)."""
-        assert classify_state(100.0) == AllocationState.OVERWEIGHT
-
-    def test_extreme_negative(self) -> None:
-        """Very low CAS is still UNDERWEIGHT (no lower bound)."""
-        assert classify_state(-100.0) == AllocationState.UNDERWEIGHT
+    @pytest.mark.parametrize(("cas", "expected"), STATE_CASES)
+    def test_state_ranges(self, cas: float, expected: AllocationState) -> None:
+        """Each CAS range maps to its FROZEN state."""
+        assert classify_state(cas) == expected
+
+    @pytest.mark.parametrize(
+        ("cas", "expected"),
+        [pytest.param(cas, expected, id=label) for cas, expected, label in BOUNDARY_CASES],
+    )
+    def test_boundaries(self, cas: float, expected: AllocationState) -> None:
+        """Upper thresholds are exclusive, lower thresholds inclusive."""
+        assert classify_state(cas) == expected
+
+    def test_whole_table_in_one_vector_call(self) -> None:
+        """The vectorized path classifies every table row in a single call."""
+        rows = STATE_CASES + [(cas, expected) for cas, expected, _ in BOUNDARY_CASES]
+        codes = classify_state_vector(np.array([cas for cas, _ in rows]))
+        assert [AllocationState.from_code(int(c)) for c in codes] == [e for _, e in rows]
+
+
+class TestFromCasArray:
+    """Test vectorized CAS -> AllocationState classification."""
+
+    def test_matches_scalar_classifier(self) -> None:
+        """Array classification agrees with classify_state, including boundaries."""
+        values = np.array([
+            -100.0, -1.001, -1.0, -0.5, -0.301, -0.3, 0.0,
+            0.3, 0.301, 0.5, 1.0, 1.001, 100.0,
+        ])
+        states = AllocationState.from_cas_array(values)
+        assert list(states) == [classify_state(v) for v in values]
+
+    def test_nan_matches_scalar_classifier(self) -> None:
+        """NaN CAS is UNDERWEIGHT in both paths (it fails every comparison)."""
+        values = np.array([np.nan, 2.0, np.nan])
+        assert list(AllocationState.codes_from_cas_array(values)) == [0, 4, 0]
+        assert list(AllocationState.from_cas_array(values)) == [
+            classify_state(v) for v in values
+        ]
+        assert classify_state(float("nan")) == AllocationState.UNDERWEIGHT
+
+    def test_empty_array(self) -> None:
+        """Empty input produces empty output."""
+        assert AllocationState.from_cas_array(np.array([])).size == 0
+
+    def test_codes_round_trip(self) -> None:
+        """State codes are ordered by CAS and map back to the same state."""
+        values = np.array([-2.0, -0.5, 0.0, 0.5, 2.0])
+        codes = AllocationState.codes_from_cas_array(values)
+        assert list(codes) == [0, 1, 2, 3, 4]
+        for code, value in zip(codes, values, strict=True):
+            state = AllocationState.from_code(int(code))
+            assert state == classify_state(value)
+            assert state.code == code
+
+    def test_classify_state_vector_codes(self) -> None:
+        """classify_state_vector returns codes matching classify_state."""
+        values = np.array([-1.0, -0.3, 0.3, 1.0, 1.5])
+        codes = classify_state_vector(values)
+        assert codes.dtype == np.int8
+        assert [AllocationState.from_code(int(c)) for c in codes] == [
+            classify_state(v) for v in values
+        ]
+
+    def test_classify_state_batch_matches_scalar(self) -> None:
+        """classify_state_batch agrees elementwise with classify_state."""
+        values = np.array([1.5, 0.5, 0.0, -0.5, -1.5, np.nan])
+        states = classify_state_batch(values)
+        assert list(states) == [classify_state(v) for v in values]
+        assert list(states) == [
+            AllocationState.OVERWEIGHT,
+            AllocationState.ACCUMULATING,
+            AllocationState.NEUTRAL,
+            AllocationState.DECREASING,
+            AllocationState.UNDERWEIGHT,
+            AllocationState.UNDERWEIGHT,  # NaN fails every comparison
+        ]
+
+        rows = STATE_CASES + [(cas, expected) for cas, expected, _ in BOUNDARY_CASES]
+        batch = classify_state_batch(np.array([cas for cas, _ in rows]).reshape(-1, 1))
+        assert batch.shape == (len(rows), 1)
+        assert list(batch[:, 0]) == [expected for _, expected in rows]
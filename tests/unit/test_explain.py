@@ -1,9 +1,21 @@
 """Tests for explanation generator."""
 
+import re
+
 import pytest
 
 from helios.core.types import AllocationState, BaselineStatus
 from helios.explain.generator import ExplanationGenerator
+from helios.explain.templates import STATE_TEMPLATES, STATUS_TEMPLATES
+
+# Case-insensitive keyword patterns, compiled once for the module
+_OVERWEIGHT_KEYWORDS = re.compile(r"net inflows|outperformance", re.IGNORECASE)
+_UNDERWEIGHT_KEYWORDS = re.compile(r"outflows|underperformance", re.IGNORECASE)
+_NEUTRAL_KEYWORDS = re.compile(r"balanced|in line", re.IGNORECASE)
+_CAVEAT_KEYWORDS = re.compile(r"excluded|insufficient", re.IGNORECASE)
+_INSUFFICIENT_KEYWORD = re.compile(r"insufficient", re.IGNORECASE)
+_ELEVATED_KEYWORDS = re.compile(r"inflows|outperforming", re.IGNORECASE)
+_DEPRESSED_KEYWORDS = re.compile(r"outflows|underperforming", re.IGNORECASE)
 
 
 class TestExplanationGenerator:
@@ -22,7 +34,7 @@ class TestExplanationGenerator:
             excluded=[],
             status=BaselineStatus.COMPLETE,
         )
-        assert "net inflows" in text.lower() or "outperformance" in text.lower()
+        assert _OVERWEIGHT_KEYWORDS.search(text), text
         assert "1.50" in text or "+1.50" in text
 
     def test_underweight_explanation(self) -> None:
@@ -35,7 +47,7 @@ class TestExplanationGenerator:
             excluded=[],
             status=BaselineStatus.COMPLETE,
         )
-        assert "outflows" in text.lower() or "underperformance" in text.lower()
+        assert _UNDERWEIGHT_KEYWORDS.search(text), text
 
     def test_neutral_explanation(self) -> None:
         """NEUTRAL state produces balanced description."""
@@ -47,7 +59,7 @@ class TestExplanationGenerator:
             excluded=[],
             status=BaselineStatus.COMPLETE,
         )
-        assert "balanced" in text.lower() or "in line" in text.lower()
+        assert _NEUTRAL_KEYWORDS.search(text), text
 
     def test_excluded_features_noted(self) -> None:
         """Excluded features are mentioned in explanation."""
@@ -60,7 +72,7 @@ class TestExplanationGenerator:
             status=BaselineStatus.PARTIAL,
         )
         assert "AP" in text
-        assert "excluded" in text.lower() or "insufficient" in text.lower()
+        assert _CAVEAT_KEYWORDS.search(text), text
 
     def test_insufficient_status_warning(self) -> None:
         """INSUFFICIENT status produces warning."""
@@ -72,7 +84,7 @@ class TestExplanationGenerator:
             excluded=["AP", "RS"],
             status=BaselineStatus.INSUFFICIENT,
         )
-        assert "insufficient" in text.lower()
+        assert _INSUFFICIENT_KEYWORD.search(text), text
 
     def test_complete_status_no_warning(self) -> None:
         """COMPLETE status has no extra warning."""
@@ -84,8 +96,7 @@ class TestExplanationGenerator:
             excluded=[],
             status=BaselineStatus.COMPLETE,
         )
-        assert "insufficient" not in text.lower()
-        assert "excluded" not in text.lower()
+        assert not _CAVEAT_KEYWORDS.search(text), text
 
     def test_driver_direction_elevated(self) -> None:
         """High z-score shows 'elevated' direction."""
@@ -97,7 +108,7 @@ class TestExplanationGenerator:
             excluded=[],
             status=BaselineStatus.COMPLETE,
         )
-        assert "inflows" in text.lower() or "outperforming" in text.lower()
+        assert _ELEVATED_KEYWORDS.search(text), text
 
     def test_driver_direction_depressed(self) -> None:
         """Low z-score shows 'depressed' direction."""
@@ -109,7 +120,26 @@ class TestExplanationGenerator:
             excluded=[],
             status=BaselineStatus.COMPLETE,
         )
-        assert "outflows" in text.lower() or "underperforming" in text.lower()
+        assert _DEPRESSED_KEYWORDS.search(text), text
+
+    @pytest.mark.parametrize("status", list(BaselineStatus))
+    @pytest.mark.parametrize("state", list(AllocationState))
+    def test_frame_per_state_and_status(
+        self, state: AllocationState, status: BaselineStatus
+    ) -> None:
+        """Headline and status note come from the templates for every pair."""
+        text = self.gen.generate(
+            ticker="XLK",
+            state=state,
+            ap_zscore=None,
+            rs_zscore=None,
+            excluded=[],
+            status=status,
+        )
+        expected = [STATE_TEMPLATES.get(state) or state.description]
+        if STATUS_TEMPLATES.get(status):
+            expected.append(STATUS_TEMPLATES[status])
+        assert text == " ".join(expected)
 
     def test_format_summary(self) -> None:
         """Summary format includes ticker and state."""
@@ -0,0 +1,71 @@
+"""Tests for the FMP fund flow client."""
+
+import math
+from datetime import date
+from pathlib import Path
+from typing import Any
+
+import pandas as pd
+import pytest
+
+from helios.core.config import Settings
+from helios.core.constants import SECTOR_UNIVERSE
+from helios.ingest.fmp import FMPFlowClient
+
+
+def _client(tmp_path: Path) -> FMPFlowClient:
+    """Client with its cache under tmp_path."""
+    return FMPFlowClient(Settings(polygon_key="x", fmp_key="k", data_dir=tmp_path))
+
+
+class TestFMPFlowClient:
+    """Test FMP flow parsing."""
+
+    async def test_null_fields_keep_the_ticker(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Missing or null fields become NaN/NaT instead of dropping the ticker."""
+        client = _client(tmp_path)
+        records: list[dict[str, Any]] = [
+            {"date": "2024-01-03"},  # flow key absent
+            {"date": "2024-01-02", "netFlow": 5.0},
+            {"date": "2024-01-04", "netFlow": None},
+            {"date": None, "netFlow": 2.0},
+        ]
+
+        async def fake_fetch(
+            ticker: str, from_date: date | None = None, to_date: date | None = None
+        ) -> list[dict[str, Any]]:
+            return records
+
+        monkeypatch.setattr(client, "get_etf_fund_flow", fake_fetch)
+        flows = await client.get_all_sector_flows(date(2024, 1, 1), date(2024, 1, 5))
+
+        assert set(flows) == set(SECTOR_UNIVERSE)
+        df = flows[SECTOR_UNIVERSE[0]]
+        assert list(df["date"][:3]) == [date(2024, 1, 2), date(2024, 1, 3), date(2024, 1, 4)]
+        assert pd.isna(df["date"].iloc[3])
+        assert df["net_flow"].iloc[0] == 5.0
+        assert math.isnan(df["net_flow"].iloc[1])
+        assert math.isnan(df["net_flow"].iloc[2])
+        assert df["net_flow"].iloc[3] == 2.0
+
+    async def test_fetch_error_skips_only_that_ticker(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """A failed request drops its ticker; the others are still parsed."""
+        client = _client(tmp_path)
+        failing = SECTOR_UNIVERSE[1]
+
+        async def fake_fetch(
+            ticker: str, from_date: date | None = None, to_date: date | None = None
+        ) -> list[dict[str, Any]]:
+            if ticker == failing:
+                raise RuntimeError("boom")
+            return [{"date": "2024-01-02", "flow": 1.0}]
+
+        monkeypatch.setattr(client, "get_etf_fund_flow", fake_fetch)
+        flows = await client.get_all_sector_flows(date(2024, 1, 1), date(2024, 1, 5))
+
+        assert failing not in flows
+        assert len(flows) == len(SECTOR_UNIVERSE) - 1
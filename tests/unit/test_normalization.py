@@ -7,10 +7,17 @@ CRITICAL: Verifies NO CLIPPING behavior at the z-score level.
 from datetime import date, timedelta
 
 import numpy as np
+import numpy.typing as npt
 import pytest
 
 from helios.core.types import BaselineStatus, SectorFeatureSet
-from helios.normalization.methods import percentile_rank, zscore_normalize
+from helios.normalization.methods import (
+    percentile_rank,
+    percentile_rank_batch,
+    rolling_zscore,
+    zscore_normalize,
+)
+from helios.normalization.pipeline import NormalizationPipeline
 from helios.normalization.rolling import RollingStats, SectorRollingCalculator
 
 
@@ -53,6 +60,37 @@ class TestZScoreNormalize:
         assert z == 0.0
 
 
+class TestRollingZScore:
+    """Test vectorized rolling z-scores."""
+
+    def test_matches_incremental_calculator(self) -> None:
+        """Batch z-scores equal score-then-add through SectorRollingCalculator."""
+        rng = np.random.default_rng(7)
+        values = rng.normal(5e8, 1e8, 150)
+        calc = SectorRollingCalculator(
+            tickers=("XLK",), feature_names=("AP",), window=63, min_observations=21
+        )
+
+        expected = []
+        for i, v in enumerate(values):
+            z = calc.get_zscore("XLK", "AP", float(v))
+            expected.append(np.nan if z is None else z)
+            calc.add_observation("XLK", date(2024, 1, 1) + timedelta(days=i), {"AP": float(v)})
+
+        np.testing.assert_allclose(rolling_zscore(values, 63, 21), expected, rtol=1e-9)
+
+    def test_insufficient_history_is_nan(self) -> None:
+        """Values without min_observations of history get NaN."""
+        z = rolling_zscore(np.arange(10, dtype=float), window=5, min_observations=3)
+        assert np.isnan(z[:3]).all()
+        assert np.isfinite(z[3:]).all()
+
+    def test_constant_window_is_nan(self) -> None:
+        """Zero std in the baseline window yields NaN, not inf."""
+        z = rolling_zscore(np.ones(10), window=5, min_observations=3)
+        assert np.isnan(z).all()
+
+
 class TestPercentileRank:
     """Test percentile ranking (for dashboard display only)."""
 
@@ -76,31 +114,53 @@ class TestPercentileRank:
         p = percentile_rank(5.0, [])
         assert p == pytest.approx(50.0)
 
+    def test_batch_matches_scalar(self) -> None:
+        """One sorted searchsorted ranks each value like the scalar path."""
+        history = [5.0, 1.0, 3.0, 2.0, 4.0, 3.0]
+        values = np.array([0.0, 1.0, 3.0, 3.5, 10.0])
+        ranks = percentile_rank_batch(values, history)
+        assert ranks.shape == values.shape
+        np.testing.assert_allclose(ranks, [percentile_rank(v, history) for v in values])
+
+    def test_batch_empty_history(self) -> None:
+        """Empty history ranks every value at 50%."""
+        np.testing.assert_array_equal(percentile_rank_batch([1.0, 2.0], []), [50.0, 50.0])
+
 
 class TestRollingStats:
     """Test rolling statistics tracker."""
 
-    def test_not_ready_below_min(self) -> None:
+    def test_not_ready_below_min(self, trade_dates_63: tuple[date, ...]) -> None:
         """Stats not ready when below minimum observations."""
         stats = RollingStats(feature_name="AP", min_observations=21)
-        for i in range(20):
-            stats.add(float(i), date(2024, 1, i + 1))
+        stats.add_bulk(np.arange(20, dtype=np.float64), trade_dates_63[:20])
         assert not stats.is_ready
 
-    def test_ready_at_min(self) -> None:
+    def test_ready_at_min(self, trade_dates_63: tuple[date, ...]) -> None:
         """Stats ready at minimum observations."""
         stats = RollingStats(feature_name="AP", min_observations=21)
-        for i in range(21):
-            stats.add(float(i), date(2024, 1, i + 1))
+        stats.add_bulk(np.arange(21, dtype=np.float64), trade_dates_63[:21])
         assert stats.is_ready
 
-    def test_mean_calculation(self) -> None:
+    def test_mean_calculation(self, trade_dates_63: tuple[date, ...]) -> None:
         """Mean is correctly calculated from window."""
         stats = RollingStats(feature_name="RS", window=5, min_observations=3)
-        for i in range(5):
-            stats.add(float(i + 1), date(2024, 1, i + 1))
+        stats.add_bulk(np.arange(1, 6, dtype=np.float64), trade_dates_63[:5])
         assert stats.mean == pytest.approx(3.0)
 
+    def test_full_window_moments(
+        self,
+        sufficient_flow_history: npt.NDArray[np.float64],
+        sufficient_flow_moments: tuple[float, float],
+        trade_dates_63: tuple[date, ...],
+    ) -> None:
+        """A full 63-day window reports the history's mean and sample std."""
+        stats = RollingStats(feature_name="AP")
+        stats.add_bulk(sufficient_flow_history, trade_dates_63)
+        mean, std = sufficient_flow_moments
+        assert stats.mean == pytest.approx(mean)
+        assert stats.std == pytest.approx(std)
+
     def test_window_eviction(self) -> None:
         """Old values are evicted when window is full."""
         stats = RollingStats(feature_name="AP", window=3, min_observations=2)
@@ -110,6 +170,54 @@ class TestRollingStats:
         stats.add(400.0, date(2024, 1, 4))  # Evicts 100.0
         assert stats.count == 3
         assert stats.values == [200.0, 300.0, 400.0]
+        assert stats.dates == [date(2024, 1, 2), date(2024, 1, 3), date(2024, 1, 4)]
+
+    def test_incremental_moments_match_window(self) -> None:
+        """O(1) running mean/std equal a full recompute after many wraps."""
+        stats = RollingStats(feature_name="AP", window=63, min_observations=21)
+        rng = np.random.default_rng(11)
+        values = rng.normal(5e6, 2e7, 500)
+
+        for i, v in enumerate(values):
+            stats.add(float(v), date(2024, 1, 1) + timedelta(days=i))
+            if i in (20, 62, 63, 199, 499):
+                window = values[max(0, i - 62) : i + 1]
+                assert stats.values == window.tolist()
+                assert stats.mean == pytest.approx(window.mean(), rel=1e-12)
+                assert stats.std == pytest.approx(window.std(ddof=1), rel=1e-12)
+
+        stats.clear()
+        assert stats.count == 0 and stats.values == []
+
+    def test_bulk_add_matches_sequential_adds(self) -> None:
+        """Bulk load after existing history gives the same window as add()."""
+        rng = np.random.default_rng(3)
+        values = rng.normal(5e6, 2e7, 150)
+        dates = [date(2024, 1, 1) + timedelta(days=i) for i in range(150)]
+        sequential = RollingStats(feature_name="AP", window=63, min_observations=21)
+        bulk = RollingStats(feature_name="AP", window=63, min_observations=21)
+
+        for v, d in zip(values, dates, strict=True):
+            sequential.add(float(v), d)
+        for v, d in zip(values[:40], dates[:40], strict=True):
+            bulk.add(float(v), d)
+        bulk.add_bulk(values[40:].tolist(), dates[40:])
+
+        assert bulk.values == sequential.values
+        assert bulk.dates == sequential.dates
+        assert bulk.mean == pytest.approx(sequential.mean, rel=1e-12)
+        assert bulk.std == pytest.approx(sequential.std, rel=1e-12)
+
+        bulk.add(1.0, date(2025, 1, 1))
+        sequential.add(1.0, date(2025, 1, 1))
+        assert bulk.values == sequential.values
+
+    def test_slotted(self) -> None:
+        """Instances carry no per-instance __dict__."""
+        stats = RollingStats(feature_name="AP")
+        assert not hasattr(stats, "__dict__")
+        with pytest.raises(AttributeError):
+            stats.extra = 1.0  # type: ignore[attr-defined]
 
 
 class TestSectorRollingCalculator:
@@ -136,7 +244,103 @@ class TestSectorRollingCalculator:
         assert xlk_stats is not None and xlk_stats.mean == pytest.approx(100.0)
         assert xlf_stats is not None and xlf_stats.mean == pytest.approx(-100.0)
 
-    def test_zscore_not_clipped(self) -> None:
+    def test_load_from_arrays_skips_nan_per_feature(self) -> None:
+        """A NaN in one feature does not drop the other feature's value."""
+        calc = SectorRollingCalculator(
+            tickers=("XLK",),
+            feature_names=("AP", "RS"),
+            window=5,
+            min_observations=1,
+        )
+        dates = [date(2024, 1, i + 1) for i in range(3)]
+
+        loaded = calc.load_from_arrays(
+            "XLK",
+            dates,
+            {"AP": np.array([1.0, np.nan, 3.0]), "RS": np.array([0.1, 0.2, 0.3])},
+        )
+
+        assert loaded == 3
+        ap_stats = calc.get_stats("XLK", "AP")
+        rs_stats = calc.get_stats("XLK", "RS")
+        assert ap_stats is not None and ap_stats.values == [1.0, 3.0]
+        assert ap_stats.dates == [dates[0], dates[2]]
+        assert rs_stats is not None and rs_stats.count == 3
+        assert calc.load_from_arrays("ZZZ", dates, {"AP": np.zeros(3)}) == 0
+
+    def test_get_stats_is_detached_snapshot(self) -> None:
+        """RollingStats views are built on demand and do not alias calculator state."""
+        calc = SectorRollingCalculator(
+            tickers=("XLK", "XLF"), feature_names=("AP", "RS"), window=4, min_observations=2
+        )
+        for i in range(6):
+            calc.add_observation("XLK", date(2024, 1, i + 1), {"AP": float(i)})
+
+        snapshot = calc.get_stats("XLK", "AP")
+        assert snapshot is not None and snapshot.values == [2.0, 3.0, 4.0, 5.0]
+
+        calc.add_observation("XLK", date(2024, 1, 7), {"AP": 6.0})
+        snapshot.add(-1.0, date(2024, 1, 8))
+
+        assert snapshot.values == [3.0, 4.0, 5.0, -1.0]
+        fresh = calc.get_stats("XLK", "AP")
+        assert fresh is not None and fresh.values == [3.0, 4.0, 5.0, 6.0]
+        assert calc.summary()["XLK"]["AP"]["mean"] == pytest.approx(4.5)
+
+    def test_load_from_columns_matches_per_sector_load(self) -> None:
+        """Long-format bulk load equals loading each sector separately."""
+        rng = np.random.default_rng(11)
+        n = 40
+        tickers = np.array(["XLK", "XLF", "ZZZ", "XLK"] * n)
+        dates = [date(2024, 1, 1) + timedelta(days=k // 4) for k in range(4 * n)]
+        ap = rng.normal(size=4 * n)
+        ap[::7] = np.nan
+        rs = rng.normal(size=4 * n)
+
+        bulk = SectorRollingCalculator(tickers=("XLK", "XLF"), window=10, min_observations=3)
+        single = SectorRollingCalculator(tickers=("XLK", "XLF"), window=10, min_observations=3)
+
+        loaded = bulk.load_from_columns(tickers, dates, {"AP": ap, "RS": rs})
+        for ticker in ("XLK", "XLF"):
+            mask = tickers == ticker
+            single.load_from_arrays(
+                ticker, np.asarray(dates)[mask], {"AP": ap[mask], "RS": rs[mask]}
+            )
+
+        assert loaded == 3 * n
+        assert bulk.summary() == single.summary()
+        for ticker in ("XLK", "XLF"):
+            for name in ("AP", "RS"):
+                a, b = bulk.get_stats(ticker, name), single.get_stats(ticker, name)
+                assert a is not None and b is not None
+                assert a.values == b.values and a.dates == b.dates
+
+    def test_add_matrix_skips_untracked_and_nan(self) -> None:
+        """Matrix adds skip -1 rows and NaN cells; history records load by ticker."""
+        calc = SectorRollingCalculator(
+            tickers=("XLK", "XLF"),
+            feature_names=("AP", "RS"),
+            window=5,
+            min_observations=1,
+        )
+        rows = calc.row_indices(["XLF", "ZZZ", "XLK"])
+        assert rows.tolist() == [1, -1, 0]
+
+        raw = np.array([[1.0, np.nan], [9.0, 9.0], [2.0, 0.5]])
+        calc.add_matrix(date(2024, 1, 2), rows, raw)
+        loaded = calc.load_from_history(
+            {"XLF": [{"date": "2024-01-03", "RS": 0.2}], "ZZZ": [{"date": "2024-01-03"}]}
+        )
+
+        assert loaded == 1
+        xlf_ap = calc.get_stats("XLF", "AP")
+        xlf_rs = calc.get_stats("XLF", "RS")
+        xlk_rs = calc.get_stats("XLK", "RS")
+        assert xlf_ap is not None and xlf_ap.values == [1.0]
+        assert xlf_rs is not None and xlf_rs.dates == [date(2024, 1, 3)]
+        assert xlk_rs is not None and xlk_rs.values == [0.5]
+
+    def test_zscore_not_clipped(self, trade_dates_63: tuple[date, ...]) -> None:
         """CRITICAL: Z-scores from calculator are NOT clipped."""
         calc = SectorRollingCalculator(
             tickers=("XLK",),
@@ -146,18 +350,14 @@ class TestSectorRollingCalculator:
         )
 
         rng = np.random.default_rng(42)
-        values = rng.normal(0, 100, 63)
-
-        for i, v in enumerate(values):
-            d = date(2024, 1, 1) + timedelta(days=i)
-            calc.add_observation("XLK", d, {"AP": float(v)})
+        calc.load_from_arrays("XLK", trade_dates_63, {"AP": rng.normal(0, 100, 63)})
 
         # Test with extreme value
         z = calc.get_zscore("XLK", "AP", 1000.0)
         assert z is not None
         assert abs(z) > 3.0  # Should NOT be clipped
 
-    def test_insufficient_data_returns_none(self) -> None:
+    def test_insufficient_data_returns_none(self, trade_dates_63: tuple[date, ...]) -> None:
         """Z-score is None when insufficient history."""
         calc = SectorRollingCalculator(
             tickers=("XLK",),
@@ -166,14 +366,34 @@ class TestSectorRollingCalculator:
         )
 
         # Add only 10 observations
-        for i in range(10):
-            d = date(2024, 1, i + 1)
-            calc.add_observation("XLK", d, {"AP": float(i)})
+        calc.load_from_arrays("XLK", trade_dates_63[:10], {"AP": np.arange(10.0)})
 
         z = calc.get_zscore("XLK", "AP", 5.0)
         assert z is None
 
-    def test_ready_features(self) -> None:
+    def test_zscore_row_matches_get_zscore(self) -> None:
+        """Row z-scores equal per-feature z-scores; gaps are NaN."""
+        calc = SectorRollingCalculator(
+            tickers=("XLK", "XLF"),
+            feature_names=("AP", "RS"),
+            window=10,
+            min_observations=5,
+        )
+        rng = np.random.default_rng(5)
+        for i in range(30):
+            d = date(2024, 1, 1) + timedelta(days=i)
+            calc.add_observation("XLK", d, {"AP": float(rng.normal()), "RS": float(rng.normal())})
+            if i < 3:
+                calc.add_observation("XLF", d, {"AP": 1.0})
+
+        row = calc.get_zscore_row("XLK", {"AP": 2.5, "RS": None})
+
+        assert row[0] == calc.get_zscore("XLK", "AP", 2.5)
+        assert np.isnan(row[1])
+        assert np.isnan(calc.get_zscore_row("XLF", {"AP": 1.0})).all()
+        assert np.isnan(calc.get_zscore_row("ZZZ", {"AP": 1.0})).all()
+
+    def test_ready_features(self, trade_dates_63: tuple[date, ...]) -> None:
         """Ready/not-ready feature tracking."""
         calc = SectorRollingCalculator(
             tickers=("XLK",),
@@ -183,9 +403,55 @@ class TestSectorRollingCalculator:
         )
 
         # Add only AP data
-        for i in range(5):
-            d = date(2024, 1, i + 1)
-            calc.add_observation("XLK", d, {"AP": float(i)})
+        calc.load_from_arrays("XLK", trade_dates_63[:5], {"AP": np.arange(5.0)})
 
         assert "AP" in calc.get_ready_features("XLK")
         assert "RS" in calc.get_not_ready_features("XLK")
+
+
+class TestNormalizationPipeline:
+    """Tests for multi-sector normalization."""
+
+    def test_normalize_all_matches_per_sector(self) -> None:
+        """Batched normalization equals sector-by-sector normalization."""
+        pipeline = NormalizationPipeline(window=10, min_observations=5)
+        rng = np.random.default_rng(7)
+
+        for i in range(10):
+            d = date(2024, 1, 1) + timedelta(days=i)
+            pipeline.add_observation(
+                "XLK",
+                SectorFeatureSet(
+                    ticker="XLK",
+                    trade_date=d,
+                    net_flow=float(rng.normal(0, 1e6)),
+                    excess_return=float(rng.normal(0, 0.01)),
+                ),
+            )
+            # XLF only builds an AP baseline
+            pipeline.add_observation(
+                "XLF",
+                SectorFeatureSet(ticker="XLF", trade_date=d, net_flow=float(rng.normal(0, 1e6))),
+            )
+
+        today = date(2024, 1, 15)
+        all_features = {
+            "XLK": SectorFeatureSet(
+                ticker="XLK", trade_date=today, net_flow=5e6, excess_return=-0.03
+            ),
+            "XLF": SectorFeatureSet(
+                ticker="XLF", trade_date=today, net_flow=1e6, excess_return=0.01
+            ),
+            "XLE": SectorFeatureSet(ticker="XLE", trade_date=today, net_flow=1e6),
+        }
+
+        results = pipeline.normalize_all(all_features)
+
+        assert results == {
+            ticker: pipeline.normalize_sector(ticker, features)
+            for ticker, features in all_features.items()
+        }
+        assert results["XLK"][2] == BaselineStatus.COMPLETE
+        assert results["XLF"][1] == ["RS"]
+        assert results["XLF"][2] == BaselineStatus.PARTIAL
+        assert results["XLE"][2] == BaselineStatus.INSUFFICIENT
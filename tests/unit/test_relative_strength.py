@@ -1,59 +1,87 @@
 """Tests for Relative Strength (RS) feature calculator."""
 
+from datetime import date
+
+import numpy as np
 import pytest
 
+from helios.core.constants import SECTOR_UNIVERSE
+from helios.features.aggregator import default_aggregator
 from helios.features.relative_strength import RelativeStrength, RSResult
+from helios.normalization.pipeline import feature_matrix
+
+# (ticker, ETF return, SPY return, expected excess or None if invalid, label)
+RETURN_CASES = [
+    ("XLK", 0.02, 0.005, 0.015, "outperformance is positive"),
+    ("XLE", -0.01, 0.005, -0.015, "underperformance is negative"),
+    ("XLP", 0.005, 0.005, 0.0, "same return as SPY is zero"),
+    ("XLB", None, 0.005, None, "missing ETF return is invalid"),
+    ("XLF", 0.01, None, None, "missing SPY return is invalid"),
+    ("XLU", None, None, None, "both missing is invalid"),
+    ("XLV", -0.005, -0.02, 0.015, "less negative than SPY is positive"),
+]
 
 
 class TestRelativeStrength:
     """Test RS excess return calculation."""
 
-    def setup_method(self) -> None:
-        self.calc = RelativeStrength()
-
-    def test_outperformance(self) -> None:
-        """ETF outperforming SPY produces positive excess return."""
-        result = self.calc.calculate("XLK", etf_return=0.02, spy_return=0.005)
-        assert result.is_valid
-        assert result.excess_return == pytest.approx(0.015)
-
-    def test_underperformance(self) -> None:
-        """ETF underperforming SPY produces negative excess return."""
-        result = self.calc.calculate("XLE", etf_return=-0.01, spy_return=0.005)
-        assert result.is_valid
-        assert result.excess_return == pytest.approx(-0.015)
-
-    def test_same_return_as_spy(self) -> None:
-        """Same return as SPY produces zero excess return."""
-        result = self.calc.calculate("XLP", etf_return=0.005, spy_return=0.005)
-        assert result.is_valid
-        assert result.excess_return == pytest.approx(0.0)
-
-    def test_none_etf_return(self) -> None:
-        """Missing ETF return produces invalid result."""
-        result = self.calc.calculate("XLB", etf_return=None, spy_return=0.005)
-        assert not result.is_valid
-        assert result.excess_return is None
-
-    def test_none_spy_return(self) -> None:
-        """Missing SPY return produces invalid result."""
-        result = self.calc.calculate("XLF", etf_return=0.01, spy_return=None)
-        assert not result.is_valid
-        assert result.excess_return is None
-
-    def test_both_none(self) -> None:
-        """Both missing produces invalid result."""
-        result = self.calc.calculate("XLU", etf_return=None, spy_return=None)
-        assert not result.is_valid
-
-    def test_both_negative(self) -> None:
-        """Both negative returns, ETF less negative = positive excess."""
-        result = self.calc.calculate("XLV", etf_return=-0.005, spy_return=-0.02)
-        assert result.is_valid
-        assert result.excess_return == pytest.approx(0.015)
+    # Stateless calculator, shared by every case
+    calc = RelativeStrength()
+
+    @pytest.mark.parametrize(
+        ("ticker", "etf_return", "spy_return", "expected"),
+        [case[:4] for case in RETURN_CASES],
+        ids=[case[4] for case in RETURN_CASES],
+    )
+    def test_excess_return(
+        self,
+        ticker: str,
+        etf_return: float | None,
+        spy_return: float | None,
+        expected: float | None,
+    ) -> None:
+        """Excess return is ETF minus SPY; invalid when either is missing."""
+        result = self.calc.calculate(ticker, etf_return=etf_return, spy_return=spy_return)
+        if expected is None:
+            assert not result.is_valid
+            assert result.excess_return is None
+        else:
+            assert result.is_valid
+            assert result.excess_return == pytest.approx(expected)
 
     def test_result_is_frozen(self) -> None:
         """RSResult is immutable."""
         result = self.calc.calculate("XLK", 0.01, 0.005)
         with pytest.raises(AttributeError):
             result.excess_return = 0  # type: ignore[misc]
+
+
+class TestFeatureMatrix:
+    """Test the array form of the feature aggregator."""
+
+    def test_matches_calculate_all(self) -> None:
+        """Each day's matrix row equals the per-sector feature sets."""
+        rng = np.random.default_rng(2)
+        n_days, n_sectors = 3, len(SECTOR_UNIVERSE)
+        flows = rng.normal(0, 1e7, (n_days, n_sectors))
+        returns = rng.normal(0, 0.01, (n_days, n_sectors))
+        flows[0, 2] = np.nan
+        returns[1, 4] = np.nan
+        spy_returns = np.array([0.001, -0.002, np.nan])
+
+        matrix = default_aggregator.calculate_matrix(flows, returns, spy_returns)
+
+        assert matrix.shape == (n_days, n_sectors, 2)
+        for d in range(n_days):
+            spy = spy_returns[d]
+            day_flows = zip(SECTOR_UNIVERSE, flows[d], strict=True)
+            day_returns = zip(SECTOR_UNIVERSE, returns[d], strict=True)
+            all_features = default_aggregator.calculate_all(
+                trade_date=date(2024, 1, 2),
+                flows={t: v for t, v in day_flows if not np.isnan(v)},
+                returns={t: v for t, v in day_returns if not np.isnan(v)},
+                spy_return=None if np.isnan(spy) else float(spy),
+            )
+            np.testing.assert_array_equal(
+                matrix[d], feature_matrix(list(all_features.values()))
+            )
@@ -1,8 +1,18 @@
 """Tests for composite scoring (CAS calculation)."""
 
+from datetime import date, timedelta
+
+import numpy as np
 import pytest
 
-from helios.scoring.composite import calculate_cas
+from helios.core.types import SectorFeatureSet
+from helios.normalization.pipeline import NormalizationPipeline
+from helios.scoring.composite import (
+    calculate_cas,
+    calculate_cas_batch,
+    calculate_cas_fast,
+)
+from helios.scoring.engine import HeliosEngine
 
 
 class TestCalculateCAS:
@@ -55,3 +65,77 @@ class TestCalculateCAS:
         """Both features at zero produces zero CAS."""
         cas = calculate_cas({"AP": 0.0, "RS": 0.0})
         assert cas == pytest.approx(0.0)
+
+    @pytest.mark.parametrize(
+        ("ap", "rs"),
+        [(1.0, 1.0), (-1.5, -2.0), (2.0, None), (None, 2.0), (None, None), (7.3, -0.1)],
+    )
+    def test_fast_path_matches_dict(self, ap: float | None, rs: float | None) -> None:
+        """Positional CAS equals the dict version; NaN marks a missing feature."""
+        z_scores = {name: z for name, z in (("AP", ap), ("RS", rs)) if z is not None}
+        fast = calculate_cas_fast(
+            float("nan") if ap is None else ap, float("nan") if rs is None else rs
+        )
+        assert fast == calculate_cas(z_scores)
+
+    def test_batch_weights(self) -> None:
+        """Vectorized CAS applies the frozen 0.6/0.4 weights elementwise."""
+        cas = calculate_cas_batch(
+            np.array([1.0, 2.0, 0.0, -1.5]), np.array([1.0, 0.0, 2.0, -2.0])
+        )
+        np.testing.assert_allclose(cas, [1.0, 1.2, 0.8, -1.7])
+
+    def test_batch_nan_contributes_nothing(self) -> None:
+        """A NaN z-score drops that feature without rescaling the other."""
+        cas = calculate_cas_batch(np.array([2.0, np.nan, np.nan]), np.array([np.nan, 2.0, np.nan]))
+        expected = [calculate_cas({"AP": 2.0}), calculate_cas({"RS": 2.0}), 0.0]
+        np.testing.assert_array_equal(cas, expected)
+
+
+class TestHeliosEngine:
+    """Test the batched engine path against per-sector scoring."""
+
+    @staticmethod
+    def _engine() -> HeliosEngine:
+        """Engine with 10 days of XLK/XLF history (XLF: AP only)."""
+        engine = HeliosEngine(NormalizationPipeline(window=10, min_observations=5))
+        rng = np.random.default_rng(9)
+        for i in range(10):
+            d = date(2024, 1, 1) + timedelta(days=i)
+            engine.calculate_all({
+                "XLK": SectorFeatureSet(
+                    ticker="XLK",
+                    trade_date=d,
+                    net_flow=float(rng.normal(0, 1e6)),
+                    excess_return=float(rng.normal(0, 0.01)),
+                ),
+                "XLF": SectorFeatureSet(
+                    ticker="XLF", trade_date=d, net_flow=float(rng.normal(0, 1e6))
+                ),
+            })
+        return engine
+
+    def test_calculate_all_matches_calculate_sector(self) -> None:
+        """Vectorized scoring equals the per-sector chain, sector by sector."""
+        today = date(2024, 1, 15)
+        all_features = {
+            "XLK": SectorFeatureSet(
+                ticker="XLK", trade_date=today, net_flow=3e6, excess_return=-0.02
+            ),
+            "XLF": SectorFeatureSet(
+                ticker="XLF", trade_date=today, net_flow=-2e6, excess_return=0.01
+            ),
+            "XLE": SectorFeatureSet(ticker="XLE", trade_date=today, net_flow=1e6),
+        }
+
+        batched = self._engine().calculate_all(all_features)
+        per_sector = self._engine()
+        expected = tuple(per_sector.calculate_sector(f) for f in all_features.values())
+
+        assert batched.sectors == expected
+        assert batched.trade_date == today
+        assert [r.status.value for r in batched.sectors] == [
+            "COMPLETE",
+            "PARTIAL",
+            "INSUFFICIENT",
+        ]
@@ -0,0 +1,151 @@
+"""Tests for core result types."""
+
+from datetime import date
+
+from helios.core.types import (
+    AllocationState,
+    BaselineStatus,
+    HeliosResult,
+    SectorResult,
+    SectorResultArray,
+)
+
+
+def _results() -> list[SectorResult]:
+    """One sector per state, with mixed baseline statuses."""
+    return [
+        SectorResult(
+            ticker=ticker,
+            allocation_score=score,
+            state=AllocationState.from_cas(score),
+            explanation=f"{ticker} explanation",
+            ap_zscore=score * 0.5,
+            rs_zscore=-score,
+            ap_raw=score * 1e6,
+            rs_raw=score / 100,
+            status=status,
+        )
+        for ticker, score, status in [
+            ("XLK", 1.5, BaselineStatus.COMPLETE),
+            ("XLF", 0.5, BaselineStatus.COMPLETE),
+            ("XLE", 0.0, BaselineStatus.PARTIAL),
+            ("XLV", -0.5, BaselineStatus.COMPLETE),
+            ("XLU", -1.5, BaselineStatus.INSUFFICIENT),
+        ]
+    ]
+
+
+class TestStateFiltering:
+    """Test state codes and the state-filtered views built on them."""
+
+    def test_state_code_matches_enum(self) -> None:
+        """SectorResult.state_code is the code of its state."""
+        for result in _results():
+            assert result.state_code == result.state.code
+            assert AllocationState.from_code(result.state_code) == result.state
+
+    def test_overweight_and_underweight_sectors(self) -> None:
+        """State views pick sectors by code and keep input order."""
+        results = _results()
+        extra = SectorResult(
+            ticker="XLI",
+            allocation_score=2.0,
+            state=AllocationState.OVERWEIGHT,
+            explanation="",
+            ap_zscore=0.0,
+            rs_zscore=0.0,
+            ap_raw=0.0,
+            rs_raw=0.0,
+            status=BaselineStatus.COMPLETE,
+        )
+        result = HeliosResult(
+            trade_date=date(2024, 1, 2),
+            sectors=(*results, extra),
+            status=BaselineStatus.PARTIAL,
+        )
+
+        assert result.overweight_sectors == (results[0], extra)
+        assert result.underweight_sectors == (results[4],)
+
+    def test_indices_in_state(self) -> None:
+        """indices_in_state returns positions whose code matches the state."""
+        array = SectorResultArray.from_results(_results())
+
+        assert array.indices_in_state(AllocationState.OVERWEIGHT).tolist() == [0]
+        assert array.indices_in_state(AllocationState.NEUTRAL).tolist() == [2]
+        assert array.indices_in_state(AllocationState.UNDERWEIGHT).tolist() == [4]
+
+
+class TestSectorResultArray:
+    """Test the columnar SectorResult form."""
+
+    def test_round_trip(self) -> None:
+        """from_results followed by indexing gives back the original results."""
+        results = _results()
+        array = SectorResultArray.from_results(results)
+
+        assert len(array) == len(results)
+        assert [array[i] for i in range(len(array))] == results
+        assert list(array) == results
+
+    def test_empty(self) -> None:
+        """An empty sequence builds an empty, iterable array."""
+        array = SectorResultArray.from_results([])
+
+        assert len(array) == 0
+        assert list(array) == []
+
+
+class TestToDict:
+    """Test the cached dict output."""
+
+    def test_sector_result_mutation_does_not_leak(self) -> None:
+        """Mutating one to_dict result leaves later calls untouched."""
+        sector = _results()[0]
+        first = sector.to_dict()
+        first["state"] = "MUTATED"
+
+        assert sector.to_dict()["state"] == "OVERWEIGHT"
+
+    def test_helios_result_mutation_does_not_leak(self) -> None:
+        """Nested per-sector dicts are copied as well."""
+        result = HeliosResult(
+            trade_date=date(2024, 1, 2),
+            sectors=tuple(_results()),
+            status=BaselineStatus.PARTIAL,
+        )
+        first = result.to_dict()
+        first["XLK"]["state"] = "MUTATED"
+        first["date"] = "MUTATED"
+
+        second = result.to_dict()
+        assert second["XLK"]["state"] == "OVERWEIGHT"
+        assert second["date"] == "2024-01-02"
+
+
+class TestGetSector:
+    """Test ticker lookup on HeliosResult."""
+
+    def test_lookup(self) -> None:
+        """Known tickers resolve; the first duplicate wins; unknown gives None."""
+        results = _results()
+        duplicate = SectorResult(
+            ticker="XLK",
+            allocation_score=0.0,
+            state=AllocationState.NEUTRAL,
+            explanation="",
+            ap_zscore=0.0,
+            rs_zscore=0.0,
+            ap_raw=0.0,
+            rs_raw=0.0,
+            status=BaselineStatus.COMPLETE,
+        )
+        result = HeliosResult(
+            trade_date=date(2024, 1, 2),
+            sectors=(*results, duplicate),
+            status=BaselineStatus.PARTIAL,
+        )
+
+        assert result.get_sector("XLK") is results[0]
+        assert result.get_sector("XLU") is results[4]
+        assert result.get_sector("SPY") is None
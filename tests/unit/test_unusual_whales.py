@@ -0,0 +1,83 @@
+"""Tests for the Unusual Whales fund flow client."""
+
+from datetime import date
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+from helios.core.config import Settings
+from helios.ingest.unusual_whales import (
+    UnusualWhalesClient,
+    _rolling_hampel_kernel,
+    _rolling_hampel_numpy,
+)
+
+
+def _records(n: int = 20, spike_day: int = 10) -> list[dict]:
+    """Daily in/outflow records with one rebalancing spike."""
+    records = []
+    for day in range(1, n + 1):
+        value = 1_000_000.0 * (1 if day % 2 else -1) + day * 10_000
+        if day == spike_day:
+            value = 900_000_000.0
+        records.append({"date": f"2024-01-{day:02d}", "change_prem": str(value)})
+    return records
+
+
+class TestUnusualWhalesClient:
+    """Test UW flow cleanup."""
+
+    async def test_get_all_sector_flows_filters_outliers(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """get_all_sector_flows runs every ticker through the outlier filter."""
+        client = UnusualWhalesClient(Settings(polygon_key="x", data_dir=tmp_path))
+        calls: list[str] = []
+        original = client._filter_flow_outliers
+
+        async def fake_fetch(ticker: str) -> list[dict]:
+            return _records()
+
+        def spy(
+            dates: np.ndarray, values: np.ndarray, ticker: str
+        ) -> tuple[np.ndarray, np.ndarray]:
+            calls.append(ticker)
+            return original(dates, values, ticker)
+
+        monkeypatch.setattr(client, "get_etf_inflow_outflow", fake_fetch)
+        monkeypatch.setattr(client, "_filter_flow_outliers", spy)
+
+        results = await client.get_all_sector_flows(date(2024, 1, 1), date(2024, 1, 31))
+
+        assert sorted(calls) == sorted(results)
+        df = results["XLK"]
+        assert len(df) == 19
+        assert date(2024, 1, 10) not in set(df["date"])
+        assert df["date"].is_monotonic_increasing
+
+    def test_rolling_hampel_kernels_agree(self) -> None:
+        """The loop kernel and its vectorized fallback flag the same points."""
+        rng = np.random.default_rng(3)
+        x = rng.standard_t(3, size=300) * 1e6
+        x[[0, 150, 299]] = [5e8, -5e8, 5e8]
+
+        mask = _rolling_hampel_numpy(x, 11, 6.0)
+
+        np.testing.assert_array_equal(_rolling_hampel_kernel(x, 11, 6.0), mask)
+        assert mask[[0, 150, 299]].all()
+
+    def test_long_series_uses_rolling_window(self, tmp_path: Path) -> None:
+        """A spike that is only extreme locally is dropped from a long series."""
+        client = UnusualWhalesClient(Settings(polygon_key="x", data_dir=tmp_path))
+        n = 400
+        dates = np.arange("2023-01-01", n, dtype="datetime64[D]")
+        # Flows scale up 100x after the first 100 days; the spike is large
+        # only relative to that quiet stretch, so a global MAD would keep it
+        values = np.where(np.arange(n) < 100, 1e5, 1e7) * np.cos(np.arange(n))
+        values[50] = 5e6
+
+        kept_dates, kept_values = client._filter_flow_outliers(dates, values, "XLK")
+
+        assert len(kept_values) == n - 1
+        assert dates[50] not in kept_dates